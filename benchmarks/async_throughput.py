@@ -0,0 +1,87 @@
+"""
+### Rendimiento síncrono con hilos contra asíncrono
+Mide peticiones `search_read` por segundo con el mismo número de clientes
+concurrentes usando `Lylac` en un grupo de hilos y `AsyncLylac` en un solo
+ciclo de eventos. Requiere una base de datos configurada en el entorno y el
+extra `async` instalado.
+
+Uso:
+    python benchmarks/async_throughput.py --username admin --password 123456 --clients 500 --requests 5000
+
+Para una comparación justa, ajústese `LYLAC_DB_POOL_SIZE` y
+`LYLAC_DB_POOL_MAX_OVERFLOW` igual en ambas ejecuciones.
+"""
+from argparse import ArgumentParser
+from asyncio import Semaphore
+from asyncio import gather
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from lylac import AsyncLylac
+from lylac import Lylac
+
+def bench_sync(
+    lylac: Lylac,
+    session_uuid: str,
+    clients: int,
+    requests: int,
+) -> float:
+
+    # Inicialización de función de petición
+    def request(_: int) -> None:
+        lylac.search_read(session_uuid, 'base.users', [], ['login'], limit= 20)
+
+    with ThreadPoolExecutor(max_workers= clients) as executor:
+        # Medición de peticiones concurrentes
+        start = perf_counter()
+        list( executor.map(request, range(requests)) )
+        elapsed = perf_counter() - start
+
+    return requests / elapsed
+
+async def bench_async(
+    async_lylac: AsyncLylac,
+    session_uuid: str,
+    clients: int,
+    requests: int,
+) -> float:
+
+    # Limitación de peticiones en vuelo al número de clientes
+    semaphore = Semaphore(clients)
+
+    # Inicialización de función de petición
+    async def request() -> None:
+        async with semaphore:
+            await async_lylac.search_read(session_uuid, 'base.users', [], ['login'], limit= 20)
+
+    # Medición de peticiones concurrentes
+    start = perf_counter()
+    await gather( *( request() for _ in range(requests) ) )
+    elapsed = perf_counter() - start
+
+    return requests / elapsed
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description= 'Rendimiento de Lylac síncrono con hilos contra AsyncLylac.')
+    parser.add_argument('--username', required= True)
+    parser.add_argument('--password', required= True)
+    parser.add_argument('--clients', type= int, default= 500)
+    parser.add_argument('--requests', type= int, default= 5000)
+    args = parser.parse_args()
+
+    # Inicialización de las instancias
+    lylac = Lylac()
+    lylac.populate_if_first_initialization()
+    async_lylac = AsyncLylac(lylac)
+
+    # Inicio de sesión y calentamiento del caché de sesiones
+    session_uuid = lylac.login(args.username, args.password)
+    lylac.search_read(session_uuid, 'base.users', [], ['login'], limit= 20)
+
+    # Ejecución de ambas mediciones
+    sync_throughput = bench_sync(lylac, session_uuid, args.clients, args.requests)
+    async_throughput = run( bench_async(async_lylac, session_uuid, args.clients, args.requests) )
+
+    print(f'{args.clients} clientes, {args.requests} peticiones search_read')
+    print(f'{"síncrono (hilos)":>18} {sync_throughput:>10.1f} peticiones/s')
+    print(f'{"asíncrono":>18} {async_throughput:>10.1f} peticiones/s')
@@ -0,0 +1,65 @@
+"""
+### Salida por registros contra salida por columnas
+Mide filas por segundo y memoria pico por fila de `search_read` con
+`output='records'` y `output='columns'` sobre el mismo modelo y campos.
+Requiere una base de datos configurada en el entorno y el extra `columns`
+instalado.
+
+Uso:
+    python benchmarks/columnar_output.py --username admin --password 123456 --model base.users --fields id login active create_date --limit 200000
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from tracemalloc import get_traced_memory
+from tracemalloc import start
+from tracemalloc import stop
+from lylac import Lylac
+
+def bench_output(
+    lylac: Lylac,
+    session_uuid: str,
+    model_name: str,
+    fields: list[str],
+    limit: int,
+    output: str,
+) -> tuple[float, float]:
+
+    # Medición del tiempo de lectura
+    begin = perf_counter()
+    data = lylac.search_read(session_uuid, model_name, [], fields, limit= limit, output= output)
+    elapsed = perf_counter() - begin
+
+    # Obtención del número de filas leídas
+    rows = len(data) if output == 'records' else len( next( iter( data.values() ) ) )
+
+    # Medición de la memoria pico en una segunda lectura
+    start()
+    data = lylac.search_read(session_uuid, model_name, [], fields, limit= limit, output= output)
+    ( _, peak ) = get_traced_memory()
+    stop()
+
+    return ( rows / elapsed, peak / max(rows, 1) )
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description= 'Rendimiento de search_read por registros contra por columnas.')
+    parser.add_argument('--username', required= True)
+    parser.add_argument('--password', required= True)
+    parser.add_argument('--model', default= 'base.users')
+    parser.add_argument('--fields', nargs= '+', default= ['id', 'login', 'active', 'create_date'])
+    parser.add_argument('--limit', type= int, default= 200000)
+    args = parser.parse_args()
+
+    # Inicialización de la instancia
+    lylac = Lylac()
+    lylac.populate_if_first_initialization()
+
+    # Inicio de sesión y calentamiento del caché de sesiones
+    session_uuid = lylac.login(args.username, args.password)
+    lylac.search_read(session_uuid, args.model, [], args.fields, limit= 20)
+
+    print(f'{args.model}, {len(args.fields)} campos, hasta {args.limit} filas')
+
+    # Ejecución de ambas mediciones
+    for output in ('records', 'columns'):
+        ( throughput, bytes_per_row ) = bench_output(lylac, session_uuid, args.model, args.fields, args.limit, output)
+        print(f'{output:>8} {throughput:>12.1f} filas/s {bytes_per_row:>10.1f} bytes/fila')
@@ -0,0 +1,128 @@
+"""
+### Rendimiento de inicio de sesión
+Mide inicios de sesión por segundo conforme aumenta el número de trabajadores
+que verifican contraseñas.
+
+Por defecto sólo se mide la etapa de verificación de hash. Si se proporcionan
+`--username` y `--password` se mide `Lylac.login` de extremo a extremo contra
+la base de datos configurada en el entorno; en ese caso el tamaño del grupo se
+toma de `LYLAC_PASSWORD_POOL_SIZE`, por lo que debe ejecutarse una vez por
+tamaño a comparar.
+
+Uso:
+    python benchmarks/login_throughput.py --logins 200 --kind thread
+    LYLAC_PASSWORD_POOL_SIZE=4 python benchmarks/login_throughput.py --username admin --password 123456
+"""
+from argparse import ArgumentParser
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from time import perf_counter
+from lylac.security import hash_password
+from lylac.security import verify_password
+
+def _workers_sequence(
+    max_workers: int,
+) -> list[int]:
+
+    # Inicialización de la secuencia en potencias de dos
+    sequence: list[int] = []
+    workers = 1
+    while workers < max_workers:
+        sequence.append(workers)
+        workers *= 2
+
+    # Se añade el máximo de trabajadores
+    sequence.append(max_workers)
+
+    return sequence
+
+def _create_executor(
+    kind: str,
+    workers: int,
+) -> Executor:
+
+    # Si el grupo es de procesos...
+    if kind == 'process':
+        return ProcessPoolExecutor(max_workers= workers)
+
+    return ThreadPoolExecutor(max_workers= workers)
+
+def bench_verification(
+    logins: int,
+    kind: str,
+    max_workers: int,
+) -> None:
+
+    # Construcción de un hash de referencia
+    hashed_password = hash_password('benchmark-password')
+
+    print(f'Verificación bcrypt_sha256 ({kind}), {logins} inicios de sesión')
+    print(f'{"trabajadores":>12} {"inicios/s":>12} {"aceleración":>12}')
+
+    # Inicialización de referencia de un solo trabajador
+    baseline: float | None = None
+
+    # Iteración por cada tamaño de grupo
+    for workers in _workers_sequence(max_workers):
+        with _create_executor(kind, workers) as executor:
+            # Calentamiento de los trabajadores
+            list( executor.map(verify_password, ['benchmark-password'] * workers, [hashed_password] * workers) )
+
+            # Medición de la verificación concurrente
+            start = perf_counter()
+            results = list( executor.map(verify_password, ['benchmark-password'] * logins, [hashed_password] * logins) )
+            elapsed = perf_counter() - start
+
+        # Comprobación de las verificaciones
+        assert all(results)
+
+        # Cálculo del rendimiento
+        throughput = logins / elapsed
+        if baseline is None:
+            baseline = throughput
+
+        print(f'{workers:>12} {throughput:>12.1f} {throughput / baseline:>11.2f}x')
+
+def bench_login(
+    logins: int,
+    max_workers: int,
+    username: str,
+    password: str,
+) -> None:
+
+    # Importación diferida para no requerir base de datos en la medición de hash
+    from lylac import Lylac
+
+    # Inicialización de la instancia
+    lylac = Lylac()
+    lylac.populate_if_first_initialization()
+
+    print(f'Lylac.login de extremo a extremo, {logins} inicios de sesión')
+    print(f'{"clientes":>12} {"inicios/s":>12}')
+
+    # Iteración por cada número de clientes concurrentes
+    for clients in _workers_sequence(max_workers):
+        with ThreadPoolExecutor(max_workers= clients) as executor:
+            # Medición de inicios de sesión concurrentes
+            start = perf_counter()
+            list( executor.map(lambda _: lylac.login(username, password), range(logins)) )
+            elapsed = perf_counter() - start
+
+        print(f'{clients:>12} {logins / elapsed:>12.1f}')
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description= 'Rendimiento de inicio de sesión por número de trabajadores.')
+    parser.add_argument('--logins', type= int, default= 200)
+    parser.add_argument('--kind', choices= ['thread', 'process'], default= 'thread')
+    parser.add_argument('--max-workers', type= int, default= cpu_count() or 1)
+    parser.add_argument('--username')
+    parser.add_argument('--password')
+    args = parser.parse_args()
+
+    # Si se proporcionaron credenciales...
+    if args.username and args.password:
+        bench_login(args.logins, args.max_workers, args.username, args.password)
+    else:
+        bench_verification(args.logins, args.kind, args.max_workers)
@@ -5,3 +5,16 @@ from ._typing.definitions import Nullable
 from ._typing.definitions import Preset
 from ._typing.definitions import Template
 from ._typing.definitions import TType
+
+def __getattr__(
+    name: str,
+) -> type:
+
+    # Si se solicita la interfaz asíncrona...
+    if name == 'AsyncLylac':
+        # Importación diferida para no requerir el extra asíncrono al importar el paquete
+        from ._async_main import AsyncLylac
+
+        return AsyncLylac
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
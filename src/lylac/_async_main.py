@@ -0,0 +1,387 @@
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Literal
+from typing import Optional
+from typing import Union
+from uuid import uuid4
+from ._constants import ERROR_LABEL
+from ._contexts import ExecutionContext as _ExecutionContext
+from ._main import Lylac
+from ._resources import Page
+from ._resources import PoolStats
+from ._services.async_connection_service import AsyncConnectionService
+from ._typing.generics import ItemOrList
+from ._typing.generics import ModelName
+from ._typing.generics import _Columns
+from ._typing.generics import _Record
+from ._typing.literals import AggFuncName
+from ._typing.literals import OutputMode
+from ._typing.structures import CriteriaStructure
+from ._typing.structures import RecordData
+from ._typing.structures import FieldReadDeclaration
+from ._typing.type_parameters import _M
+from ._typing.type_parameters import _T
+from .errors import IncorrectPasswordError
+from .security import verify_password_async
+
+class AsyncLylac(Generic[_M]):
+    """
+    ### Lylac asíncrono
+    Fachada de corrutinas sobre una instancia de `Lylac` ya inicializada. Las
+    transacciones se ejecutan en el motor asíncrono de SQLAlchemy reutilizando
+    el mismo orquestador CRUD, contextos y constructores de sentencias, por lo
+    que el comportamiento es idéntico al de la API síncrona.
+
+    Requiere `asyncpg`:
+    >>> lylac = Lylac()
+    >>> async_lylac = AsyncLylac(lylac)
+    >>> session_uuid = await async_lylac.login('admin', '123456')
+    """
+
+    def __init__(
+        self,
+        lylac: Lylac[_M],
+    ) -> None:
+
+        # Asignación de la instancia síncrona que porta metadatos, motores y cachés
+        self._lylac = lylac
+        # Inicialización de instancia de servicio de conexión asíncrono
+        self._connection = AsyncConnectionService()
+
+    @property
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+
+        # Obtención del estado del grupo de conexiones asíncrono
+        stats = self._connection.pool_stats
+
+        return stats
+
+    async def login(
+        self,
+        username: str,
+        password: str,
+    ) -> str:
+
+        # Obtención de los datos del usuario liberando la conexión al terminar
+        user_data = await self._connection.execute_complex(lambda conn: self._lylac._find_login_user(username, conn))
+
+        # Verificación de la contraseña sin bloquear el ciclo de eventos
+        is_pwd_correct = await verify_password_async(password, user_data['password'])
+
+        # Si la contraseña no es correcta...
+        if not is_pwd_correct:
+            # Se arroja error de contraseña incorrecta
+            raise IncorrectPasswordError(ERROR_LABEL.INCORRECT_PASSWORD)
+
+        # Creación de UUID de sesión
+        session_uuid = uuid4().__str__()
+
+        # Ejecución de la transacción de creación de sesión
+        await self._connection.execute_complex(lambda conn: self._lylac._create_session(user_data['id'], session_uuid, conn))
+
+        # Obtención de la credencial a entregar al usuario
+        credential = self._lylac._issue_session(user_data['id'], session_uuid)
+        # Las lecturas siguientes se dirigen a la base de datos principal hasta que la sesión se replique
+        self._lylac.pin_to_primary(credential)
+
+        return credential
+
+    async def execute_transaction(
+        self,
+        session_uuid: str,
+        callback: Callable[[_ExecutionContext[_M]], _T],
+        read_only: bool = False,
+    ) -> _T:
+
+        # Se usa una réplica de lectura sólo si la sesión no escribió recientemente
+        use_replica = read_only and not self._lylac._is_pinned_to_primary(session_uuid)
+
+        # Construcción de la función de transacción
+        wrapped_transaction = self._lylac._wrap_transaction(session_uuid, callback, use_replica)
+
+        # Ejecución de la función de transacción
+        result = await self._connection.execute_complex(wrapped_transaction, use_replica)
+
+        # Si la transacción pudo haber escrito datos...
+        if not read_only:
+            # Las lecturas siguientes de la sesión se dirigen a la base de datos principal
+            self._lylac.pin_to_primary(session_uuid)
+
+        return result
+
+    async def action(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        name: str,
+        record_id: int,
+    ) -> Literal[True]:
+
+        # Ejecución de la transacción
+        result = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._actions.execute(execution_ctx, model_name, name, record_id),
+        )
+
+        return result
+
+    async def task(
+        self,
+        session_uuid: str,
+        name: str,
+    ) -> Literal[True]:
+
+        # Ejecución de la transacción
+        result = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._server_tasks.execute(execution_ctx, name),
+        )
+
+        return result
+
+    async def create(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        data: ItemOrList[RecordData],
+    ) -> list[int]:
+
+        # Ejecución de la transacción
+        created_ids = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.create(execution_ctx, model_name, data),
+        )
+
+        return created_ids
+
+    async def upsert(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        data: ItemOrList[dict],
+        conflict_fields: list[str],
+        update_fields: Optional[list[str]] = None,
+    ) -> list[int]:
+
+        # Ejecución de la transacción
+        record_ids = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.upsert(execution_ctx, model_name, data, conflict_fields, update_fields),
+        )
+
+        return record_ids
+
+    async def search(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> list[int]:
+
+        # Ejecución de la transacción
+        found_ids = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.search(execution_ctx, model_name, search_criteria, offset, limit, sortby, ascending, after),
+            read_only= True,
+        )
+
+        return found_ids
+
+    async def search_page(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[int]:
+
+        # Ejecución de la transacción
+        page = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.search_page(execution_ctx, model_name, search_criteria, limit, sortby, ascending, after),
+            read_only= True,
+        )
+
+        return page
+
+    async def read(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        record_ids: ItemOrList[int],
+        fields: list[FieldReadDeclaration] = [],
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+    ) -> list[_Record]:
+
+        # Ejecución de la transacción
+        data = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.read(execution_ctx, model_name, record_ids, fields, sortby, ascending),
+            read_only= True,
+        )
+
+        return data
+
+    async def search_read(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FieldReadDeclaration] = [],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+        with_count: bool = False,
+        count_limit: Optional[int] = None,
+        output: OutputMode = 'records',
+    ) -> Union[ list[_Record], _Columns, tuple[Union[ list[_Record], _Columns ], int] ]:
+
+        # Ejecución de la transacción
+        data = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.search_read(
+                execution_ctx,
+                model_name,
+                search_criteria,
+                fields,
+                offset,
+                limit,
+                sortby,
+                ascending,
+                after,
+                with_count,
+                count_limit,
+                output,
+            ),
+            read_only= True,
+        )
+
+        return data
+
+    async def search_read_page(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FieldReadDeclaration] = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[_Record]:
+
+        # Ejecución de la transacción
+        page = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.search_read_page(
+                execution_ctx,
+                model_name,
+                search_criteria,
+                fields,
+                limit,
+                sortby,
+                ascending,
+                after,
+            ),
+            read_only= True,
+        )
+
+        return page
+
+    async def search_count(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+    ) -> int:
+
+        # Ejecución de la transacción
+        count = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.search_count(execution_ctx, model_name, search_criteria),
+            read_only= True,
+        )
+
+        return count
+
+    async def read_group(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        groupby: ItemOrList[str] = [],
+        aggregates: dict[str, AggFuncName] = {},
+        having: list[tuple[str, str, Any]] = [],
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[_Record]:
+
+        # Ejecución de la transacción
+        groups = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.read_group(execution_ctx, model_name, search_criteria, groupby, aggregates, having, sortby, ascending, limit),
+            read_only= True,
+        )
+
+        return groups
+
+    async def update(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        record_ids: ItemOrList[int],
+        data: dict,
+    ) -> Literal[True]:
+
+        # Ejecución de la transacción
+        result = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.update(execution_ctx, model_name, record_ids, data),
+        )
+
+        return result
+
+    async def update_many(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        data_per_id: dict[int, dict],
+    ) -> Literal[True]:
+
+        # Ejecución de la transacción
+        result = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.update_many(execution_ctx, model_name, data_per_id),
+        )
+
+        return result
+
+    async def delete(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        record_ids: ItemOrList[int],
+    ) -> Literal[True]:
+
+        # Ejecución de la transacción
+        result = await self.execute_transaction(
+            session_uuid,
+            lambda execution_ctx: self._lylac._crud.delete(execution_ctx, model_name, record_ids),
+        )
+
+        return result
@@ -1,5 +1,6 @@
 from ._labels import ERROR_LABEL
 from ._names import (
+    ACCESS_CONTROL_MODELS,
     DATA_RESOURCE,
     FIELD_NAME,
     MODEL_NAME,
@@ -8,6 +9,7 @@ from ._names import (
     INITIAL_PACKAGES,
     PACKAGE,
     PRESET,
+    RECORD_RULES_MODELS,
     RELATION_ACTIONS,
     RELATION_ACTION_NAME,
     STATIC_FIELDS,
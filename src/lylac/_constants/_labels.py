@@ -1,6 +1,12 @@
 class ERROR_LABEL:
     MALFORMED_FIELD_DECLARATION = 'Formato inválido en declaración de campo.'
     MALFORMED_SEARCH_CRITERIA = 'Estructura de criterio de búsqueda mal formada.'
+    UNKNOWN_COLUMN = 'El campo no existe como columna en la tabla del modelo.'
+    UNKNOWN_GROUP_KEY = 'La llave no corresponde a un campo de agrupación ni a una agregación.'
+    UNKNOWN_AGGREGATE_KEY = 'La llave no corresponde a una agregación.'
+    INVALID_AGGREGATE_FUNCTION = 'Función de agregación no válida.'
+    INVALID_DATE_GRANULARITY = 'Granularidad de fecha no válida.'
+    INVALID_HAVING_OPERATOR = 'Operador de comparación no válido en condición sobre agregaciones.'
     MANUAL_AUTOMATION = 'No puedes ejecutar manualmente funciones registradas como automatizaciones.'
     MANUAL_VALIDATION = 'No puedes ejecutar manualmente funciones registradas como validationes.'
     MANUAL_ACTION = 'No puedes ejecutar manualmente funciones registradas como validaciones.'
@@ -109,6 +109,27 @@ FACTORY_MODELS = [
 Modelos predeterminados.
 """
 
+ACCESS_CONTROL_MODELS = [
+    MODEL_NAME.BASE_USERS,
+    MODEL_NAME.BASE_USERS_ROLE,
+    MODEL_NAME.BASE_USER_GROUPS,
+    MODEL_NAME.BASE_USER_ACCESS,
+    MODEL_NAME.BASE_MODEL,
+]
+"""
+Modelos que determinan los permisos de acceso de los usuarios. Escribir en
+ellos invalida las decisiones de acceso en caché.
+"""
+
+RECORD_RULES_MODELS = [
+    *ACCESS_CONTROL_MODELS,
+    MODEL_NAME.BASE_RULES,
+]
+"""
+Modelos que determinan las reglas de registro de los usuarios. Escribir en
+ellos invalida las reglas de registro en caché.
+"""
+
 FACTORY_FIELDS = [
     FIELD_NAME.ID,
     FIELD_NAME.NAME,
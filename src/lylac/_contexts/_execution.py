@@ -3,10 +3,12 @@ from typing import Generic
 from typing import TYPE_CHECKING
 from sqlalchemy.engine import Connection
 from .._contexts.engines import BaseContext
+from .._resources import Authorization
 from .._resources import DatabaseMetadata
 from .._resources import ModelDataIndex
 from .._resources import ModelsBearer
 from .._resources import UserEnv
+from .._typing.literals import CRUDPermission
 from .._typing.type_parameters import _M
 
 if TYPE_CHECKING:
@@ -20,6 +22,7 @@ if TYPE_CHECKING:
 
 class ExecutionContext(Generic[_M], BaseContext[_M]):
     _to_execute_after_commit: list[Callable[[ExecutionContext[_M]], None]]
+    _authorizations: dict[tuple[str, CRUDPermission], Authorization]
 
     def __init__(
         self,
@@ -36,6 +39,7 @@ class ExecutionContext(Generic[_M], BaseContext[_M]):
         actions: 'ActionEngine[_M]',
         server_tasks: 'ServerTasksEngine[_M]',
         user_env_engine: UserEnv[_M],
+        shares_caches: bool = True,
     ) -> None:
 
         # Inicialización de entorno de usuario
@@ -59,6 +63,10 @@ class ExecutionContext(Generic[_M], BaseContext[_M]):
 
         # Inicialización de lista de funciones a ejecutar después del commit
         self._to_execute_after_commit = []
+        # Inicialización de autorizaciones resueltas durante la ejecución
+        self._authorizations = {}
+        # Indicador de si los valores resueltos pueden guardarse en los cachés compartidos del proceso
+        self.shares_caches = shares_caches
 
     @property
     def uid(
@@ -99,6 +107,34 @@ class ExecutionContext(Generic[_M], BaseContext[_M]):
             # Se usa ésta como valor de ID de usuario
             return uid
 
+    def get_authorization(
+        self,
+        model_name: str,
+        permission: CRUDPermission,
+    ) -> Authorization | None:
+
+        # Obtención de la autorización resuelta previamente en la ejecución
+        authorization = self._authorizations.get(( model_name, permission ))
+
+        return authorization
+
+    def store_authorization(
+        self,
+        model_name: str,
+        permission: CRUDPermission,
+        authorization: Authorization,
+    ) -> None:
+
+        # Se guarda la autorización para el resto de la ejecución
+        self._authorizations[( model_name, permission )] = authorization
+
+    def clear_authorizations(
+        self,
+    ) -> None:
+
+        # Se descartan las autorizaciones resueltas en la ejecución
+        self._authorizations.clear()
+
     def run_after_commit(
         self,
         fn: Callable[[ExecutionContext[_M]], None],
@@ -4,10 +4,15 @@ from typing import Generic
 from typing import Literal
 from typing import TypedDict
 from typing import TYPE_CHECKING
-from sqlalchemy import and_
+from sqlalchemy import any_
 from sqlalchemy import delete
-from sqlalchemy import insert
+from sqlalchemy import func
+from sqlalchemy import literal
 from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy import ARRAY
+from sqlalchemy import Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import aliased
 from .._constants import FIELD_NAME
 from .._constants import RELATION_ACTIONS
@@ -15,8 +20,6 @@ from .._constants import RELATION_ACTION_NAME
 from .._core import Metadata
 from .._resources import ModelsBearer
 from .._typing.callables import CaptureCreatedRecordID
-from .._typing.callables import CaptureRecordID
-from .._typing.callables import CRUD_Operation
 from .._typing.generics import ItemOrList
 from .._typing.generics import ModelName
 from .._typing.interfaces import Many2ManyRelation
@@ -41,13 +44,12 @@ class _FieldMetadata(TypedDict, Generic[_M]):
 
 class _BaseRelation_CRUD(Generic[_M]):
     _model_name: ModelName[_M]
-    _commands_map: dict[RelationActionName, Callable[[ExecutionContext[_M], Any], CaptureRecordID[_M]]]
+    _commands_map: dict[RelationActionName, Callable[[ExecutionContext[_M], CRUD[_M], list[tuple[int, Any]]], None]]
 
     def capture_commands_for_field(
         self,
-        execution_ctx: ExecutionContext[_M],
         relation_commands: RelationCommands,
-        capture_id_functions: list[CaptureRecordID],
+        capture_id_functions: list[CaptureCreatedRecordID],
     ) -> None:
 
         # Iteración por cada nombre de acción de relación
@@ -57,100 +59,155 @@ class _BaseRelation_CRUD(Generic[_M]):
                 # Obtención del comando
                 data = relation_commands[action_name]
                 # Se crea la función de captura de ID
-                capture_id = self._commands_map[action_name](execution_ctx, data)
+                capture_id = self._build_capture(action_name, data)
                 # Se añade la función a la lista de funciones de captura de ID
                 capture_id_functions.append(capture_id)
 
-    def _build_update(
+    def run_pending_commands(
         self,
         execution_ctx: ExecutionContext[_M],
-        update_data: ItemOrList[tuple[RecordIDs, RecordData]],
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        update_data = to_list(update_data)
-
-        def update_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            def crud_operation(crud: CRUD[_M]) -> None:
-                # Iteración por cada tupla de datos
-                for ( record_ids, records_data ) in update_data:
-                    # Modificación
-                    crud.update(
-                        execution_ctx,
-                        self._model_name,
-                        record_ids,
-                        records_data
-                    )
+        crud: CRUD[_M],
+    ) -> None:
+
+        # Iteración por cada nombre de acción de relación en el orden establecido
+        for action_name in RELATION_ACTIONS:
+            # Obtención de los comandos pendientes de todos los registros
+            commands = self._pending_commands.pop(action_name, None)
+            # Si existen comandos pendientes...
+            if commands:
+                # Ejecución de la acción en conjunto
+                self._commands_map[action_name](execution_ctx, crud, commands)
+
+    def _build_capture(
+        self,
+        action_name: RelationActionName,
+        data: Any,
+    ) -> CaptureCreatedRecordID:
 
-            return crud_operation
+        def capture_id(created_or_updated_id: int) -> None:
+            # Se acumula el comando junto con la ID del registro propietario
+            self._pending_commands.setdefault(action_name, []).append(( created_or_updated_id, data ))
 
-        return update_records
+        return capture_id
 
-    def _build_delete(
+    def _run_update(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
-
-        def delete_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            crud_operation: CRUD_Operation[_M] = lambda crud: crud.delete(
-                execution_ctx,
-                self._model_name,
-                record_ids,
-            )
+        crud: CRUD[_M],
+        commands: list[tuple[int, ItemOrList[tuple[RecordIDs, RecordData]]]],
+    ) -> None:
 
-            return crud_operation
+        # Inicialización de datos a modificar por ID de registro
+        data_per_id: dict[int, RecordData] = {}
 
-        return delete_records
+        # Iteración por cada comando de cada registro propietario
+        for ( _, update_data ) in commands:
+            # Iteración por cada tupla de datos
+            for ( record_ids, records_data ) in to_list(update_data):
+                # Iteración por cada ID de registro
+                for record_id in to_list(record_ids):
+                    # Se combinan los datos respetando el orden de los comandos
+                    data_per_id[record_id] = { **data_per_id.get(record_id, {}), **records_data }
+
+        # Si no hay registros a modificar...
+        if not data_per_id:
+            # Se termina la ejecución
+            return
+
+        # Modificación de todos los registros
+        crud.update_many(
+            execution_ctx,
+            self._model_name,
+            data_per_id,
+        )
 
-    def _build_create(
+    def _run_delete(
         self,
         execution_ctx: ExecutionContext[_M],
-        records_data: ItemOrList[RecordData],
-    ) -> CaptureRecordID[_M]:
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
+
+        # Obtención de las IDs a eliminar
+        record_ids = self._collect_ids(commands)
+
+        # Si no hay registros a eliminar...
+        if not record_ids:
+            # Se termina la ejecución
+            return
+
+        # Eliminación de todos los registros
+        crud.delete(
+            execution_ctx,
+            self._model_name,
+            record_ids,
+        )
+
+    def _run_create(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        crud: CRUD[_M],
+        commands: list[tuple[int, ItemOrList[RecordData]]],
+    ) -> None:
         ...
-    def _build_add(
+    def _run_add(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
         ...
-    def _build_unlink(
+    def _run_unlink(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
         ...
-    def _build_replace(
+    def _run_replace(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
         ...
-    def _build_clear(
+    def _run_clear(
         self,
         execution_ctx: ExecutionContext[_M],
-        _: Literal[True] = True,
-    ) -> CaptureRecordID[_M]:
+        crud: CRUD[_M],
+        commands: list[tuple[int, Literal[True]]],
+    ) -> None:
         ...
 
+    def _collect_ids(
+        self,
+        commands: list[tuple[int, RecordIDs]],
+    ) -> list[int]:
+
+        # Obtención de las IDs de todos los comandos sin duplicados y en orden
+        record_ids = list({
+            record_id: None
+            for ( _, command_record_ids ) in commands
+            for record_id in to_list(command_record_ids)
+        })
+
+        return record_ids
+
     def _initialize_build_commands_map(
         self,
     ) -> None:
 
+        # Inicialización de comandos pendientes por acción
+        self._pending_commands: dict[RelationActionName, list[tuple[int, Any]]] = {}
+
         self._commands_map = {
-            RELATION_ACTION_NAME.CREATE: self._build_create,
-            RELATION_ACTION_NAME.ADD: self._build_add,
-            RELATION_ACTION_NAME.UPDATE: self._build_update,
-            RELATION_ACTION_NAME.UNLINK: self._build_unlink,
-            RELATION_ACTION_NAME.CLEAR: self._build_clear,
-            RELATION_ACTION_NAME.REPLACE: self._build_replace,
-            RELATION_ACTION_NAME.DELETE: self._build_delete,
+            RELATION_ACTION_NAME.CREATE: self._run_create,
+            RELATION_ACTION_NAME.ADD: self._run_add,
+            RELATION_ACTION_NAME.UPDATE: self._run_update,
+            RELATION_ACTION_NAME.UNLINK: self._run_unlink,
+            RELATION_ACTION_NAME.CLEAR: self._run_clear,
+            RELATION_ACTION_NAME.REPLACE: self._run_replace,
+            RELATION_ACTION_NAME.DELETE: self._run_delete,
         }
 
 class _Many2One_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
@@ -168,143 +225,124 @@ class _Many2One_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
         # Inicialización de mapa de constructor de comandos de acciones de relación
         self._initialize_build_commands_map()
 
-    def _build_create(
+    def _run_create(
         self,
         execution_ctx: ExecutionContext[_M],
-        records_data: ItemOrList[RecordData],
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        records_data = to_list(records_data)
-
-        def create_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Iteración por cada registro
-            for record_data in records_data:
-                # Se añade la ID en el campo correspondiente
-                record_data[self._m2o_field_name] = created_or_updated_id
-
-            # Creación de función de operación CRUD
-            crud_operation: CRUD_Operation[_M] = lambda crud: crud.create(
-                execution_ctx,
-                self._model_name,
-                records_data,
-            )
+        crud: CRUD[_M],
+        commands: list[tuple[int, ItemOrList[RecordData]]],
+    ) -> None:
 
-            return crud_operation
+        # Obtención de los datos de todos los registros con la ID del registro propietario en el campo correspondiente
+        records_data = [
+            { **record_data, self._m2o_field_name: created_or_updated_id }
+            for ( created_or_updated_id, command_records_data ) in commands
+            for record_data in to_list(command_records_data)
+        ]
 
-        return create_records
+        # Creación de todos los registros
+        crud.create(
+            execution_ctx,
+            self._model_name,
+            records_data,
+        )
 
-    def _build_add(
+    def _run_add(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
 
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
+        # Modificación del campo de todos los registros en conjunto
+        self._link(execution_ctx, crud, commands)
 
-        def add_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            def crud_operation(crud: CRUD[_M]):
-                # Iteración por cada ID de registro
-                for record_id in record_ids:
-                    # Modificación del campo
-                    crud.update(
-                        execution_ctx,
-                        self._model_name,
-                        record_id,
-                        {self._m2o_field_name: created_or_updated_id}
-                    )
+    def _run_unlink(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
+
+        # Obtención de las IDs a desvincular
+        record_ids = self._collect_ids(commands)
 
-            return crud_operation
+        # Si no hay registros a desvincular...
+        if not record_ids:
+            # Se termina la ejecución
+            return
 
-        return add_records
+        # Se establecen los registros a None
+        crud.update(
+            execution_ctx,
+            self._model_name,
+            record_ids,
+            {self._m2o_field_name: None},
+        )
 
-    def _build_unlink(
+    def _run_replace(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
-
-        def unlink_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            crud_operation: CRUD_Operation[_M] = lambda crud: crud.update(
-                execution_ctx,
-                self._model_name,
-                record_ids,
-                {self._m2o_field_name: None},
-            )
-
-            return crud_operation
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
 
-        return unlink_records
+        # Se establecen los registros existentes de todos los registros propietarios a None
+        self._run_clear(execution_ctx, crud, commands)
+        # Se establecen los nuevos registros
+        self._link(execution_ctx, crud, commands)
 
-    def _build_replace(
+    def _run_clear(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
-
-        def replace_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            def crud_operation(crud: CRUD[_M]) -> None:
-                # Búsqueda de IDs a reemplazar
-                old_record_ids = crud.search(
-                    execution_ctx,
-                    self._model_name,
-                    [(self._m2o_field_name, '=', created_or_updated_id)]
-                )
-                # Se establecen los registros existentes a None
-                crud.update(
-                    execution_ctx,
-                    self._model_name,
-                    old_record_ids,
-                    {self._m2o_field_name: None}
-                )
-                # Se establecen los nuevos registros
-                crud.update(
-                    execution_ctx,
-                    self._model_name,
-                    record_ids,
-                    {self._m2o_field_name: created_or_updated_id}
-                )
+        crud: CRUD[_M],
+        commands: list[tuple[int, Any]],
+    ) -> None:
 
-            return crud_operation
+        # Búsqueda de IDs a limpiar de todos los registros propietarios
+        records_to_clear = crud.search(
+            execution_ctx,
+            self._model_name,
+            [(self._m2o_field_name, 'in', [ created_or_updated_id for ( created_or_updated_id, _ ) in commands ])]
+        )
 
-        return replace_records
+        # Si no hay registros a limpiar...
+        if not records_to_clear:
+            # Se termina la ejecución
+            return
+
+        # Se establecen los registros a None
+        crud.update(
+            execution_ctx,
+            self._model_name,
+            records_to_clear,
+            {self._m2o_field_name: None}
+        )
 
-    def _build_clear(
+    def _link(
         self,
         execution_ctx: ExecutionContext[_M],
-        _: Literal[True] = True,
-    ) -> CaptureRecordID[_M]:
-
-        def clear_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            def crud_operation(crud: CRUD[_M]) -> None:
-                # Búsqueda de IDs a limpiar
-                records_to_clear = crud.search(
-                    execution_ctx,
-                    self._model_name,
-                    [(self._m2o_field_name, '=', created_or_updated_id)]
-                )
-                # Se establecen los registros a None
-                crud.update(
-                    execution_ctx,
-                    self._model_name,
-                    records_to_clear,
-                    {self._m2o_field_name: None}
-                )
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
 
-            return crud_operation
+        # Construcción del valor del campo por cada ID de registro
+        data_per_id: dict[int, RecordData] = {
+            record_id: {self._m2o_field_name: created_or_updated_id}
+            for ( created_or_updated_id, record_ids ) in commands
+            for record_id in to_list(record_ids)
+        }
 
-        return clear_records
+        # Si no hay registros a modificar...
+        if not data_per_id:
+            # Se termina la ejecución
+            return
+
+        # Modificación del campo de todos los registros en una sola sentencia
+        crud.update_many(
+            execution_ctx,
+            self._model_name,
+            data_per_id,
+        )
 
 class _Many2Many_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
 
@@ -321,134 +359,148 @@ class _Many2Many_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
         # Inicialización de mapa de constructor de comandos de acciones de relación
         self._initialize_build_commands_map()
 
-    def _build_create(
+    def _run_create(
         self,
         execution_ctx: ExecutionContext[_M],
-        records_data: ItemOrList[RecordData],
-    ) -> CaptureRecordID[_M]:
-
-        def create_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Creación de función de operación CRUD
-            crud_operation: CRUD_Operation[_M] = lambda crud: crud.create(
-                execution_ctx,
-                self._model_name,
-                records_data,
-            )
-            # Creación de función envuelta para captura de IDs creadas
-            def wrapped_create_records(crud: CRUD[_M]):
-                # Ejecución de la operación y captura de IDs de registros creados
-                created_ids = crud_operation(crud)
-                # Creación de las relaciones en el modelo de relación
-                self._create_relations(created_or_updated_id, created_ids, execution_ctx)
+        crud: CRUD[_M],
+        commands: list[tuple[int, ItemOrList[RecordData]]],
+    ) -> None:
+
+        # Se asegura el formato en lista de los datos de cada comando
+        commands = [ ( created_or_updated_id, to_list(records_data) ) for ( created_or_updated_id, records_data ) in commands ]
 
-            return wrapped_create_records
+        # Creación de todos los registros y obtención de las IDs creadas en el orden de entrada
+        created_ids = crud.create(
+            execution_ctx,
+            self._model_name,
+            [ record_data for ( _, records_data ) in commands for record_data in records_data ],
+        )
 
-        return create_records
+        # Inicialización de iterador de IDs creadas
+        created_ids_iterator = iter(created_ids)
 
-    def _build_add(
+        # Construcción de las relaciones de cada registro propietario con sus registros creados
+        relations = [
+            ( created_or_updated_id, next(created_ids_iterator) )
+            for ( created_or_updated_id, records_data ) in commands
+            for _ in records_data
+        ]
+
+        # Creación de las relaciones en el modelo de relación
+        self._create_relations(relations, execution_ctx)
+
+    def _run_add(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
-
-        def add_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Creación de función de operación CRUD
-            crud_operation: CRUD_Operation[_M] = lambda _: self._create_relations(
-                created_or_updated_id,
-                record_ids,
-                execution_ctx,
-            )
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
 
-            return crud_operation
+        # Creación de las relaciones de todos los registros propietarios
+        self._create_relations(self._build_relations(commands), execution_ctx)
 
-        return add_records
+    def _run_unlink(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
 
-    def _build_unlink(
+        # Eliminación de las relaciones de todos los registros propietarios
+        self._delete_relations(self._build_relations(commands), execution_ctx)
+
+    def _run_replace(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
-
-        def unlink_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Creación de función de operación CRUD
-            crud_operation: CRUD_Operation[_M] = lambda _: self._delete_relations(
-                created_or_updated_id,
-                record_ids,
-                execution_ctx,
-            )
+        crud: CRUD[_M],
+        commands: list[tuple[int, RecordIDs]],
+    ) -> None:
+
+        # Obtención de las IDs de los registros propietarios
+        x = [ created_or_updated_id for ( created_or_updated_id, _ ) in commands ]
+        # Obtención de las relaciones solicitadas
+        requested_relations = set( self._build_relations(commands) )
 
-            return crud_operation
+        # Obtención de las relaciones existentes de todos los registros propietarios en una sola consulta
+        current_relations = self._read_relations(x, execution_ctx)
 
-        return unlink_records
+        # Eliminación únicamente de las relaciones que dejan de existir
+        self._delete_relations(list( current_relations - requested_relations ), execution_ctx)
+        # Creación únicamente de las relaciones nuevas
+        self._create_relations(list( requested_relations - current_relations ), execution_ctx)
 
-    def _build_replace(
+    def _run_clear(
         self,
         execution_ctx: ExecutionContext[_M],
-        record_ids: RecordIDs,
-    ) -> CaptureRecordID[_M]:
-
-        # Se asegura el formato en lista
-        record_ids = to_list(record_ids)
-
-        def replace_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Inicialización de función de operación de relación
-            def crud_operation(_: CRUD[_M]) -> None:
-                # Eliminación de relaciones existentes
-                self._clear_relations(created_or_updated_id, execution_ctx)
-                # Creación de relaciones
-                self._create_relations(
-                created_or_updated_id,
-                    record_ids,
-                    execution_ctx,
-                )
+        crud: CRUD[_M],
+        commands: list[tuple[int, Literal[True]]],
+    ) -> None:
 
-            return crud_operation
+        # Eliminación de relaciones existentes de todos los registros propietarios
+        self._clear_relations([ created_or_updated_id for ( created_or_updated_id, _ ) in commands ], execution_ctx)
 
-        return replace_records
+    def _build_relations(
+        self,
+        commands: list[tuple[int, RecordIDs]],
+    ) -> list[tuple[int, int]]:
+
+        # Construcción de los pares de IDs de registro propietario y registro relacionado
+        relations = [
+            ( created_or_updated_id, record_id )
+            for ( created_or_updated_id, record_ids ) in commands
+            for record_id in to_list(record_ids)
+        ]
 
-    def _build_clear(
+        return relations
+
+    def _read_relations(
         self,
+        x: list[int],
         execution_ctx: ExecutionContext[_M],
-        _: Literal[True] = True,
-    ) -> CaptureRecordID[_M]:
-
-        def clear_records(created_or_updated_id: int) -> CRUD_Operation[_M]:
-            # Creación de función de operación CRUD
-            crud_operation: CRUD_Operation[_M] = lambda _: self._clear_relations(
-                created_or_updated_id,
-                execution_ctx,
+    ) -> set[tuple[int, int]]:
+
+        # Creación de query
+        stmt = (
+            select(
+                self._relation_model_model.x,
+                self._relation_model_model.y,
+            )
+            .where(
+                self._relation_model_model.x == any_( literal(x, ARRAY(Integer)) )
             )
+        )
 
-            return crud_operation
+        # Obtención de las relaciones existentes
+        relations = { ( x_i, y_i ) for ( x_i, y_i ) in execution_ctx.conn.execute(stmt) }
 
-        return clear_records
+        return relations
 
     def _create_relations(
         self,
-        x: int,
-        y: list[int],
+        relations: list[tuple[int, int]],
         execution_ctx: ExecutionContext[_M],
     ) -> None:
 
-        # Creación de diccionario de datos
+        # Si no hay relaciones a crear...
+        if not relations:
+            # Se termina la ejecución
+            return
+
+        # Creación de diccionario de datos sin relaciones duplicadas
         data = [
             {
                 FIELD_NAME.X: x,
-                FIELD_NAME.Y: y_i,
+                FIELD_NAME.Y: y,
             }
-            for y_i in y
+            for ( x, y ) in dict.fromkeys(relations)
         ]
 
         # Creación del query
         stmt = (
-            insert(self._relation_model_model)
+            pg_insert(self._relation_model_model)
             .values(data)
+            # Se omiten las relaciones ya existentes
+            .on_conflict_do_nothing(index_elements= [FIELD_NAME.X, FIELD_NAME.Y])
         )
 
         # Ejecución del query
@@ -456,18 +508,31 @@ class _Many2Many_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
 
     def _delete_relations(
         self,
-        x: int,
-        y: list[int],
+        relations: list[tuple[int, int]],
         execution_ctx: ExecutionContext[_M],
     ) -> None:
 
+        # Si no hay relaciones a eliminar...
+        if not relations:
+            # Se termina la ejecución
+            return
+
+        # Separación de las IDs de ambos lados de las relaciones
+        ( x, y ) = zip(*relations)
+
         # Creación del query
         stmt = (
             delete(self._relation_model_model)
             .where(
-                and_(
-                    self._relation_model_model.x == x,
-                    self._relation_model_model.y.in_(y)
+                # Los pares se comparan contra los arreglos desanidados en paralelo
+                tuple_(
+                    self._relation_model_model.x,
+                    self._relation_model_model.y,
+                ).in_(
+                    select(
+                        func.unnest( literal(list(x), ARRAY(Integer)) ),
+                        func.unnest( literal(list(y), ARRAY(Integer)) ),
+                    )
                 )
             )
         )
@@ -477,7 +542,7 @@ class _Many2Many_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
 
     def _clear_relations(
         self,
-        x: int,
+        x: list[int],
         execution_ctx: ExecutionContext[_M],
     ) -> None:
 
@@ -485,7 +550,7 @@ class _Many2Many_CRUD(Generic[_M], _BaseRelation_CRUD[_M]):
         stmt = (
             delete(self._relation_model_model)
             .where(
-                self._relation_model_model.x == x
+                self._relation_model_model.x == any_( literal(x, ARRAY(Integer)) )
             )
         )
 
@@ -506,9 +571,6 @@ class RelationOperationsContext(Generic[_M]):
         # Asignación de la instancia de portador de modelos
         self._models_bearer = models_bearer
 
-        # Inicialización de lista total de operaciones CRUD
-        self._total_relation_operations: list[CRUD_Operation[_M]] = []
-
         # Obtención de modelo de campos de modelos
         field = Metadata.BaseModelField
         # Obtención de modelo propietario
@@ -598,10 +660,10 @@ class RelationOperationsContext(Generic[_M]):
         crud: CRUD[_M],
     ) -> None:
 
-        # Iteración por cada función a ejecutar
-        for relation_operation in self._total_relation_operations:
-            # Ejecución de función
-            relation_operation(crud)
+        # Iteración por cada instancia de operaciones CRUD de los campos de relación
+        for relation_crud in ( *self._m2o_crud_per_field.values(), *self._m2m_crud_per_field.values() ):
+            # Ejecución en conjunto de los comandos acumulados de todos los registros
+            relation_crud.run_pending_commands(self._execution_ctx, crud)
 
     def capture_relation_commands(
         self,
@@ -609,7 +671,7 @@ class RelationOperationsContext(Generic[_M]):
     ) -> CaptureCreatedRecordID:
 
         # Inicialización de lista de funciones de captura de ID creada
-        capture_id_functions: list[CaptureRecordID] = []
+        capture_id_functions: list[CaptureCreatedRecordID] = []
         # Creación de copia de datos para iterar y no romper el ciclo cuando se eliminen llaves
         record_data_for_iteration = record_data.copy()
 
@@ -623,7 +685,7 @@ class RelationOperationsContext(Generic[_M]):
                 # Obtención de la instancia de operaciones CRUD para el campo
                 m2o_crud = self._m2o_crud_per_field[field_name]
                 # Captura de comandos
-                m2o_crud.capture_commands_for_field(self._execution_ctx, relation_commands, capture_id_functions)
+                m2o_crud.capture_commands_for_field(relation_commands, capture_id_functions)
 
             # Si el nombre del campo se encuentra en el diccionario de operaciones de relación para campos many2many...
             if field_name in self._m2m_crud_per_field:
@@ -633,16 +695,14 @@ class RelationOperationsContext(Generic[_M]):
                 # Obtención de la instancia de operaciones CRUD para el campo
                 m2m_crud = self._m2m_crud_per_field[field_name]
                 # Captura de comandos
-                m2m_crud.capture_commands_for_field(self._execution_ctx, relation_commands, capture_id_functions)
+                m2m_crud.capture_commands_for_field(relation_commands, capture_id_functions)
 
         # Inicialización de función para capturar ID de registro creado
         def capture_created_id(created_id: int) -> None:
 
             # Captura de ID por función generada
             for capture_id_fn in capture_id_functions:
-                # Generación de operación CRUD
-                crud_operation = capture_id_fn(created_id)
-                # Se añade ésta a la lista total
-                self._total_relation_operations.append(crud_operation)
+                # Se acumulan los comandos del registro para su ejecución en conjunto
+                capture_id_fn(created_id)
 
         return capture_created_id
@@ -8,12 +8,16 @@ from sqlalchemy import and_
 from sqlalchemy import not_
 from sqlalchemy import or_
 from .._constants import ERROR_LABEL
+from .._resources import LRUCache
+from .._typing.structures import CriteriaPlan
+from .._typing.structures import CriteriaShape
 from .._typing.structures import CriteriaStructure
 from .._typing.structures import TripletStructure
 from .._typing.structures import ComparisonOperator
 from .._typing.structures import LogicOperator
 from .._typing.structures import RecordValue
 from .._typing.type_parameters import _M
+from ..settings import CONFIG
 
 if TYPE_CHECKING:
     from .._contexts import FrameContext
@@ -33,10 +37,15 @@ class WhereContext(Generic[_M]):
         '~': lambda field, value: field.regexp_match(value),
         '~*': lambda field, value: field.regexp_match(value, 'i'),
     }
-    _logic_expression: dict[LogicOperator, Callable[[BinaryExpression, BinaryExpression], BinaryExpression]] = {
-        '&': lambda a, b: and_(a, b),
-        '|': lambda a, b: or_(a, b),
+    _logic_expression: dict[LogicOperator, Callable[..., BooleanClauseList]] = {
+        '&': and_,
+        '|': or_,
     }
+    _plans_cache = LRUCache[CriteriaShape, CriteriaPlan](CONFIG.CRITERIA_PLAN_CACHE_SIZE)
+    """
+    Caché de planes compilados por forma de criterio de búsqueda, compartido
+    por todos los contextos.
+    """
 
     def __init__(
         self,
@@ -51,82 +60,27 @@ class WhereContext(Generic[_M]):
         search_criteria: CriteriaStructure,
     ) -> BinaryExpression | BooleanClauseList:
 
-        # Si el criterio de búsqueda solo tiene un elemento...
-        if len(search_criteria) == 1:
-            # Obtención de la tripleta contenida
-            [ triplet ] = search_criteria
-            # Se asume que es una condición y se resuelve ésta
-            expression = self.create_binary_expression(triplet)
+        # Obtención de la forma del criterio de búsqueda
+        shape: CriteriaShape = tuple( item if isinstance(item, str) else None for item in search_criteria )
 
-        # Si la longitud del criterio de búsqueda es un número par...
-        elif (len(search_criteria) % 2) == 0:
-            # Se lanza error de criterio de búsqueda mal construido
-            raise AssertionError(ERROR_LABEL.MALFORMED_SEARCH_CRITERIA)
-
-        # Se asume que la cantidad de elementos es válida
-        else:
-            # Se tienen que convertir todas las tuplas a expresiones binarias antes de hacer uniones lógicas
-            for ( index, op_or_triplet ) in enumerate(search_criteria):
-                if isinstance(op_or_triplet, tuple):
-                    # Se resuelve la tripleta
-                    expression = self.create_binary_expression(op_or_triplet)
-                    # Asignación de la expresión en el índice correspondiente
-                    search_criteria[index] = expression
-
-            # Mientras el tamaño del criterio de búsqueda sea diferente de 1
-            while len(search_criteria) != 1:
-
-                # Inicialización de valor de unión encontrada
-                union_found = False
-
-                # Se recorre el criterio de búsqueda para unir expresiones
-                for index in range( len(search_criteria) - 2 ):
-
-                    # Obtención de elementos para su evaluación
-                    item_a = search_criteria[index]
-                    item_b = search_criteria[index + 1]
-                    item_c = search_criteria[index + 2]
-
-                    # Elemento A es un operador lógico
-                    a_is_op = item_a in ['&', '|']
-                    # Elemento B es una expresión
-                    b_is_condition = isinstance(item_b, BinaryExpression) or isinstance(item_b, BooleanClauseList)
-                    # Elemento C es una expresión
-                    c_is_condition = isinstance(item_c, BinaryExpression) or isinstance(item_c, BooleanClauseList)
-
-                    # Si A es un operador lógico y a la vez B y C son expresiones...
-                    if a_is_op and b_is_condition and c_is_condition:
-
-                        # Reasignación de variables para conservar semántica
-                        op = item_a
-                        condition_x = item_b
-                        condition_y = item_c
-
-                        # Obtención de la expresión binaria
-                        expression = self._logic_expression[op](condition_x, condition_y)
-
-                        # Cálculo del índice más alto para cortar el criterio de búsqueda
-                        highest_available_index = min(index + 3, len(search_criteria))
-
-                        # Obtención de rebanadas inicial y final de criterio de búsqueda
-                        initial_slice = search_criteria[:index]
-                        final_slice = search_criteria[highest_available_index:]
-                        search_criteria = [*initial_slice, expression, *final_slice]
-
-                        # Se especifica que hubo unión encontrada
-                        union_found = True
-
-                        # Se vuelve a iniciar el ciclo de búsqueda
-                        break
+        # Obtención del plan compilado desde el caché
+        plan = self._plans_cache.get(shape)
+        # Si el plan no se encuentra en el caché...
+        if plan is None:
+            # Compilación del plan
+            plan = self._compile_plan(shape)
+            # Se guarda el plan en el caché
+            self._plans_cache.set(shape, plan)
 
-                # Si se llega a este punto no se puede continuar con el procesamiento del
-                # criterio de búsqueda porque no hay más uniones por procesar y tampoco se
-                # colapsó a un solo elemento
-                if not union_found:
-                    raise AssertionError(ERROR_LABEL.MALFORMED_SEARCH_CRITERIA)
+        # Construcción de las expresiones de las tripletas en el orden del criterio de búsqueda
+        expressions = {
+            index: self.create_binary_expression(triplet)
+            for ( index, triplet ) in enumerate(search_criteria)
+            if shape[index] is None
+        }
 
-            # Obtención de expresión a usar em query
-            [ expression ] = search_criteria
+        # Construcción de la expresión a usar en query
+        expression = self._resolve_plan(plan, expressions)
 
         return expression
 
@@ -146,3 +100,95 @@ class WhereContext(Generic[_M]):
         expression = self._comparison_expression[op](field_instance, value)
 
         return expression
+
+    def _compile_plan(
+        self,
+        shape: CriteriaShape,
+    ) -> CriteriaPlan:
+
+        # Inicialización de pila de operandos
+        stack: list[CriteriaPlan] = []
+
+        # Recorrido del criterio de búsqueda de derecha a izquierda
+        for index in range(len(shape) - 1, -1, -1):
+            # Obtención del operador lógico
+            op = shape[index]
+
+            # Si el elemento es una tripleta...
+            if op is None:
+                # Se añade su índice como operando
+                stack.append(index)
+                continue
+
+            # Si el operador no es válido o no hay suficientes operandos...
+            if op not in self._logic_expression or len(stack) < 2:
+                # Se lanza error de criterio de búsqueda mal construido
+                raise AssertionError(ERROR_LABEL.MALFORMED_SEARCH_CRITERIA)
+
+            # Obtención de ambos operandos
+            condition_x = stack.pop()
+            condition_y = stack.pop()
+            # Se añade la unión lógica como operando
+            stack.append( ( op, ( condition_x, condition_y ) ) )
+
+        # Si el criterio de búsqueda no colapsó a un solo elemento...
+        if len(stack) != 1:
+            # Se lanza error de criterio de búsqueda mal construido
+            raise AssertionError(ERROR_LABEL.MALFORMED_SEARCH_CRITERIA)
+
+        # Obtención del plan aplanado
+        plan = self._flatten_plan(stack[0])
+
+        return plan
+
+    def _flatten_plan(
+        self,
+        plan: CriteriaPlan,
+    ) -> CriteriaPlan:
+
+        # Si el plan es una tripleta se retorna tal cual
+        if isinstance(plan, int):
+            return plan
+
+        # Obtención del operador lógico del nodo
+        ( op, _ ) = plan
+
+        # Inicialización de operandos aplanados
+        operands: list[CriteriaPlan] = []
+        # Inicialización de pila de nodos pendientes
+        pending = [plan]
+
+        # Mientras existan nodos pendientes...
+        while pending:
+            # Obtención del siguiente nodo
+            node = pending.pop()
+
+            # Si el nodo es una unión con el mismo operador...
+            if not isinstance(node, int) and node[0] == op:
+                # Se añaden sus operandos en orden inverso para conservar el orden original
+                pending.extend( reversed(node[1]) )
+            # Si el nodo es una tripleta u otro operador...
+            else:
+                # Se añade como operando aplanado
+                operands.append( self._flatten_plan(node) )
+
+        return ( op, tuple(operands) )
+
+    def _resolve_plan(
+        self,
+        plan: CriteriaPlan,
+        expressions: dict[int, BinaryExpression],
+    ) -> BinaryExpression | BooleanClauseList:
+
+        # Si el plan es una tripleta...
+        if isinstance(plan, int):
+            # Se retorna su expresión
+            return expressions[plan]
+
+        # Obtención del operador lógico y sus operandos
+        ( op, operands ) = plan
+
+        # Construcción de la unión lógica de todos los operandos
+        expression = self._logic_expression[op]( *( self._resolve_plan(operand, expressions) for operand in operands ) )
+
+        return expression
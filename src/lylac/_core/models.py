@@ -16,6 +16,7 @@ class TABLE_NAME:
     BASE_MODEL_DATA_PROCESS_STEP_RECORD = 'base_model_data_process_step_record'
     BASE_USERS = 'base_users'
     BASE_USER_SESSION = 'base_user_session'
+    BASE_REVOKED_SESSION = 'base_revoked_session'
     BASE_MODEL = 'base_model'
     BASE_MODEL_FIELD = 'base_model_field'
     BASE_MODEL_FIELD_SELECTION = 'base_model_field_selection'
@@ -184,3 +185,12 @@ class Metadata:
         user_id: Mapped[int] = mapped_column(ForeignKey(f'{TABLE_NAME.BASE_USERS}.id', ondelete= 'CASCADE'))
         # Tiempo de expiración
         validity_time: Mapped[timedelta] = mapped_column(types.Interval)
+
+    class BaseRevokedSession(
+        _Base,
+    ):
+        __tablename__ = TABLE_NAME.BASE_REVOKED_SESSION
+        # Nombre hasheado de la sesión revocada
+        name: Mapped[str] = mapped_column(types.String(120), primary_key= True)
+        # Fecha de revocación
+        create_date: Mapped[datetime] = mapped_column(types.DateTime, default= datetime.now)
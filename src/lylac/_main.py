@@ -1,13 +1,17 @@
 from datetime import datetime
 from datetime import timedelta
 from hashlib import sha256
+from time import monotonic
 from typing import Any
 from typing import Callable
 from typing import Generic
+from typing import Iterable
+from typing import Iterator
 from typing import Literal
 from typing import Optional
 from typing import Union
 from uuid import uuid4
+from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy import update
 from sqlalchemy.engine import Connection
@@ -37,16 +41,24 @@ from ._engines import UserEnvEngine
 from ._engines import ValidationEngine
 from ._operations import DDL
 from ._orchestrator import CRUD
+from ._resources import CacheStats
+from ._resources import CachedSession
 from ._resources import DatabaseMetadata
+from ._resources import LRUCache
 from ._resources import ModelDataIndex
 from ._resources import ModelsBearer
+from ._resources import Page
+from ._resources import PoolStats
 from ._services import ConnectionService
 from ._typing.callables import ExecutableTransactionCallback
 from ._typing.callables import ComputeFieldFn as _ComputeFieldFn
 from ._typing.generics import ItemOrList
 from ._typing.generics import ModelName
+from ._typing.generics import _Columns
 from ._typing.generics import _Record
 from ._typing.generics import _Records
+from ._typing.literals import AggFuncName
+from ._typing.literals import OutputMode
 from ._typing.models import _base_users__fields
 from ._typing.models import _found_session
 from ._typing.structures import CriteriaStructure
@@ -60,7 +72,11 @@ from .errors import IncorrectPasswordError
 from .errors import InvalidSessionUUIDError
 from .errors import UserNotActiveError
 from .errors import UserNotFoundError
-from .security import verify_password
+from .security import is_session_token
+from .security import issue_session_token
+from .security import read_session_token
+from .security import verify_password_in_pool
+from .settings import CONFIG
 
 class Lylac(Generic[_M]):
     # Interfaz para acceso al tipado de automatización sin tener que colocar literal de modelos
@@ -86,16 +102,18 @@ class Lylac(Generic[_M]):
 
         # Inicialización de instancia de servicio de conexión a la base de datos
         self._connection = ConnectionService()
+        # Inicialización de sesiones fijadas a la base de datos principal tras escribir
+        self._pinned_sessions = LRUCache[str, float](CONFIG.SESSION_CACHE_SIZE)
         # inicialización de instancia de portador de modelos
         self._models_bearer = ModelsBearer[_M]()
         # Inicialización de instancia de transacciones especiales
         self._transaction = Transaction()
         # Inicialización de instancia de metadatos de la base de datos
         self._metadata = DatabaseMetadata()
-        # Inicialización de orquestador CRUD
-        self._crud = CRUD(self._models_bearer)
         # Inicialización de instancia de operaciones DDL
         self._ddl = DDL(self._models_bearer, self._metadata)
+        # Inicialización de orquestador CRUD
+        self._crud = CRUD(self._models_bearer, self._ddl)
 
         # Se intenta inicializar la instancia con datos existentes
         try:
@@ -141,107 +159,113 @@ class Lylac(Generic[_M]):
         # Se establece el bypass en Falso
         self._crud.PERMISSIONS_BYPASS = False
 
-    def login(
+    @property
+    def cache_stats(
         self,
-        username: str,
-        password: str,
-    ) -> str:
+    ) -> dict[str, CacheStats]:
 
-        # Definición de la transacción
-        def transaction(conn: Connection):
-            # Inicialización de contexto de ejecución
-            execution_ctx = self._create_execution_context(None, DATA_RESOURCE.ROOT_USER, conn)
-            # Se busca el usuario
-            found_users: _Records[_base_users__fields] = self._crud.search_read(
-                execution_ctx,
-                'base.users',
-                [('login', '=', username)],
-                ['login', 'active', 'password'],
-            )
+        # Obtención de los contadores de los cachés en memoria
+        stats = self._crud.cache_stats
 
-            # Si no se encontró usuario...
-            if not found_users:
-                # Se arroja error de usuario no encontrado
-                raise UserNotFoundError(ERROR_LABEL.USER_NOT_FOUND)
+        return stats
 
-            # Obtención de los datos del usuario
-            [ user_data ] = found_users
+    @property
+    def pool_stats(
+        self,
+    ) -> PoolStats:
 
-            # Si el usuario no está activo...
-            if not user_data['active']:
-                # Se arroja error de usuario inactivo
-                raise UserNotActiveError(ERROR_LABEL.USER_NOT_ACTIVE)
+        # Obtención del estado del grupo de conexiones
+        stats = self._connection.pool_stats
 
-            # Obtención de la contraseña hasheada
-            hashed_password: str = user_data['password']
-            # Obtención de la ID del usuario
-            user_id = user_data['id']
+        return stats
 
-            # Verificación de la contraseña
-            is_pwd_correct = verify_password(password, hashed_password)
+    @property
+    def replicas_pool_stats(
+        self,
+    ) -> list[PoolStats]:
 
-            # Si la contraseña no es correcta...
-            if not is_pwd_correct:
-                # Se arroja error de contraseña incorrecta
-                raise IncorrectPasswordError(ERROR_LABEL.INCORRECT_PASSWORD)
+        # Obtención del estado de los grupos de conexiones de réplicas
+        stats = self._connection.replicas_pool_stats
 
-            # Creación de UUID de sesión
-            session_uuid = uuid4().__str__()
+        return stats
 
-            # Hasheo de la UUID de sesión
-            hashed_session_uuid = (
-                sha256( session_uuid.encode() )
-                .hexdigest()
-            )
+    def login(
+        self,
+        username: str,
+        password: str,
+    ) -> str:
 
-            # Creación de sesión de usuario
-            self._crud.create(
-                execution_ctx,
-                'base.user.session',
-                {
-                    'name': hashed_session_uuid,
-                    'user_id': user_id,
-                    'validity_time': timedelta(days= 30),
-                },
-            )
+        # Obtención de los datos del usuario liberando la conexión al terminar
+        user_data = self._connection.execute_complex(lambda conn: self._find_login_user(username, conn))
 
-            # Se realiza commit
-            conn.commit()
+        # Verificación de la contraseña fuera de la transacción
+        is_pwd_correct = verify_password_in_pool(password, user_data['password'])
 
-            return session_uuid
+        # Si la contraseña no es correcta...
+        if not is_pwd_correct:
+            # Se arroja error de contraseña incorrecta
+            raise IncorrectPasswordError(ERROR_LABEL.INCORRECT_PASSWORD)
 
-        # Ejecución de la función de transacción
-        session_uuid = self._connection.execute_complex(transaction)
+        # Creación de UUID de sesión
+        session_uuid = uuid4().__str__()
 
-        return session_uuid
+        # Ejecución de la transacción de creación de sesión
+        self._connection.execute_complex(lambda conn: self._create_session(user_data['id'], session_uuid, conn))
+
+        # Obtención de la credencial a entregar al usuario
+        credential = self._issue_session(user_data['id'], session_uuid)
+        # Las lecturas siguientes se dirigen a la base de datos principal hasta que la sesión se replique
+        self.pin_to_primary(credential)
+
+        return credential
 
     def execute_transaction(
         self,
         session_uuid: str,
         callback: Callable[[_ExecutionContext[_M]], _T],
+        read_only: bool = False,
     ) -> _T:
 
-        # Autenticación del usuario
-        uid = self._authenticate_user(session_uuid)
-
-        def wrapped_transaction(conn: Connection) -> _T:
-            # Inicialización de contexto de ejecución
-            execution_ctx = self._create_execution_context(session_uuid, uid, conn)
-            # Ejecución de la función
-            closure_result = callback(execution_ctx)
-
-            # Se hace commit en la base de datos
-            execution_ctx.conn.commit()
-            # Se ejecutan las funciones suscritas tras el commit
-            execution_ctx.on_commit()
+        # Se usa una réplica de lectura sólo si la sesión no escribió recientemente
+        use_replica = read_only and not self._is_pinned_to_primary(session_uuid)
 
-            return closure_result
+        # Construcción de la función de transacción
+        wrapped_transaction = self._wrap_transaction(session_uuid, callback, use_replica)
 
         # Ejecución de la función de transacción
-        result = self._connection.execute_complex(wrapped_transaction)
+        result = self._connection.execute_complex(wrapped_transaction, use_replica)
+
+        # Si la transacción pudo haber escrito datos...
+        if not read_only:
+            # Las lecturas siguientes de la sesión se dirigen a la base de datos principal
+            self.pin_to_primary(session_uuid)
 
         return result
 
+    def pin_to_primary(
+        self,
+        session_uuid: str,
+        seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Dirige las lecturas de la sesión a la base de datos principal durante el
+        tiempo indicado para leer sus propias escrituras antes de que éstas se
+        repliquen. Por defecto se usa `LYLAC_READ_YOUR_WRITES_WINDOW`.
+        """
+
+        # Si no hay réplicas de lectura configuradas...
+        if not CONFIG.DB_REPLICA_URLS:
+            # Se termina la ejecución
+            return
+
+        # Si no se especificó el tiempo de fijación...
+        if seconds is None:
+            # Se usa el tiempo configurado
+            seconds = CONFIG.READ_YOUR_WRITES_WINDOW
+
+        # Se guarda el momento hasta el cual la sesión lee de la base de datos principal
+        self._pinned_sessions.set(session_uuid, monotonic() + seconds)
+
     def action(
         self,
         session_uuid: str,
@@ -306,6 +330,53 @@ class Lylac(Generic[_M]):
 
         return created_ids
 
+    def upsert(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        data: ItemOrList[dict],
+        conflict_fields: list[str],
+        update_fields: Optional[list[str]] = None,
+    ) -> list[int]:
+
+        # Definición de la transacción
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> list[int]:
+            # Inserción o modificación de los registros
+            closure_record_ids = self._crud.upsert(
+                execution_ctx,
+                model_name,
+                data,
+                conflict_fields,
+                update_fields,
+            )
+
+            return closure_record_ids
+
+        # Ejecución de la transacción
+        record_ids = self.execute_transaction(session_uuid, transaction)
+
+        return record_ids
+
+    def bulk_load(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        rows: Iterable[RecordData],
+        run_automations: bool = False,
+    ) -> list[int]:
+
+        # Definición de la transacción
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> list[int]:
+            # Carga masiva de registros y obtención de las IDs creadas
+            closure_created_ids = self._crud.bulk_load(execution_ctx, model_name, rows, run_automations)
+
+            return closure_created_ids
+
+        # Ejecución de la transacción
+        created_ids = self.execute_transaction(session_uuid, transaction)
+
+        return created_ids
+
     def search(
         self,
         session_uuid: str,
@@ -313,6 +384,9 @@ class Lylac(Generic[_M]):
         search_criteria: CriteriaStructure = [],
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
     ) -> list[int]:
 
         # Definición de la transacción
@@ -324,15 +398,54 @@ class Lylac(Generic[_M]):
                 search_criteria,
                 offset,
                 limit,
+                sortby,
+                ascending,
+                after,
             )
 
             return closure_found_ids
 
         # Ejecución de la transacción
-        found_ids = self.execute_transaction(session_uuid, transaction)
+        found_ids = self.execute_transaction(session_uuid, transaction, read_only= True)
 
         return found_ids
 
+    def search_page(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[int]:
+        """
+        Búsqueda paginada por llave. Retorna las IDs de la página y un cursor
+        opaco para solicitar la siguiente en `after`, o `None` si ya no hay más
+        registros. La ID se usa como desempate del ordenamiento.
+        """
+
+        # Definición de la transacción
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> Page[int]:
+            # Obtención de la página
+            closure_page = self._crud.search_page(
+                execution_ctx,
+                model_name,
+                search_criteria,
+                limit,
+                sortby,
+                ascending,
+                after,
+            )
+
+            return closure_page
+
+        # Ejecución de la transacción
+        page = self.execute_transaction(session_uuid, transaction, read_only= True)
+
+        return page
+
     def read(
         self,
         session_uuid: str,
@@ -358,7 +471,7 @@ class Lylac(Generic[_M]):
             return closure_data
 
         # Ejecución de la transacción
-        data = self.execute_transaction(session_uuid, transaction)
+        data = self.execute_transaction(session_uuid, transaction, read_only= True)
 
         return data
 
@@ -372,10 +485,14 @@ class Lylac(Generic[_M]):
         limit: Optional[int] = None,
         sortby: Optional[ItemOrList[str]] = None,
         ascending: Optional[ItemOrList[bool]] = None,
-    ) -> list[_Record]:
+        after: Optional[str] = None,
+        with_count: bool = False,
+        count_limit: Optional[int] = None,
+        output: OutputMode = 'records',
+    ) -> Union[ list[_Record], _Columns, tuple[Union[ list[_Record], _Columns ], int] ]:
 
         # Definición de la transacción
-        def transaction(execution_ctx: _ExecutionContext[_M]) -> list[_Record]:
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> Union[ list[_Record], _Columns, tuple[Union[ list[_Record], _Columns ], int] ]:
             # Obtención de los datos
             closure_data = self._crud.search_read(
                 execution_ctx,
@@ -386,15 +503,107 @@ class Lylac(Generic[_M]):
                 limit,
                 sortby,
                 ascending,
+                after,
+                with_count,
+                count_limit,
+                output,
             )
 
             return closure_data
 
         # Ejecución de la transacción
-        data = self.execute_transaction(session_uuid, transaction)
+        data = self.execute_transaction(session_uuid, transaction, read_only= True)
 
         return data
 
+    def search_read_page(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FieldReadDeclaration] = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[_Record]:
+        """
+        Búsqueda y lectura paginada por llave. Retorna los registros de la
+        página y un cursor opaco para solicitar la siguiente en `after`, o
+        `None` si ya no hay más registros.
+        """
+
+        # Definición de la transacción
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> Page[_Record]:
+            # Obtención de la página
+            closure_page = self._crud.search_read_page(
+                execution_ctx,
+                model_name,
+                search_criteria,
+                fields,
+                limit,
+                sortby,
+                ascending,
+                after,
+            )
+
+            return closure_page
+
+        # Ejecución de la transacción
+        page = self.execute_transaction(session_uuid, transaction, read_only= True)
+
+        return page
+
+    def iter_search_read(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FieldReadDeclaration] = [],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[_Record]:
+        """
+        Igual a `search_read` pero entrega los registros conforme se leen de un
+        cursor del lado del servidor en lotes de `chunk_size` filas (por
+        defecto `LYLAC_STREAM_CHUNK_SIZE`). La transacción permanece abierta
+        mientras se consume el iterador.
+        """
+
+        # Se usa una réplica de lectura sólo si la sesión no escribió recientemente
+        use_replica = not self._is_pinned_to_primary(session_uuid)
+
+        # Definición de la transacción generadora
+        def streamed_transaction(conn: Connection) -> Iterator[_Record]:
+            # Autenticación del usuario en la misma conexión de la transacción
+            uid = self._authenticate_user(session_uuid, conn, use_replica)
+            # Inicialización de contexto de ejecución
+            execution_ctx = self._create_execution_context(session_uuid, uid, conn, use_replica)
+
+            # Se entregan los registros conforme se leen
+            yield from self._crud.iter_search_read(
+                execution_ctx,
+                model_name,
+                search_criteria,
+                fields,
+                offset,
+                limit,
+                sortby,
+                ascending,
+                chunk_size,
+            )
+
+            # Se hace commit en la base de datos
+            execution_ctx.conn.commit()
+            # Se ejecutan las funciones suscritas tras el commit
+            execution_ctx.on_commit()
+
+        # Ejecución de la transacción generadora
+        yield from self._connection.stream_complex(streamed_transaction, use_replica)
+
     def search_count(
         self,
         session_uuid: str,
@@ -414,10 +623,45 @@ class Lylac(Generic[_M]):
             return closure_count
 
         # Ejecución de la transacción
-        count = self.execute_transaction(session_uuid, transaction)
+        count = self.execute_transaction(session_uuid, transaction, read_only= True)
 
         return count
 
+    def read_group(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        groupby: ItemOrList[str] = [],
+        aggregates: dict[str, AggFuncName] = {},
+        having: list[tuple[str, str, Any]] = [],
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[_Record]:
+
+        # Definición de la transacción
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> list[_Record]:
+            # Obtención de los grupos
+            closure_groups = self._crud.read_group(
+                execution_ctx,
+                model_name,
+                search_criteria,
+                groupby,
+                aggregates,
+                having,
+                sortby,
+                ascending,
+                limit,
+            )
+
+            return closure_groups
+
+        # Ejecución de la transacción
+        groups = self.execute_transaction(session_uuid, transaction, read_only= True)
+
+        return groups
+
     def update(
         self,
         session_uuid: str,
@@ -443,6 +687,29 @@ class Lylac(Generic[_M]):
 
         return result
 
+    def update_many(
+        self,
+        session_uuid: str,
+        model_name: ModelName[_M],
+        data_per_id: dict[int, dict],
+    ) -> Literal[True]:
+
+        # Definición de la transacción
+        def transaction(execution_ctx: _ExecutionContext[_M]) -> Literal[True]:
+            # Modificación de los registros con sus valores individuales
+            closure_result = self._crud.update_many(
+                execution_ctx,
+                model_name,
+                data_per_id,
+            )
+
+            return closure_result
+
+        # Ejecución de la transacción
+        result = self.execute_transaction(session_uuid, transaction)
+
+        return result
+
     def delete(
         self,
         session_uuid: str,
@@ -481,70 +748,277 @@ class Lylac(Generic[_M]):
         # Construcción de centro de políticas
         self._policies.build_hub(self._metadata)
 
+    def _find_login_user(
+        self,
+        username: str,
+        conn: Connection,
+    ) -> _base_users__fields:
+
+        # Inicialización de contexto de ejecución
+        execution_ctx = self._create_execution_context(None, DATA_RESOURCE.ROOT_USER, conn)
+        # Se busca el usuario
+        found_users: _Records[_base_users__fields] = self._crud.search_read(
+            execution_ctx,
+            'base.users',
+            [('login', '=', username)],
+            ['login', 'active', 'password'],
+        )
+
+        # Si no se encontró usuario...
+        if not found_users:
+            # Se arroja error de usuario no encontrado
+            raise UserNotFoundError(ERROR_LABEL.USER_NOT_FOUND)
+
+        # Obtención de los datos del usuario
+        [ user_data ] = found_users
+
+        # Si el usuario no está activo...
+        if not user_data['active']:
+            # Se arroja error de usuario inactivo
+            raise UserNotActiveError(ERROR_LABEL.USER_NOT_ACTIVE)
+
+        return user_data
+
+    def _create_session(
+        self,
+        user_id: int,
+        session_uuid: str,
+        conn: Connection,
+    ) -> None:
+
+        # Inicialización de contexto de ejecución
+        execution_ctx = self._create_execution_context(None, DATA_RESOURCE.ROOT_USER, conn)
+
+        # Hasheo de la UUID de sesión
+        hashed_session_uuid = (
+            sha256( session_uuid.encode() )
+            .hexdigest()
+        )
+
+        # Creación de sesión de usuario
+        self._crud.create(
+            execution_ctx,
+            'base.user.session',
+            {
+                'name': hashed_session_uuid,
+                'user_id': user_id,
+                'validity_time': timedelta(days= CONFIG.SESSION_VALIDITY_DAYS),
+            },
+        )
+
+        # Se realiza commit
+        conn.commit()
+
+    def _issue_session(
+        self,
+        user_id: int,
+        session_uuid: str,
+    ) -> str:
+
+        # Si se usan tokens de sesión firmados...
+        if CONFIG.SESSION_TOKEN_SECRET:
+            # Cálculo de la expiración de la sesión
+            expires_at = datetime.now() + timedelta(days= CONFIG.SESSION_VALIDITY_DAYS)
+            # Emisión del token con la UUID de la sesión
+            session_uuid = issue_session_token(user_id, session_uuid, expires_at, CONFIG.SESSION_TOKEN_SECRET)
+
+        # La sesión recién creada se lee de la base de datos principal hasta replicarse
+        self.pin_to_primary(session_uuid)
+
+        return session_uuid
+
+    def _wrap_transaction(
+        self,
+        session_uuid: str,
+        callback: Callable[[_ExecutionContext[_M]], _T],
+        is_replica: bool = False,
+    ) -> Callable[[Connection], _T]:
+
+        def wrapped_transaction(conn: Connection) -> _T:
+            # Autenticación del usuario en la misma conexión de la transacción
+            uid = self._authenticate_user(session_uuid, conn, is_replica)
+            # Inicialización de contexto de ejecución
+            execution_ctx = self._create_execution_context(session_uuid, uid, conn, is_replica)
+            # Ejecución de la función
+            closure_result = callback(execution_ctx)
+
+            # Se hace commit en la base de datos
+            execution_ctx.conn.commit()
+            # Se ejecutan las funciones suscritas tras el commit
+            execution_ctx.on_commit()
+
+            return closure_result
+
+        return wrapped_transaction
+
     def _authenticate_user(
         self,
         session_uuid: str,
+        conn: Connection,
+        is_replica: bool = False,
     ) -> int:
 
-        # Definición de la transacción
-        def transaction(conn: Connection) -> int:
-            # Inicialización de contexto de ejecución
-            execution_ctx = self._create_execution_context(None, DATA_RESOURCE.ROOT_USER, conn)
+        # Si se usan tokens de sesión firmados y se recibió uno...
+        if CONFIG.SESSION_TOKEN_SECRET and is_session_token(session_uuid):
+            # Autenticación del usuario sin consultar la sesión
+            return self._authenticate_token(session_uuid, conn)
 
-            # Hasheo de la UUID de sesión
-            hashed_session_uuid = (
-                sha256( session_uuid.encode() )
-                .hexdigest()
-            )
+        # Hasheo de la UUID de sesión
+        hashed_session_uuid = (
+            sha256( session_uuid.encode() )
+            .hexdigest()
+        )
 
-            # Búsqueda y lectura de la sesión
-            found: _Records[_found_session] = self._crud.search_read(
-                execution_ctx,
-                'base.user.session',
-                [('name', '=', hashed_session_uuid)],
-                [
-                    ('is_active_session', 'boolean', lambda ctx: ctx['expires_at'] > datetime.now()),
-                    ('user_id.id', 'uid'),
-                    ('user_id.active', 'user_is_active'),
-                ],
-            )
+        # Obtención de la sesión desde el caché
+        session = self._crud.get_cached_session(hashed_session_uuid)
+
+        # Si la sesión no se encuentra en el caché o su vigencia en éste terminó...
+        if session is None or monotonic() > session.cached_until:
+            # Búsqueda de la sesión en la base de datos
+            session = self._find_session(hashed_session_uuid, conn)
+
+            # Si la sesión no se leyó de una réplica que podría estar atrasada...
+            if not is_replica:
+                # Se guarda la sesión en el caché
+                self._crud.store_session(hashed_session_uuid, session)
+
+        # Si la sesión ya no está activa...
+        if session.expires_at <= datetime.now():
+            # Se arroja error de sesión expirada
+            raise ExpiredSessionError(ERROR_LABEL.EXPIRED_SESSION)
+
+        # Si el usuario no está activo...
+        if not session.user_is_active:
+            # Se arroja error de usuario desactivado
+            raise UserNotActiveError(ERROR_LABEL.USER_NOT_ACTIVE)
+
+        return session.uid
 
-            # Si no fue encontrado ningún registro de sesión de usuario...
-            if not found:
-                # Se arroja error de UUID de sesión inválida
-                raise InvalidSessionUUIDError(ERROR_LABEL.INVALID_SESSION_UUID)
+    def _authenticate_token(
+        self,
+        token: str,
+        conn: Connection,
+    ) -> int:
 
-            # Obtención del registro de sesión
-            [ session_record ] = found
+        # Lectura del token de sesión
+        claims = read_session_token(token, CONFIG.SESSION_TOKEN_SECRET)
 
-            # Obtención de datos de la sesión
-            is_active_session = session_record['is_active_session']
-            user_is_active = session_record['user_is_active']
-            uid = session_record['uid']
+        # Si el token no es válido...
+        if claims is None:
+            # Se arroja error de UUID de sesión inválida
+            raise InvalidSessionUUIDError(ERROR_LABEL.INVALID_SESSION_UUID)
 
-            # Si la sesión ya no está activa...
-            if not is_active_session:
-                # Se arroja error de sesión expirada
-                raise ExpiredSessionError(ERROR_LABEL.EXPIRED_SESSION)
+        # Obtención de los datos del token
+        ( uid, session_uuid, expires_at ) = claims
 
-            # Si el usuario no está activo...
-            if not user_is_active:
-                # Se arroja error de usuario desactivado
-                raise UserNotActiveError(ERROR_LABEL.USER_NOT_ACTIVE)
+        # Si la sesión ya no está activa...
+        if expires_at <= datetime.now():
+            # Se arroja error de sesión expirada
+            raise ExpiredSessionError(ERROR_LABEL.EXPIRED_SESSION)
 
-            return uid
+        # Hasheo de la UUID de sesión
+        hashed_session_uuid = (
+            sha256( session_uuid.encode() )
+            .hexdigest()
+        )
 
-        # Obtención de la UID de usuario autenticado
-        uid = self._connection.execute_complex(transaction)
+        # Si la sesión fue revocada...
+        if self._crud.is_session_revoked(hashed_session_uuid, lambda: self._find_revoked_sessions(conn)):
+            # Se arroja error de UUID de sesión inválida
+            raise InvalidSessionUUIDError(ERROR_LABEL.INVALID_SESSION_UUID)
 
         return uid
 
+    def _find_revoked_sessions(
+        self,
+        conn: Connection,
+    ) -> list[str]:
+
+        # Obtención de la fecha mínima de creación de sesiones con tokens vigentes
+        oldest_valid_date = datetime.now() - timedelta(days= CONFIG.SESSION_VALIDITY_DAYS)
+
+        # Construcción de query
+        stmt = (
+            select(Metadata.BaseUserSession.name)
+            .join(Metadata.BaseUsers, Metadata.BaseUserSession.user_id == Metadata.BaseUsers.id)
+            .where(
+                # Sesiones cuyos tokens aún podrían estar vigentes
+                Metadata.BaseUserSession.create_date > oldest_valid_date,
+                # Que fueron expiradas antes de tiempo o cuyo usuario fue desactivado
+                or_(
+                    Metadata.BaseUserSession.create_date + Metadata.BaseUserSession.validity_time <= datetime.now(),
+                    Metadata.BaseUsers.active == False,
+                ),
+            )
+            # Sesiones eliminadas cuyos tokens aún podrían estar vigentes
+            .union(
+                select(Metadata.BaseRevokedSession.name)
+                .where(Metadata.BaseRevokedSession.create_date > oldest_valid_date)
+            )
+        )
+
+        # Obtención de los nombres hasheados de sesiones revocadas
+        revoked_names = [ name for ( name, ) in self._transaction.search_read(stmt, conn) ]
+
+        return revoked_names
+
+    def _is_pinned_to_primary(
+        self,
+        session_uuid: str,
+    ) -> bool:
+
+        # Obtención del momento hasta el cual la sesión lee de la base de datos principal
+        pinned_until = self._pinned_sessions.get(session_uuid)
+
+        return pinned_until is not None and monotonic() < pinned_until
+
+    def _find_session(
+        self,
+        hashed_session_uuid: str,
+        conn: Connection,
+    ) -> CachedSession:
+
+        # Inicialización de contexto de ejecución
+        execution_ctx = self._create_execution_context(None, DATA_RESOURCE.ROOT_USER, conn)
+
+        # Búsqueda y lectura de la sesión
+        found: _Records[_found_session] = self._crud.search_read(
+            execution_ctx,
+            'base.user.session',
+            [('name', '=', hashed_session_uuid)],
+            [
+                'expires_at',
+                ('user_id.id', 'uid'),
+                ('user_id.active', 'user_is_active'),
+            ],
+        )
+
+        # Si no fue encontrado ningún registro de sesión de usuario...
+        if not found:
+            # Se arroja error de UUID de sesión inválida
+            raise InvalidSessionUUIDError(ERROR_LABEL.INVALID_SESSION_UUID)
+
+        # Obtención del registro de sesión
+        [ session_record ] = found
+
+        # Construcción de la sesión a guardar en caché
+        session = CachedSession(
+            uid= session_record['uid'],
+            expires_at= session_record['expires_at'],
+            user_is_active= session_record['user_is_active'],
+            cached_until= monotonic() + CONFIG.SESSION_CACHE_TTL,
+        )
+
+        return session
+
     def _load_from_built_database(
         self,
     ) -> None:
 
         # Obtención de metadatos de la base de datos
         self._get_metadata()
+        # Creación de la tabla de sesiones revocadas en bases de datos construidas sin ella
+        Metadata.BaseRevokedSession.__table__.create(self._connection._engine, checkfirst= True)
         # Inicialización de instancia en base a base de datos existente
         self._connection.execute_complex(self._ddl.rebuild_from_existing_database)
         # Inicialización de motores
@@ -612,6 +1086,7 @@ class Lylac(Generic[_M]):
         session_uuid: str,
         uid: int,
         conn: Connection,
+        is_replica: bool = False,
     ) -> _ExecutionContext[_M]:
 
         # Creación de un contexto de ejecución
@@ -629,6 +1104,8 @@ class Lylac(Generic[_M]):
             self._actions,
             self._server_tasks,
             self._user_env,
+            # Las decisiones derivadas de una réplica se conservan sólo en la ejecución
+            shares_caches= not is_replica,
         )
 
         return execution_ctx
@@ -1,3 +1,4 @@
+from hashlib import sha1
 from typing import Any
 from typing import Generic
 from typing import Sequence
@@ -10,6 +11,7 @@ from sqlalchemy import text
 from sqlalchemy.engine import Connection
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import class_mapper
+from .._constants import ERROR_LABEL
 from .._constants import FACTORY_FIELDS
 from .._constants import FACTORY_MODELS
 from .._constants import FIELD_NAME
@@ -60,6 +62,8 @@ class DDL(Generic[_M]):
         self._models_bearer = models_bearer
         self._database_metadata = database_metadata
         self._base = _Base
+        # Inicialización de conjunto de índices únicos asegurados
+        self._unique_indexes: set[tuple[str, tuple[str, ...]]] = set()
 
         # Inicialización de mapa de funciones de construcción de instancias de campo
         self._initialize_columns_builder()
@@ -146,6 +150,65 @@ class DDL(Generic[_M]):
 
         conn.execute(main_query)
 
+    def ensure_unique_index(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        field_names: list[str],
+    ) -> None:
+
+        # Obtención de la tabla del modelo
+        table = self._models_bearer.get_model(model_name).__table__
+        # Obtención de los campos ordenados para identificar el índice
+        sorted_field_names = tuple( sorted(field_names) )
+
+        # Si algún campo no es una columna de la tabla...
+        if any( field_name not in table.c for field_name in sorted_field_names ):
+            # Se arroja error
+            raise AssertionError(ERROR_LABEL.UNKNOWN_COLUMN)
+
+        # Construcción de la llave del índice
+        index_key = ( table.name, sorted_field_names )
+
+        # Si el índice ya fue asegurado previamente...
+        if index_key in self._unique_indexes:
+            # Se termina la ejecución
+            return
+
+        # Si el único campo ya es llave primaria o ya es único...
+        if len(sorted_field_names) == 1 and ( table.c[sorted_field_names[0]].primary_key or table.c[sorted_field_names[0]].unique ):
+            # Se registra el índice como asegurado
+            self._unique_indexes.add(index_key)
+            # Se termina la ejecución
+            return
+
+        # Obtención del preparador de identificadores del dialecto
+        preparer = execution_ctx.conn.dialect.identifier_preparer
+        # Obtención de la longitud máxima de identificadores
+        max_length = execution_ctx.conn.dialect.max_identifier_length
+
+        # Construcción del nombre del índice
+        index_name = f'{table.name}__{"__".join(sorted_field_names)}__uniq'
+
+        # Si el nombre excede la longitud máxima...
+        if len(index_name) > max_length:
+            # Obtención de un resumen estable del nombre completo
+            digest = sha1(index_name.encode()).hexdigest()[:10]
+            # Se acorta el nombre conservando el resumen para evitar colisiones
+            index_name = f'{index_name[:max_length - 11]}_{digest}'
+
+        # Construcción de las columnas citadas del índice
+        quoted_columns = ', '.join( preparer.quote(table.c[field_name].name) for field_name in sorted_field_names )
+
+        # Construcción de query de creación del índice único en caso de no existir
+        query = text(f'CREATE UNIQUE INDEX IF NOT EXISTS {preparer.quote(index_name)} ON {preparer.format_table(table)} ({quoted_columns});')
+
+        # Ejecución del query
+        execution_ctx.conn.execute(query)
+
+        # Se registra el índice como asegurado tras el commit
+        execution_ctx.run_after_commit(lambda _: self._unique_indexes.add(index_key))
+
     def drop_column(
         self,
         conn: Connection,
@@ -1,13 +1,36 @@
+import csv
+import json
+from datetime import datetime
+from datetime import timedelta
+from io import StringIO
+from typing import Any
 from typing import Generic
+from typing import Optional
 from typing import Sequence
 from typing import TYPE_CHECKING
 from sqlalchemy import insert
 from sqlalchemy import update
 from sqlalchemy import delete
+from sqlalchemy import cast
+from sqlalchemy import column
+from sqlalchemy import values
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import Column
+from sqlalchemy import Table
+from sqlalchemy import literal_column
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import Select
+from .._constants import ERROR_LABEL
 from .._constants import FIELD_NAME
+from .._core import Metadata
 from .._typing.generics import ModelName
 from .._typing.structures import RecordData
 from .._typing.type_parameters import _M
+from ..settings import CONFIG
 
 if TYPE_CHECKING:
     from .._contexts import ExecutionContext
@@ -28,34 +51,334 @@ class DML(Generic[_M]):
         # Obtención de la instancia de ID de campo del modelo de creación de datos
         id_instance_field = execution_ctx.models_bearer.get_field_instance(model_name, FIELD_NAME.ID)
 
-        # Inicialización de lista de IDs creadas
-        created_ids: list[int] = []
+        # Captación de comandos de operaciones de relación y creación de funciones de captación de ID en el orden de entrada
+        capture_created_id_fns = [ rel_op_ctx.capture_relation_commands(record_data) for record_data in data ]
 
+        # Inicialización de índices de registros agrupados por conjunto de campos
+        indices_per_keys: dict[tuple[str, ...], list[int]] = {}
         # Iteración por cada diccionario de registro
-        for record_data in data:
-            # Captación de comandos de operaciones de relación y creación de función de captación de ID
-            capture_created_id_fn = rel_op_ctx.capture_relation_commands(record_data)
-            # Construcción de query
-            stmt_i = (
-                # Crear en el modelo...
-                insert(model_model)
-                # Usando los valores...
-                .values(**record_data)
-                # Retornando IDs de registros creados
-                .returning(id_instance_field)
+        for ( i, record_data ) in enumerate(data):
+            # Se agrupa el índice del registro por su conjunto de campos
+            indices_per_keys.setdefault(tuple( sorted(record_data) ), []).append(i)
+
+        # Construcción de query
+        stmt = (
+            # Crear en el modelo...
+            insert(model_model)
+            # Retornando IDs de registros creados en el orden de los parámetros
+            .returning(id_instance_field, sort_by_parameter_order= True)
+            # En sentencias de múltiples filas del tamaño de lote configurado
+            .execution_options(insertmanyvalues_page_size= CONFIG.INSERT_BATCH_SIZE)
+        )
+
+        # Inicialización de lista de IDs creadas en el orden de entrada
+        created_ids: list[int] = [None] * len(data)
+
+        # Iteración por cada grupo de registros con el mismo conjunto de campos
+        for indices in indices_per_keys.values():
+            # Creación de los registros del grupo y obtención de las IDs creadas
+            group_created_ids: Sequence[int] = (
+                execution_ctx.conn
+                .execute(stmt, [ data[i] for i in indices ])
+                .scalars()
+                .all()
             )
 
-            # Obtención de la ID creada
-            [ ( created_id, ) ] = execution_ctx.conn.execute(stmt_i).fetchall()
+            # Iteración por cada índice de entrada y su ID creada
+            for ( i, created_id ) in zip(indices, group_created_ids):
+                # Asignación de la ID creada a su posición de entrada
+                created_ids[i] = created_id
 
+        # Iteración por cada función de captación de ID y su ID creada
+        for ( capture_created_id_fn, created_id ) in zip(capture_created_id_fns, created_ids):
             # Ejecución de operaciones de relación
             capture_created_id_fn(created_id)
 
-            # Se añade la ID creada a la list a retornar
-            created_ids.append(created_id)
+        return created_ids
+
+    def upsert(
+        self,
+        rel_op_ctx: RelationOperationsContext[_M],
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data: list[RecordData],
+        conflict_fields: list[str],
+        update_fields: list[str],
+    ) -> list[tuple[int, bool]]:
+
+        # Obtención del modelo de creación de datos
+        model_model = execution_ctx.models_bearer.get_model(model_name)
+        # Obtención de la instancia de ID de campo del modelo de creación de datos
+        id_instance_field = execution_ctx.models_bearer.get_field_instance(model_name, FIELD_NAME.ID)
+
+        # Captación de comandos de operaciones de relación y creación de funciones de captación de ID en el orden de entrada
+        capture_created_id_fns = [ rel_op_ctx.capture_relation_commands(record_data) for record_data in data ]
+
+        # Inicialización de índices de registros agrupados por conjunto de campos
+        indices_per_keys: dict[tuple[str, ...], list[int]] = {}
+        # Iteración por cada diccionario de registro
+        for ( i, record_data ) in enumerate(data):
+            # Se agrupa el índice del registro por su conjunto de campos
+            indices_per_keys.setdefault(tuple( sorted(record_data) ), []).append(i)
+
+        # Inicialización de lista de IDs e indicadores de inserción en el orden de entrada
+        results: list[tuple[int, bool]] = [None] * len(data)
+
+        # Iteración por cada grupo de registros con el mismo conjunto de campos
+        for ( field_names, indices ) in indices_per_keys.items():
+            # Inicialización de sentencia de inserción
+            stmt = pg_insert(model_model)
+
+            # Construcción de los campos a modificar en caso de conflicto
+            set_ = {
+                field_name: stmt.excluded[field_name]
+                for field_name in field_names
+                if field_name in update_fields or field_name == FIELD_NAME.UPDATE_UID
+            }
+
+            # Si el modelo registra la fecha de modificación...
+            if FIELD_NAME.UPDATE_DATE in stmt.excluded:
+                # Se actualiza ésta ya que ON CONFLICT DO UPDATE no aplica el valor de modificación de la columna
+                set_[FIELD_NAME.UPDATE_DATE] = stmt.excluded[FIELD_NAME.UPDATE_DATE]
+
+            # Construcción de query
+            stmt = (
+                # En caso de conflicto en los campos provistos se modifica el registro existente
+                stmt.on_conflict_do_update(
+                    index_elements= conflict_fields,
+                    set_= set_,
+                )
+                # Retornando IDs e indicador de inserción (xmax = 0 indica que la fila no fue modificada) en el orden de los parámetros
+                .returning(
+                    id_instance_field,
+                    ( literal_column('xmax') == 0 ).label('inserted'),
+                    sort_by_parameter_order= True,
+                )
+                # En sentencias de múltiples filas del tamaño de lote configurado
+                .execution_options(insertmanyvalues_page_size= CONFIG.INSERT_BATCH_SIZE)
+            )
+
+            # Ejecución del query
+            result: Sequence[tuple[int, bool]] = (
+                execution_ctx.conn
+                .execute(stmt, [ data[i] for i in indices ])
+                .fetchall()
+            )
+
+            # Iteración por cada índice de entrada y su resultado
+            for ( i, ( record_id, inserted ) ) in zip(indices, result):
+                # Asignación del resultado a su posición de entrada
+                results[i] = ( record_id, inserted )
+
+        # Iteración por cada función de captación de ID y su resultado
+        for ( capture_created_id_fn, ( record_id, _ ) ) in zip(capture_created_id_fns, results):
+            # Ejecución de operaciones de relación
+            capture_created_id_fn(record_id)
+
+        return results
+
+    def find_out_of_scope_conflicts(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data: list[RecordData],
+        conflict_fields: list[str],
+        scope: Select[tuple[int]],
+    ) -> list[int]:
+
+        # Obtención de la instancia de ID de campo del modelo
+        id_instance_field = execution_ctx.models_bearer.get_field_instance(model_name, FIELD_NAME.ID)
+        # Obtención de las instancias de los campos de conflicto
+        conflict_instance_fields = [
+            execution_ctx.models_bearer.get_field_instance(model_name, field_name)
+            for field_name in conflict_fields
+        ]
+
+        # Construcción de query
+        stmt = (
+            select(id_instance_field)
+            .where(
+                # Registros existentes con los mismos valores en los campos de conflicto...
+                tuple_(*conflict_instance_fields).in_([
+                    tuple( record_data[field_name] for field_name in conflict_fields )
+                    for record_data in data
+                ]),
+                # ... que se encuentran fuera del alcance del usuario
+                id_instance_field.not_in(scope.correlate(None)),
+            )
+        )
+
+        # Obtención de las IDs fuera del alcance
+        out_of_scope_ids: list[int] = list(
+            execution_ctx.conn
+            .execute(stmt)
+            .scalars()
+            .all()
+        )
+
+        return out_of_scope_ids
+
+    def copy(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data: list[RecordData],
+    ) -> list[int]:
+
+        # Si no hay registros a cargar...
+        if not data:
+            # Se termina la ejecución
+            return []
+
+        # Obtención de la tabla del modelo
+        table: Table = execution_ctx.models_bearer.get_model(model_name).__table__
+        # Obtención del formateador de identificadores del dialecto
+        preparer = execution_ctx.conn.dialect.identifier_preparer
+
+        # Obtención de las columnas cargables por nombre
+        loadable_columns = { column.name: column for column in table.columns if column.name != FIELD_NAME.ID }
+        # Obtención de los campos provistos que no son columnas cargables
+        unknown_fields = { field_name for record_data in data for field_name in record_data } - loadable_columns.keys()
+
+        # Si se proporcionaron campos que no son columnas (como comandos de relación)...
+        if unknown_fields:
+            # Se arroja error
+            raise AssertionError(f'{ERROR_LABEL.UNKNOWN_COLUMN} {sorted(unknown_fields)}')
+
+        # Reserva de IDs desde la secuencia del modelo
+        created_ids = self._reserve_ids(execution_ctx, table, len(data))
+
+        # Inicialización de índices de registros agrupados por conjunto de campos
+        indices_per_keys: dict[tuple[str, ...], list[int]] = {}
+        # Iteración por cada diccionario de registro
+        for ( i, record_data ) in enumerate(data):
+            # Se agrupa el índice del registro por su conjunto de campos
+            indices_per_keys.setdefault(tuple( sorted(record_data) ), []).append(i)
+
+        # Iteración por cada grupo de registros con el mismo conjunto de campos
+        for ( keys, indices ) in indices_per_keys.items():
+            # Obtención de columnas a cargar incluyendo las que tienen valor predeterminado en Python
+            # para que las omitidas en el grupo tomen el valor predeterminado del servidor
+            columns = [
+                column
+                for column in loadable_columns.values()
+                if column.name in keys or self._has_python_default(column)
+            ]
+
+            # Inicialización de búfer CSV en memoria para el grupo
+            buffer = StringIO()
+            # Inicialización de escritor CSV que deja sin comillas únicamente los valores nulos
+            writer = csv.writer(buffer, quoting= csv.QUOTE_NOTNULL)
+
+            # Iteración por cada índice de registro del grupo
+            for i in indices:
+                # Obtención de los datos del registro
+                record_data = data[i]
+                # Escritura de la fila con los valores convertidos a texto de COPY
+                writer.writerow([
+                    created_ids[i],
+                    *(
+                        self._to_copy_value(
+                            record_data[column.name]
+                            if column.name in record_data
+                            else self._get_column_default(column)
+                        )
+                        for column in columns
+                    ),
+                ])
+
+            # Se regresa el búfer al inicio para su lectura
+            buffer.seek(0)
+
+            # Construcción de la sentencia COPY
+            copy_sql = (
+                f'COPY {preparer.format_table(table)} '
+                f'({", ".join( preparer.quote(name) for name in [FIELD_NAME.ID, *( column.name for column in columns )] )}) '
+                'FROM STDIN WITH (FORMAT csv)'
+            )
+
+            # Obtención de cursor de la conexión DBAPI de la transacción en curso
+            with execution_ctx.conn.connection.cursor() as cursor:
+                # Carga de las filas
+                cursor.copy_expert(copy_sql, buffer)
 
         return created_ids
 
+    def _reserve_ids(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        table: Table,
+        count: int,
+    ) -> list[int]:
+
+        # Obtención del nombre de la secuencia de IDs de la tabla
+        sequence_name = func.pg_get_serial_sequence(table.fullname, FIELD_NAME.ID)
+
+        # Construcción de query
+        stmt = (
+            select( func.nextval(sequence_name) )
+            .select_from( func.generate_series(1, count) )
+        )
+
+        # Obtención de las IDs reservadas
+        reserved_ids: list[int] = list(
+            execution_ctx.conn
+            .execute(stmt)
+            .scalars()
+            .all()
+        )
+
+        return reserved_ids
+
+    def _has_python_default(
+        self,
+        column: Column,
+    ) -> bool:
+
+        # Obtención del valor predeterminado de la columna
+        default = column.default
+
+        return default is not None and ( default.is_scalar or default.is_callable )
+
+    def _get_column_default(
+        self,
+        column: Column,
+    ) -> Any:
+
+        # Obtención del valor predeterminado de la columna
+        default = column.default
+
+        # Si la columna no tiene valor predeterminado en Python...
+        if not self._has_python_default(column):
+            # Se carga como nulo
+            return None
+
+        # Si el valor predeterminado es una función...
+        if default.is_callable:
+            # Se evalúa la función
+            return default.arg(None)
+
+        return default.arg
+
+    def _to_copy_value(
+        self,
+        value: Any,
+    ) -> Any:
+
+        # Si el valor es un diccionario o lista se serializa como JSON
+        if isinstance(value, ( dict, list )):
+            return json.dumps(value, default= str)
+
+        # Si el valor es una duración se expresa en segundos
+        if isinstance(value, timedelta):
+            return f'{value.total_seconds()} seconds'
+
+        # Si el valor es binario se expresa en formato hexadecimal
+        if isinstance(value, ( bytes, bytearray, memoryview )):
+            return '\\x' + bytes(value).hex()
+
+        return value
+
     def update(
         self,
         rel_op_ctx: RelationOperationsContext[_M],
@@ -63,6 +386,7 @@ class DML(Generic[_M]):
         model_name: ModelName[_M],
         record_ids: list[int],
         data: RecordData,
+        scope: Optional[Select[tuple[int]]] = None,
     ) -> list[int]:
 
         # Obtención del modelo de creación de datos
@@ -73,10 +397,13 @@ class DML(Generic[_M]):
         # Captación de comandos de operaciones de relación y creación de función de captación de ID
         capture_created_id_fn = rel_op_ctx.capture_relation_commands(data)
 
+        # Construcción de las condiciones de modificación
+        conditions = self._build_scoped_conditions(id_instance_field, record_ids, scope)
+
         # Construcción de query
         stmt = (
             update(model_model)
-            .where(id_instance_field.in_(record_ids))
+            .where(*conditions)
             .values(data)
             .returning(id_instance_field)
         )
@@ -94,11 +421,103 @@ class DML(Generic[_M]):
 
         return updated_ids
 
+    def update_many(
+        self,
+        rel_op_ctx: RelationOperationsContext[_M],
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data_per_id: dict[int, RecordData],
+        scope: Optional[Select[tuple[int]]] = None,
+    ) -> list[int]:
+
+        # Obtención del modelo de modificación de datos
+        model_model = execution_ctx.models_bearer.get_model(model_name)
+        # Obtención de la tabla del modelo
+        table: Table = model_model.__table__
+        # Obtención de la instancia de ID de campo del modelo de modificación de datos
+        id_instance_field = execution_ctx.models_bearer.get_field_instance(model_name, FIELD_NAME.ID)
+
+        # Captación de comandos de operaciones de relación y creación de funciones de captación de ID por registro
+        capture_updated_id_fns = {
+            record_id: rel_op_ctx.capture_relation_commands(record_data)
+            for ( record_id, record_data ) in data_per_id.items()
+        }
+
+        # Obtención de los campos provistos que no son columnas de la tabla
+        unknown_fields = { field_name for record_data in data_per_id.values() for field_name in record_data } - set( table.c.keys() )
+
+        # Si se proporcionaron campos que no son columnas...
+        if unknown_fields:
+            # Se arroja error
+            raise AssertionError(f'{ERROR_LABEL.UNKNOWN_COLUMN} {sorted(unknown_fields)}')
+
+        # Inicialización de IDs de registros agrupadas por conjunto de campos
+        ids_per_keys: dict[tuple[str, ...], list[int]] = {}
+        # Iteración por cada ID y diccionario de registro
+        for ( record_id, record_data ) in data_per_id.items():
+            # Se agrupa la ID del registro por su conjunto de campos
+            ids_per_keys.setdefault(tuple( sorted(record_data) ), []).append(record_id)
+
+        # Inicialización de lista de IDs modificadas
+        updated_ids: list[int] = []
+
+        # Iteración por cada grupo de registros con el mismo conjunto de campos
+        for ( field_names, record_ids ) in ids_per_keys.items():
+            # Iteración por cada lote del grupo
+            for start in range(0, len(record_ids), CONFIG.UPDATE_BATCH_SIZE):
+                # Obtención de las IDs del lote
+                batch_ids = record_ids[start:start + CONFIG.UPDATE_BATCH_SIZE]
+
+                # Construcción de la tabla de valores del lote
+                values_table = (
+                    values(
+                        column(FIELD_NAME.ID, table.c[FIELD_NAME.ID].type),
+                        *( column(field_name, table.c[field_name].type) for field_name in field_names ),
+                        name= 'incoming',
+                    )
+                    .data([
+                        ( record_id, *( data_per_id[record_id][field_name] for field_name in field_names ) )
+                        for record_id in batch_ids
+                    ])
+                )
+
+                # Construcción de las condiciones de modificación
+                conditions = self._build_scoped_conditions(id_instance_field, batch_ids, scope)
+
+                # Construcción de query
+                stmt = (
+                    update(model_model)
+                    .where(
+                        id_instance_field == values_table.c[FIELD_NAME.ID],
+                        *conditions,
+                    )
+                    .values({
+                        # Conversión explícita al tipo de la columna ya que los literales de VALUES se infieren como texto
+                        field_name: cast(values_table.c[field_name], table.c[field_name].type)
+                        for field_name in field_names
+                    })
+                    .returning(id_instance_field)
+                )
+
+                # Obtención del resultado de la modificación
+                result: Sequence[tuple[int]] = execution_ctx.conn.execute(stmt).fetchall()
+
+                # Se añaden las IDs modificadas
+                updated_ids.extend( record_id for ( record_id, ) in result )
+
+        # Iteración por cada registro modificado
+        for updated_id in updated_ids:
+            # Captura de ID
+            capture_updated_id_fns[updated_id](updated_id)
+
+        return updated_ids
+
     def delete(
         self,
         execution_ctx: ExecutionContext[_M],
         model_name: ModelName[_M],
         record_ids: list[int],
+        scope: Optional[Select[tuple[int]]] = None,
     ) -> list[int]:
 
         # Obtención del modelo de creación de datos
@@ -106,10 +525,13 @@ class DML(Generic[_M]):
         # Obtención de la instancia de ID de campo del modelo de creación de datos
         id_instance_field = execution_ctx.models_bearer.get_field_instance(model_name, FIELD_NAME.ID)
 
+        # Construcción de las condiciones de eliminación
+        conditions = self._build_scoped_conditions(id_instance_field, record_ids, scope)
+
         # Construcción de query
         stmt = (
             delete(model_model)
-            .where(id_instance_field.in_(record_ids))
+            .where(*conditions)
             .returning(id_instance_field)
         )
 
@@ -120,3 +542,53 @@ class DML(Generic[_M]):
         deleted_ids = [deleted_id for ( deleted_id, ) in result]
 
         return deleted_ids
+
+    def revoke_sessions(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        hashed_session_uuids: list[str],
+    ) -> None:
+
+        # Si no hay sesiones a revocar...
+        if not hashed_session_uuids:
+            # Se termina la ejecución
+            return
+
+        # Obtención del modelo de sesiones revocadas
+        revoked_model = Metadata.BaseRevokedSession
+
+        # Obtención de la fecha mínima de revocación que aún puede afectar tokens vigentes
+        oldest_valid_date = datetime.now() - timedelta(days= CONFIG.SESSION_VALIDITY_DAYS)
+
+        # Depuración de revocaciones cuyos tokens ya expiraron
+        execution_ctx.conn.execute(
+            delete(revoked_model)
+            .where(revoked_model.create_date <= oldest_valid_date)
+        )
+
+        # Construcción de query
+        stmt = (
+            pg_insert(revoked_model)
+            .values([ { FIELD_NAME.NAME: name } for name in hashed_session_uuids ])
+            .on_conflict_do_nothing()
+        )
+
+        # Ejecución del query
+        execution_ctx.conn.execute(stmt)
+
+    def _build_scoped_conditions(
+        self,
+        id_instance_field: InstrumentedAttribute[int],
+        record_ids: list[int],
+        scope: Optional[Select[tuple[int]]],
+    ) -> list[ColumnElement[bool]]:
+
+        # Inicialización de condiciones con las IDs solicitadas
+        conditions = [id_instance_field.in_(record_ids)]
+
+        # Si se proporcionó una consulta de alcance...
+        if scope is not None:
+            # Se restringen las IDs a las contenidas en el alcance sin correlacionarlo con la tabla modificada
+            conditions.append(id_instance_field.in_(scope.correlate(None)))
+
+        return conditions
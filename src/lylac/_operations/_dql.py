@@ -1,23 +1,51 @@
+import operator
+from typing import Any
+from typing import Callable
 from typing import Generic
+from typing import Iterator
 from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
+from typing import Union
+from sqlalchemy import and_
 from sqlalchemy import asc
+from sqlalchemy import cast
 from sqlalchemy import desc
+from sqlalchemy import false
 from sqlalchemy import select
 from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import literal_column
+from sqlalchemy import or_
+from sqlalchemy import tuple_
+from sqlalchemy import types
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import Select
+from .._constants import ERROR_LABEL
 from .._constants import FIELD_NAME
+from .._contexts import ComputeContext
 from .._contexts import FrameContext
 from .._contexts import WhereContext
+from .._resources import FieldTarget
 from .._resources import InputProcessing
 from .._resources import OutputParser
+from .._resources import Page
 from .._typing.generics import ItemOrList
 from .._typing.generics import ModelName
+from .._typing.generics import _Columns
 from .._typing.generics import _Record
+from .._typing.literals import AggFuncName
+from .._typing.literals import OutputMode
 from .._typing.structures import CriteriaStructure
 from .._typing.structures import FrameReadField
 from .._typing.type_parameters import _M
+from .._utils import decode_cursor
+from .._utils import encode_cursor
 from .._utils import to_list
+from ..errors import InvalidCursorError
+from ..settings import CONFIG
 
 if TYPE_CHECKING:
     from .._contexts import ExecutionContext
@@ -27,6 +55,21 @@ class DQL(Generic[_M]):
         True: asc,
         False: desc,
     }
+    _keyset_label = 'keyset_{}'
+    _count_label = 'total_count'
+    _group_label = 'group_{}'
+    _aggregate_label = 'aggregate_{}'
+    _count_key = '__count'
+    _granularity_separator = ':'
+    _date_granularities = ('hour', 'day', 'week', 'month', 'quarter', 'year')
+    _having_operators: dict[str, Callable[[ColumnElement, Any], ColumnElement[bool]]] = {
+        '=': operator.eq,
+        '!=': operator.ne,
+        '>': operator.gt,
+        '>=': operator.ge,
+        '<': operator.lt,
+        '<=': operator.le,
+    }
 
     def __init__(
         self,
@@ -42,67 +85,89 @@ class DQL(Generic[_M]):
         search_criteria: CriteriaStructure = [],
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
     ) -> list[int]:
 
-        # Inicialización de contexto de frame
-        frame_ctx = self._create_frame_context(execution_ctx, model_name)
-        # Inicialización de contexto de filtro
-        where_ctx = self._create_filter_context(frame_ctx)
-
-        # Inicialización de objetivos de campo
-        id_field_target = frame_ctx.create_field_target(FIELD_NAME.ID)
-
-        # Obtención de instancia(s) de campo
-        [ id_field_instance ] = frame_ctx.get_field_instances_from_target(id_field_target)
-
-        # Obtención de modelo de origen desde el contexto de frame
-        origin_model = frame_ctx.origin_model
-
-        # Inicialización de query
-        stmt = (
-            select(id_field_instance)
-            .select_from(origin_model)
+        # Construcción de query de búsqueda
+        ( stmt, _ ) = self._build_search_statement(
+            execution_ctx,
+            model_name,
+            search_criteria,
+            offset,
+            limit,
+            sortby,
+            ascending,
+            after,
         )
 
-        # Si se proporcionó un criterio de búsqueda
-        if search_criteria:
-
-            # Construcción de las condiciones de búsqueda en SQL
-            conditions = where_ctx.build_conditions(search_criteria)
-            # Asignación del criterio de búsqueda
-            stmt = stmt.where(conditions)
+        # Ejecución de query
+        records_data: list[tuple[int]] = (
+            execution_ctx.conn
+            .execute(stmt)
+            .fetchall()
+        )
 
-        # Obtención de los outerjoins
-        for outerjoin in frame_ctx.outerjoins:
-            # Obtención de modelo a relacionar
-            target_model = outerjoin.model
-            # Obtención de clausula de unión
-            on = outerjoin.on
+        # Obtención de los datos formateados
+        record_ids = self._output_parser.ids_from_database(records_data)
 
-            # Se añade el LEFT JOIN al query
-            stmt = stmt.outerjoin(target_model, on)
+        return record_ids
 
-        # Si un valor de desfase fue provisto...
-        if offset:
-            # Se añade éste al query
-            stmt = stmt.offset(offset)
+    def search_page(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[int]:
 
-        # Si un valor de límite fue provisto...
-        if limit:
-            # Se añade éste al query
-            stmt = stmt.limit(limit)
+        # Construcción de query de búsqueda con columnas de llave de paginación
+        ( stmt, keyset_size ) = self._build_search_statement(
+            execution_ctx,
+            model_name,
+            search_criteria,
+            None,
+            limit,
+            sortby,
+            ascending,
+            after,
+            paginate= True,
+        )
 
         # Ejecución de query
-        records_data: list[tuple[int]] = (
+        records_data = (
             execution_ctx.conn
             .execute(stmt)
             .fetchall()
         )
 
-        # Obtención de los datos formateados
-        record_ids = self._output_parser.ids_from_database(records_data)
+        # Construcción de la página
+        page = Page(
+            records= self._output_parser.ids_from_database(records_data),
+            next_cursor= self._build_next_cursor(records_data, keyset_size, limit),
+        )
 
-        return record_ids
+        return page
+
+    def build_search_statement(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+    ) -> Select[tuple[int]]:
+
+        # Construcción de query de búsqueda
+        ( stmt, _ ) = self._build_search_statement(
+            execution_ctx,
+            model_name,
+            search_criteria,
+        )
+
+        return stmt
 
     def read(
         self,
@@ -180,33 +245,307 @@ class DQL(Generic[_M]):
         limit: Optional[int] = None,
         sortby: Optional[ItemOrList[str]] = None,
         ascending: Optional[ItemOrList[bool]] = None,
-    ) -> list[_Record]:
+        after: Optional[str] = None,
+        with_count: bool = False,
+        count_limit: Optional[int] = None,
+        output: OutputMode = 'records',
+    ) -> Union[ list[_Record], _Columns, tuple[Union[ list[_Record], _Columns ], int] ]:
+
+        # Construcción del query y obtención de los objetivos de campo
+        ( stmt, field_targets_to_read, _ ) = self._build_search_read_statement(
+            execution_ctx,
+            model_name,
+            search_criteria,
+            fields,
+            offset,
+            limit,
+            sortby,
+            ascending,
+            after,
+            with_count= with_count,
+            count_limit= count_limit,
+        )
+
+        # Ejecución de query
+        records_data = (
+            execution_ctx.conn
+            .execute(stmt)
+            .fetchall()
+        )
+
+        # Si se solicitó la salida por columnas...
+        if output == 'columns':
+            # Formateo de los datos de salida por columna
+            output_data = self._output_parser.columns_from_database(records_data, field_targets_to_read)
+        # Si se solicitó la salida por registros...
+        else:
+            # Formateo de los datos de salida
+            output_data = self._output_parser.records_from_database(records_data, field_targets_to_read)
+
+        # Si no se solicitó el conteo total...
+        if not with_count:
+            return output_data
+
+        # Si se obtuvieron registros...
+        if records_data:
+            # Obtención del conteo total desde la primera fila
+            total: int = getattr(records_data[0], self._count_label)
+        # Si no se obtuvieron registros por el desfase o el cursor...
+        elif offset or after is not None:
+            # Obtención del conteo total acotado en un query aparte
+            total = self.search_count(execution_ctx, model_name, search_criteria, count_limit)
+        # Si no se obtuvieron registros sin desfase ni cursor no existen registros
+        else:
+            total = 0
+
+        return ( output_data, total )
+
+    def search_read_page(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FrameReadField] = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[_Record]:
+
+        # Construcción del query con columnas de llave de paginación y obtención de los objetivos de campo
+        ( stmt, field_targets_to_read, keyset_size ) = self._build_search_read_statement(
+            execution_ctx,
+            model_name,
+            search_criteria,
+            fields,
+            None,
+            limit,
+            sortby,
+            ascending,
+            after,
+            paginate= True,
+        )
+
+        # Ejecución de query
+        records_data = (
+            execution_ctx.conn
+            .execute(stmt)
+            .fetchall()
+        )
+
+        # Construcción de la página
+        page = Page(
+            records= self._output_parser.records_from_database(records_data, field_targets_to_read),
+            next_cursor= self._build_next_cursor(records_data, keyset_size, limit),
+        )
+
+        return page
+
+    def iter_search_read(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FrameReadField] = [],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[list[_Record]]:
+
+        # Construcción del query y obtención de los objetivos de campo
+        ( stmt, field_targets_to_read, _ ) = self._build_search_read_statement(
+            execution_ctx,
+            model_name,
+            search_criteria,
+            fields,
+            offset,
+            limit,
+            sortby,
+            ascending,
+        )
+
+        # Se indica la lectura por lotes a través de un cursor del lado del servidor
+        stmt = stmt.execution_options(yield_per= chunk_size or CONFIG.STREAM_CHUNK_SIZE)
+
+        # Ejecución de query
+        result = execution_ctx.conn.execute(stmt)
+
+        # Iteración por cada lote de filas recibido del servidor
+        for records_data in result.partitions():
+            # Formateo de los datos de salida del lote
+            yield self._output_parser.records_from_database(records_data, field_targets_to_read)
+
+    def search_count(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        count_limit: Optional[int] = None,
+    ) -> int:
 
         # Inicialización de contexto de frame
         frame_ctx = self._create_frame_context(execution_ctx, model_name)
         # Inicialización de contexto de filtro
         where_ctx = self._create_filter_context(frame_ctx)
 
-        # Normalización de campos
-        normalized_fields = self._normalize_fields(execution_ctx, model_name, fields)
+        # Obtención de la instancia de ID
+        id_field_instance = frame_ctx.get_physical_field_instance_from_current(FIELD_NAME.ID)
 
-        # Inicialización de objetivos de campo
-        field_targets_to_read = [frame_ctx.create_field_target(field) for field in normalized_fields]
+        # Construcción del query de conteo
+        stmt = (
+            select(
+                func.count(id_field_instance)
+            )
+            .select_from(frame_ctx.origin_model)
+        )
 
-        # Inicialización de instancias de campos a leer
-        field_instances_to_read: list[InstrumentedAttribute] = []
+        # Si se proporcionó un criterio de búsqueda
+        if search_criteria:
 
-        # Iteración por cada objetivo de campo
-        for field_target in field_targets_to_read:
-            # Obtención de instancia(s) de campo
-            field_instances = frame_ctx.get_field_instances_from_target(field_target)
+            # Construcción de las condiciones de búsqueda en SQL
+            conditions = where_ctx.build_conditions(search_criteria)
+            # Asignación del criterio de búsqueda
+            stmt = stmt.where(conditions)
 
-            # Se añaden a la lista
-            field_instances_to_read += field_instances
+        # Obtención de los outerjoins
+        for outerjoin in frame_ctx.outerjoins:
+            # Obtención de modelo a relacionar
+            target_model = outerjoin.model
+            # Obtención de clausula de unión
+            on = outerjoin.on
+
+            # Se añade el LEFT JOIN al query
+            stmt = stmt.outerjoin(target_model, on)
+
+        # Si se especificó un tope de conteo...
+        if count_limit:
+            # El conteo se calcula sobre un subquery acotado al tope
+            stmt = (
+                select( func.count() )
+                .select_from(
+                    stmt
+                    .with_only_columns(id_field_instance)
+                    .limit(count_limit)
+                    .subquery()
+                )
+            )
+
+        # Ejecución de query
+        count = (
+            execution_ctx.conn
+            .execute(stmt)
+            .scalar()
+        )
+
+        return count
+
+    def read_group(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        groupby: ItemOrList[str] = [],
+        aggregates: dict[str, AggFuncName] = {},
+        having: list[tuple[str, str, Any]] = [],
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[_Record]:
+
+        # Inicialización de contexto de frame
+        frame_ctx = self._create_frame_context(execution_ctx, model_name)
+        # Inicialización de contexto de filtro
+        where_ctx = self._create_filter_context(frame_ctx)
+
+        # Inicialización de objetivos de campo de agrupación
+        group_field_targets: list[FieldTarget] = []
+        # Inicialización de columnas de agrupación
+        group_columns: list[ColumnElement] = []
+        # Inicialización de etiquetas de valores adicionales por llave de salida
+        value_labels: dict[str, str] = {}
+        # Inicialización de expresiones ordenables por llave de salida
+        sortable_expressions: dict[str, ColumnElement] = {}
+
+        # Iteración por cada declaración de agrupación
+        for group_declaration in to_list(groupby):
+            # Obtención del nombre del campo y la granularidad de fecha en caso de existir
+            ( field_name, _, granularity ) = group_declaration.partition(self._granularity_separator)
+
+            # Si se especificó una granularidad de fecha...
+            if granularity:
+                # Si la granularidad no es válida...
+                if granularity not in self._date_granularities:
+                    # Se arroja error
+                    raise AssertionError(f'{ERROR_LABEL.INVALID_DATE_GRANULARITY} [{granularity}]')
+
+                # Obtención de la instancia de campo
+                [ field_instance ] = frame_ctx.get_field_instances(field_name)
+                # Construcción del intervalo truncado
+                bucket = func.date_trunc(granularity, field_instance)
+
+                # Si la granularidad es de un día o más...
+                if granularity != 'hour':
+                    # Se expresa el intervalo como fecha
+                    bucket = cast(bucket, types.Date)
+
+                # Obtención de la etiqueta del intervalo
+                label = self._group_label.format( len(group_columns) )
+                # Se añade la columna de agrupación
+                group_columns.append( bucket.label(label) )
+                # Se registra la llave de salida
+                value_labels[label] = group_declaration
+                # Se registra la expresión ordenable
+                sortable_expressions[group_declaration] = bucket
+
+            # Si no se especificó una granularidad...
+            else:
+                # Inicialización de objetivo de campo
+                field_target = frame_ctx.create_field_target(field_name)
+                # Obtención de instancia(s) de campo
+                field_instances = frame_ctx.get_field_instances_from_target(field_target)
+
+                # Se añade el objetivo de campo
+                group_field_targets.append(field_target)
+                # Se añaden las columnas de agrupación
+                group_columns += field_instances
+                # Se registra la expresión ordenable
+                sortable_expressions[field_name] = field_instances[0]
+
+        # Inicialización de expresiones de agregación por llave de salida con el conteo de registros
+        aggregate_expressions: dict[str, ColumnElement] = {self._count_key: func.count()}
+
+        # Iteración por cada campo y función de agregación
+        for ( field_name, agg_fn_name ) in aggregates.items():
+            # Si la función de agregación no es válida...
+            if agg_fn_name not in ComputeContext._agg_fn:
+                # Se arroja error
+                raise AssertionError(f'{ERROR_LABEL.INVALID_AGGREGATE_FUNCTION} [{agg_fn_name}]')
+
+            # Obtención de la instancia de campo (la ID en el caso de campos many2one)
+            [ field_instance, *_ ] = frame_ctx.get_field_instances(field_name)
+            # Construcción de la expresión de agregación
+            aggregate_expressions[field_name] = ComputeContext._agg_fn[agg_fn_name](field_instance)
+
+        # Inicialización de columnas de agregación
+        aggregate_columns: list[ColumnElement] = []
+
+        # Iteración por cada expresión de agregación
+        for ( i, ( key, aggregate_expression ) ) in enumerate( aggregate_expressions.items() ):
+            # Obtención de la etiqueta de la agregación
+            label = self._aggregate_label.format(i)
+            # Se añade la columna de agregación
+            aggregate_columns.append( aggregate_expression.label(label) )
+            # Se registra la llave de salida
+            value_labels[label] = key
+
+        # Se añaden las agregaciones como expresiones ordenables
+        sortable_expressions.update(aggregate_expressions)
 
         # Inicialización de query
         stmt = (
-            select(*field_instances_to_read)
+            select(*group_columns, *aggregate_columns)
             .select_from(frame_ctx.origin_model)
         )
 
@@ -228,22 +567,54 @@ class DQL(Generic[_M]):
             # Se añade el LEFT JOIN al query
             stmt = stmt.outerjoin(target_model, on)
 
-        # Si un valor de desfase fue provisto...
-        if offset:
-            # Se añade éste al query
-            stmt = stmt.offset(offset)
+        # Se añade la agrupación
+        stmt = stmt.group_by(*group_columns)
+
+        # Iteración por cada condición sobre las agregaciones
+        for ( key, op, value ) in having:
+            # Si la llave no corresponde a una agregación...
+            if key not in aggregate_expressions:
+                # Se arroja error
+                raise AssertionError(f'{ERROR_LABEL.UNKNOWN_AGGREGATE_KEY} [{key}]')
+            # Si el operador no es válido...
+            if op not in self._having_operators:
+                # Se arroja error
+                raise AssertionError(f'{ERROR_LABEL.INVALID_HAVING_OPERATOR} [{op}]')
+
+            # Se añade la condición al filtro de grupos
+            stmt = stmt.having( self._having_operators[op](aggregate_expressions[key], value) )
+
+        # Si un valor de ordenamiento fue provisto...
+        if sortby is not None:
+            # Se asegura un valor de lista
+            sortby = to_list(sortby)
+            # Se asegura una lista de direcciones con la misma longitud de ordenamiento
+            ascending = to_list(ascending) if ascending is not None else [True for _ in sortby]
+
+            # Iteración por cada llave de ordenamiento
+            for key in sortby:
+                # Si la llave no corresponde a un campo de agrupación ni a una agregación...
+                if key not in sortable_expressions:
+                    # Se arroja error
+                    raise AssertionError(f'{ERROR_LABEL.UNKNOWN_GROUP_KEY} [{key}]')
+
+            # Construcción de las direcciones de ordenamiento
+            sorting_expressions = [
+                self._sorting_direction[is_ascending](sortable_expressions[key])
+                for ( key, is_ascending ) in zip(sortby, ascending)
+            ]
+        # Si un valor de ordenamiento no fue provisto se ordena por los campos de agrupación
+        else:
+            sorting_expressions = group_columns
+
+        # Se añaden las direcciones de ordenamiento
+        stmt = stmt.order_by(*sorting_expressions)
 
         # Si un valor de límite fue provisto...
         if limit:
             # Se añade éste al query
             stmt = stmt.limit(limit)
 
-        # Obtención de campos de ordenamiento
-        sorting_field_instances = self._build_sorting_field_instances(frame_ctx, sortby, ascending)
-
-        # Se añaden las direcciones de ordenamiento
-        stmt = stmt.order_by(*sorting_field_instances)
-
         # Ejecución de query
         records_data = (
             execution_ctx.conn
@@ -252,31 +623,41 @@ class DQL(Generic[_M]):
         )
 
         # Formateo de los datos de salida
-        output_data = self._output_parser.records_from_database(records_data, field_targets_to_read)
+        output_data = self._output_parser.groups_from_database(records_data, group_field_targets, value_labels)
 
         return output_data
 
-    def search_count(
+    def _build_search_statement(
         self,
         execution_ctx: ExecutionContext[_M],
         model_name: ModelName[_M],
         search_criteria: CriteriaStructure = [],
-    ) -> int:
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+        paginate: bool = False,
+    ) -> tuple[Select[tuple[int]], int]:
 
         # Inicialización de contexto de frame
         frame_ctx = self._create_frame_context(execution_ctx, model_name)
         # Inicialización de contexto de filtro
         where_ctx = self._create_filter_context(frame_ctx)
 
-        # Obtención de la instancia de ID
-        id_field_instance = frame_ctx.get_physical_field_instance_from_current(FIELD_NAME.ID)
+        # Inicialización de objetivos de campo
+        id_field_target = frame_ctx.create_field_target(FIELD_NAME.ID)
 
-        # Construcción del query de conteo
+        # Obtención de instancia(s) de campo
+        [ id_field_instance ] = frame_ctx.get_field_instances_from_target(id_field_target)
+
+        # Obtención de modelo de origen desde el contexto de frame
+        origin_model = frame_ctx.origin_model
+
+        # Inicialización de query
         stmt = (
-            select(
-                func.count(id_field_instance)
-            )
-            .select_from(frame_ctx.origin_model)
+            select(id_field_instance)
+            .select_from(origin_model)
         )
 
         # Si se proporcionó un criterio de búsqueda
@@ -287,6 +668,15 @@ class DQL(Generic[_M]):
             # Asignación del criterio de búsqueda
             stmt = stmt.where(conditions)
 
+        # Inicialización de campos de ordenamiento y tamaño de la llave de paginación
+        sorting_field_instances = []
+        keyset_size = 0
+
+        # Si se solicitó un ordenamiento o paginación por llave...
+        if sortby is not None or after is not None or paginate:
+            # Construcción del ordenamiento y la paginación por llave antes de las uniones para incluir campos relacionados
+            ( stmt, sorting_field_instances, keyset_size ) = self._apply_sorting(frame_ctx, stmt, sortby, ascending, after, paginate)
+
         # Obtención de los outerjoins
         for outerjoin in frame_ctx.outerjoins:
             # Obtención de modelo a relacionar
@@ -297,14 +687,309 @@ class DQL(Generic[_M]):
             # Se añade el LEFT JOIN al query
             stmt = stmt.outerjoin(target_model, on)
 
-        # Ejecución de query
-        count = (
-            execution_ctx.conn
-            .execute(stmt)
-            .scalar()
+        # Si un valor de desfase fue provisto...
+        if offset:
+            # Se añade éste al query
+            stmt = stmt.offset(offset)
+
+        # Si un valor de límite fue provisto...
+        if limit:
+            # Se añade éste al query
+            stmt = stmt.limit(limit)
+
+        # Se añaden las direcciones de ordenamiento
+        stmt = stmt.order_by(*sorting_field_instances)
+
+        return ( stmt, keyset_size )
+
+    def _build_search_read_statement(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure,
+        fields: list[FrameReadField],
+        offset: Optional[int],
+        limit: Optional[int],
+        sortby: Optional[ItemOrList[str]],
+        ascending: Optional[ItemOrList[bool]],
+        after: Optional[str] = None,
+        paginate: bool = False,
+        with_count: bool = False,
+        count_limit: Optional[int] = None,
+    ) -> tuple[Select, list[FieldTarget], int]:
+
+        # Inicialización de contexto de frame
+        frame_ctx = self._create_frame_context(execution_ctx, model_name)
+        # Inicialización de contexto de filtro
+        where_ctx = self._create_filter_context(frame_ctx)
+
+        # Normalización de campos
+        normalized_fields = self._normalize_fields(execution_ctx, model_name, fields)
+
+        # Inicialización de objetivos de campo
+        field_targets_to_read = [frame_ctx.create_field_target(field) for field in normalized_fields]
+
+        # Inicialización de instancias de campos a leer
+        field_instances_to_read: list[InstrumentedAttribute] = []
+
+        # Iteración por cada objetivo de campo
+        for field_target in field_targets_to_read:
+            # Obtención de instancia(s) de campo
+            field_instances = frame_ctx.get_field_instances_from_target(field_target)
+
+            # Se añaden a la lista
+            field_instances_to_read += field_instances
+
+        # Inicialización de query
+        stmt = (
+            select(*field_instances_to_read)
+            .select_from(frame_ctx.origin_model)
         )
 
-        return count
+        # Si se proporcionó un criterio de búsqueda
+        if search_criteria:
+
+            # Construcción de las condiciones de búsqueda en SQL
+            conditions = where_ctx.build_conditions(search_criteria)
+            # Asignación del criterio de búsqueda
+            stmt = stmt.where(conditions)
+
+        # Se conserva el query sin la condición del cursor para el conteo total
+        unpaged_stmt = stmt
+
+        # Construcción del ordenamiento y la paginación por llave antes de las uniones para incluir campos relacionados
+        ( stmt, sorting_field_instances, keyset_size ) = self._apply_sorting(frame_ctx, stmt, sortby, ascending, after, paginate)
+
+        # Obtención de los outerjoins
+        for outerjoin in frame_ctx.outerjoins:
+            # Obtención de modelo a relacionar
+            target_model = outerjoin.model
+            # Obtención de clausula de unión
+            on = outerjoin.on
+
+            # Se añade el LEFT JOIN a ambos queries
+            stmt = stmt.outerjoin(target_model, on)
+            unpaged_stmt = unpaged_stmt.outerjoin(target_model, on)
+
+        # Si se solicitó el conteo total de registros...
+        if with_count:
+            # Se añade el conteo total de los criterios de búsqueda como columna del mismo query
+            stmt = stmt.add_columns( self._build_count_column(unpaged_stmt, count_limit, after).label(self._count_label) )
+
+        # Si un valor de desfase fue provisto...
+        if offset:
+            # Se añade éste al query
+            stmt = stmt.offset(offset)
+
+        # Si un valor de límite fue provisto...
+        if limit:
+            # Se añade éste al query
+            stmt = stmt.limit(limit)
+
+        # Se añaden las direcciones de ordenamiento
+        stmt = stmt.order_by(*sorting_field_instances)
+
+        return ( stmt, field_targets_to_read, keyset_size )
+
+    def _apply_sorting(
+        self,
+        frame_ctx: FrameContext[_M],
+        stmt: Select,
+        sortby: Optional[ItemOrList[str]],
+        ascending: Optional[ItemOrList[bool]],
+        after: Optional[str],
+        paginate: bool,
+    ) -> tuple[Select, list[ColumnElement], int]:
+
+        # Si no se solicitó paginación por llave...
+        if after is None and not paginate:
+            # Obtención de campos de ordenamiento
+            sorting_field_instances = self._build_sorting_field_instances(frame_ctx, sortby, ascending)
+
+            return ( stmt, sorting_field_instances, 0 )
+
+        # Construcción de la llave de paginación
+        keyset = self._build_keyset(frame_ctx, sortby, ascending)
+
+        # Si se proporcionó un cursor...
+        if after is not None:
+            # Se filtran los registros posteriores a la llave del cursor
+            stmt = stmt.where( self._build_keyset_condition(keyset, decode_cursor(after)) )
+
+        # Se añaden las columnas de la llave para construir el siguiente cursor
+        stmt = stmt.add_columns(*(
+            field_instance.label( self._keyset_label.format(i) )
+            for ( i, ( field_instance, _, _ ) ) in enumerate(keyset)
+        ))
+
+        # Construcción de las direcciones de ordenamiento de la llave
+        sorting_field_instances = [
+            self._sorting_direction[is_ascending](field_instance)
+            for ( field_instance, is_ascending, _ ) in keyset
+        ]
+
+        return ( stmt, sorting_field_instances, len(keyset) )
+
+    def _build_count_column(
+        self,
+        unpaged_stmt: Select,
+        count_limit: Optional[int],
+        after: Optional[str],
+    ) -> ColumnElement[int]:
+
+        # Si no se especificó un tope de conteo ni un cursor...
+        if not count_limit and after is None:
+            # El conteo se calcula como función de ventana sobre todas las filas antes de aplicar el límite
+            return func.count().over()
+
+        # Construcción de subquery con los mismos filtros y uniones sin la condición del cursor
+        counted_stmt = (
+            unpaged_stmt
+            .with_only_columns( literal_column('1') )
+            .correlate(None)
+        )
+
+        # Si se especificó un tope de conteo...
+        if count_limit:
+            # Se acota el subquery al tope
+            counted_stmt = counted_stmt.limit(count_limit)
+
+        # El conteo se calcula como subquery escalar sobre las filas del subquery
+        count_column = (
+            select( func.count() )
+            .select_from( counted_stmt.subquery() )
+            .scalar_subquery()
+        )
+
+        return count_column
+
+    def _build_keyset(
+        self,
+        frame_ctx: FrameContext[_M],
+        sortby: Optional[ItemOrList[str]],
+        ascending: Optional[ItemOrList[bool]],
+    ) -> list[tuple[InstrumentedAttribute, bool, bool]]:
+
+        # Se asegura un valor de lista
+        sortby = to_list(sortby) if sortby is not None else []
+        # Se asegura una lista de direcciones con la misma longitud de ordenamiento
+        ascending = to_list(ascending) if ascending is not None else [True for _ in sortby]
+
+        # Inicialización de la llave con la instancia, la dirección y si admite nulos
+        keyset: list[tuple[InstrumentedAttribute, bool, bool]] = []
+
+        # Iteración por cada campo y dirección de ordenamiento
+        for ( sorting_field, is_ascending ) in zip(sortby, ascending):
+            # Obtención de la instancia de campo
+            [ sorting_field_instance ] = frame_ctx.get_field_instances(sorting_field)
+            # Los campos relacionados provienen de LEFT JOINs y siempre pueden ser nulos
+            is_nullable = (
+                frame_ctx.is_reference_field(sorting_field)
+                or getattr( getattr(sorting_field_instance, 'expression', None), 'nullable', True )
+            )
+            # Se añade a la llave
+            keyset.append(( sorting_field_instance, is_ascending, is_nullable ))
+
+        # Si la ID no forma parte del ordenamiento...
+        if FIELD_NAME.ID not in sortby:
+            # Obtención de instancia de ID
+            [ id_field_instance ] = frame_ctx.get_field_instances(FIELD_NAME.ID)
+            # Se añade la ID como desempate en la dirección del último campo
+            keyset.append(( id_field_instance, ascending[-1] if ascending else True, False ))
+
+        return keyset
+
+    def _build_keyset_condition(
+        self,
+        keyset: list[tuple[InstrumentedAttribute, bool, bool]],
+        values: list[Any],
+    ) -> ColumnElement[bool]:
+
+        # Si el cursor no corresponde con el ordenamiento solicitado...
+        if len(values) != len(keyset):
+            # Se arroja error
+            raise InvalidCursorError('El cursor no corresponde con el ordenamiento solicitado')
+
+        # Conversión de los valores del cursor a parámetros con el tipo de cada campo
+        bound_values = [
+            None if value is None else literal(value, field_instance.type)
+            for ( ( field_instance, _, _ ), value ) in zip(keyset, values)
+        ]
+        # Obtención de las direcciones de ordenamiento
+        directions = { is_ascending for ( _, is_ascending, _ ) in keyset }
+
+        # Si todos los campos se ordenan en la misma dirección y ninguno admite nulos...
+        if len(directions) == 1 and not any( is_nullable for ( _, _, is_nullable ) in keyset ):
+            # Construcción de la comparación de valores de fila
+            row = tuple_(*( field_instance for ( field_instance, _, _ ) in keyset ))
+            cursor_row = tuple_(*bound_values)
+
+            return row > cursor_row if True in directions else row < cursor_row
+
+        # Construcción de la comparación expandida para direcciones mixtas o campos que admiten nulos
+        condition = or_(*(
+            and_(
+                *(
+                    self._build_keyset_equality(keyset[j][0], bound_values[j])
+                    for j in range(i)
+                ),
+                self._build_keyset_following(field_instance, is_ascending, bound_values[i]),
+            )
+            for ( i, ( field_instance, is_ascending, _ ) ) in enumerate(keyset)
+        ))
+
+        return condition
+
+    def _build_keyset_equality(
+        self,
+        field_instance: InstrumentedAttribute,
+        bound_value: Optional[ColumnElement],
+    ) -> ColumnElement[bool]:
+
+        # Si el valor del cursor es nulo se compara por nulidad
+        if bound_value is None:
+            return field_instance.is_(None)
+
+        return field_instance == bound_value
+
+    def _build_keyset_following(
+        self,
+        field_instance: InstrumentedAttribute,
+        is_ascending: bool,
+        bound_value: Optional[ColumnElement],
+    ) -> ColumnElement[bool]:
+        """
+        Condición de valores posteriores al del cursor en un campo. Sigue el
+        orden predeterminado de PostgreSQL: nulos al final en orden ascendente
+        y al inicio en orden descendente.
+        """
+
+        # Si el orden es ascendente...
+        if is_ascending:
+            # Ningún valor sigue a un nulo; los nulos siguen a cualquier valor
+            return false() if bound_value is None else or_(field_instance > bound_value, field_instance.is_(None))
+
+        # Si el orden es descendente cualquier valor sigue a un nulo y ningún nulo sigue a un valor
+        return field_instance.is_not(None) if bound_value is None else field_instance < bound_value
+
+    def _build_next_cursor(
+        self,
+        records_data: Sequence[Row],
+        keyset_size: int,
+        limit: Optional[int],
+    ) -> Optional[str]:
+
+        # Si no hay límite o la página no se llenó...
+        if not limit or len(records_data) < limit:
+            # No existe una página siguiente
+            return None
+
+        # Obtención de la última fila de la página
+        last_row = records_data[-1]
+        # Obtención de los valores de la llave de la última fila
+        values = [ getattr(last_row, self._keyset_label.format(i)) for i in range(keyset_size) ]
+
+        return encode_cursor(values)
 
     def _build_sorting_field_instances(
         self,
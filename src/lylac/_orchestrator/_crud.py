@@ -1,31 +1,54 @@
+from datetime import datetime
+from itertools import islice
+from typing import Any
+from typing import Callable
 from typing import Generic
+from typing import Iterable
+from typing import Iterator
 from typing import Literal
 from typing import Optional
 from typing import TYPE_CHECKING
+from typing import Union
 from sqlalchemy import select
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql.selectable import Select
+from .._constants import ACCESS_CONTROL_MODELS
 from .._constants import FIELD_NAME
 from .._constants import MODEL_NAME
+from .._constants import RECORD_RULES_MODELS
 from .._contexts import ExpansionContext
 from .._contexts import RelationOperationsContext
+from .._operations import DDL
 from .._operations import DQL
 from .._operations import DML
+from .._resources import Authorization
+from .._resources import CacheStats
+from .._resources import CachedSession
 from .._resources import InputProcessing
+from .._resources import LRUCache
 from .._resources import Many2OneCreate
 from .._resources import ModelsBearer
+from .._resources import Page
+from .._resources import RevocationSet
+from .._typing.callables import CompiledRecordRule
 from .._typing.generics import ItemOrList
 from .._typing.generics import ModelName
+from .._typing.generics import _Columns
 from .._typing.generics import _Record
+from .._typing.literals import AggFuncName
 from .._typing.literals import CRUDPermission
 from .._typing.literals import CRUDPermissionColumnName
+from .._typing.literals import OutputMode
 from .._typing.structures import CriteriaStructure
 from .._typing.structures import RecordData
 from .._typing.structures import FieldReadDeclaration
 from .._typing.type_parameters import _M
 from .._utils import to_list
-from .._utils import parse_record_rule
+from .._utils import compile_record_rule
 from ..errors import PermissionDeniedError
 from ..errors import RecordRulesPermissionError
+from ..settings import CONFIG
 
 if TYPE_CHECKING:
     from .._contexts import ExecutionContext
@@ -51,6 +74,106 @@ class CRUD(Generic[_M]):
             # Se termina la ejecución
             return
 
+        # Obtención de la autorización del usuario sobre el modelo
+        authorization = self._authorize(execution_ctx, model_name, permission)
+
+        # Si el usuario no tiene permiso para la realizar la acción...
+        if not authorization.granted:
+            # Se arroja error de permiso denegado
+            raise PermissionDeniedError(f'El usuario con la ID {execution_ctx.uid} no tiene permisos para realizar la acción en el modelo [{model_name}].')
+
+    def _authorize(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        permission: CRUDPermission,
+    ) -> Authorization:
+
+        # Si el bypass de revisión de permisos está activado...
+        if self.PERMISSIONS_BYPASS:
+            # Se concede la autorización sin reglas de registro
+            return Authorization(True, ())
+
+        # Obtención de la autorización resuelta previamente en la ejecución
+        authorization = execution_ctx.get_authorization(model_name, permission)
+
+        # Si la autorización ya fue resuelta en la ejecución...
+        if authorization is not None:
+            # Se reutiliza ésta
+            return authorization
+
+        # Construcción de la llave de la autorización
+        cache_key = (execution_ctx.uid, model_name, permission)
+        # Obtención de la decisión de acceso desde el caché
+        granted = self._access_cache.get(cache_key)
+        # Obtención de las reglas de registro desde el caché
+        record_rules = self._record_rules_cache.get(cache_key)
+
+        # Si alguno de los valores no se encuentra en el caché...
+        if granted is None or record_rules is None:
+            # Resolución de ambos valores en una sola consulta
+            ( granted, record_rules ) = self._query_authorization(execution_ctx, model_name, permission)
+
+            # Si la ejecución puede compartir sus valores (no lee de una réplica)...
+            if execution_ctx.shares_caches:
+                # Se guardan los valores en el caché
+                self._access_cache.set(cache_key, granted)
+                self._record_rules_cache.set(cache_key, record_rules)
+
+        # Construcción de la autorización
+        authorization = Authorization(granted, record_rules)
+        # Se guarda la autorización para el resto de la ejecución
+        execution_ctx.store_authorization(model_name, permission, authorization)
+
+        return authorization
+
+    def _query_authorization(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        permission: CRUDPermission,
+    ) -> tuple[bool, tuple[tuple[int, str], ...]]:
+
+        # Construcción de la consulta de permisos de acceso
+        access_stmt = self._build_access_statement(execution_ctx, model_name, permission)
+        # Construcción de la consulta de reglas de registro como subconsulta
+        record_rules_subquery = self._build_record_rules_statement(execution_ctx, permission, model_name).subquery()
+
+        # Obtención de las columnas de la subconsulta
+        rule_id = record_rules_subquery.c[FIELD_NAME.ID]
+        rule_domain = record_rules_subquery.c['domain']
+
+        # Construcción de la consulta unificada
+        stmt = (
+            select(
+                # Existencia de algún permiso concedido
+                access_stmt.exists().label('granted'),
+                # IDs y dominios de las reglas de registro en el mismo orden
+                func.array_agg(aggregate_order_by(rule_id, rule_id)).label('rule_ids'),
+                func.array_agg(aggregate_order_by(rule_domain, rule_id)).label('rule_domains'),
+            )
+            .select_from(record_rules_subquery)
+        )
+
+        # Obtención de la autorización en un solo viaje a la base de datos
+        ( granted, rule_ids, rule_domains ) = (
+            execution_ctx.conn
+            .execute(stmt)
+            .one()
+        )
+
+        # Conversión a tupla inmutable para su almacenamiento en caché
+        record_rules: tuple[tuple[int, str], ...] = tuple( zip(rule_ids or [], rule_domains or []) )
+
+        return ( granted, record_rules )
+
+    def _build_access_statement(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        permission: CRUDPermission,
+    ) -> Select[tuple[int]]:
+
         # Obtención del modelo de usuarios
         base_users = self._models_bearer.get_model(MODEL_NAME.BASE_USERS)
         # Obtención del modelo de roles de usuario
@@ -88,8 +211,8 @@ class CRUD(Generic[_M]):
 
         # Construcción de query
         stmt = (
-            # Conteo de resultados
-            select( func.count('*') )
+            # Selección de la ID de usuario
+            select( base_users__id )
             # Desde la tabla de usuarios
             .select_from(base_users)
 
@@ -130,36 +253,80 @@ class CRUD(Generic[_M]):
             )
         )
 
-        # Obtención de conteo de permisos concedidos para el usuario
-        count: int = (
-            execution_ctx.conn
-            .execute(stmt)
-            .scalar()
-        )
-
-        # Evaluación de si el usuario tiene permiso para realizar la acción
-        user_has_permission = (
-            # El conteo es mayor a cero
-            count > 0
-            # El bypass está activado
-            or self.PERMISSIONS_BYPASS
-        )
-
-        # Si el usuario no tiene permiso para la realizar la acción...
-        if not user_has_permission:
-            # Se arroja error de permiso denegado
-            raise PermissionDeniedError(f'El usuario con la ID {execution_ctx.uid} no tiene permisos para realizar la acción en el modelo [{model_name}].')
+        return stmt
 
     def __init__(
         self,
         models_bearer: ModelsBearer[_M],
+        ddl: DDL[_M],
     ) -> None:
 
         self._models_bearer = models_bearer
+        self._ddl = ddl
         self._dml = DML()
         self._dql = DQL()
         self._input_processing = InputProcessing()
         self._m2o_create = Many2OneCreate(self)
+        # Inicialización de caché de decisiones de acceso
+        self._access_cache = LRUCache[tuple[int, str, CRUDPermission], bool](CONFIG.ACCESS_CACHE_SIZE)
+        # Inicialización de caché de reglas de registro por usuario
+        self._record_rules_cache = LRUCache[tuple[int, str, CRUDPermission], tuple[tuple[int, str], ...]](CONFIG.RECORD_RULES_CACHE_SIZE)
+        # Inicialización de caché de reglas de registro compiladas
+        self._compiled_rules_cache = LRUCache[str, CompiledRecordRule](CONFIG.RECORD_RULES_CACHE_SIZE)
+        # Inicialización de caché de sesiones autenticadas
+        self._sessions_cache = LRUCache[str, CachedSession](CONFIG.SESSION_CACHE_SIZE)
+        # Inicialización de conjunto de sesiones revocadas para tokens firmados
+        self._revoked_sessions = RevocationSet()
+
+    @property
+    def cache_stats(
+        self,
+    ) -> dict[str, CacheStats]:
+        """
+        Contadores de los cachés en memoria del orquestador.
+        """
+
+        # Obtención de los contadores de cada caché
+        stats = {
+            'access': self._access_cache.stats,
+            'record_rules': self._record_rules_cache.stats,
+            'compiled_rules': self._compiled_rules_cache.stats,
+            'sessions': self._sessions_cache.stats,
+        }
+
+        return stats
+
+    def get_cached_session(
+        self,
+        hashed_session_uuid: str,
+    ) -> Optional[CachedSession]:
+
+        # Obtención de la sesión desde el caché
+        session = self._sessions_cache.get(hashed_session_uuid)
+
+        return session
+
+    def store_session(
+        self,
+        hashed_session_uuid: str,
+        session: CachedSession,
+    ) -> None:
+
+        # Se guarda la sesión en el caché
+        self._sessions_cache.set(hashed_session_uuid, session)
+
+    def is_session_revoked(
+        self,
+        hashed_session_uuid: str,
+        find_revoked_sessions: Callable[[], list[str]],
+    ) -> bool:
+
+        # Si el conjunto de sesiones revocadas debe recargarse...
+        if self._revoked_sessions.is_stale:
+            # Recarga desde la base de datos
+            self._revoked_sessions.replace(find_revoked_sessions(), CONFIG.SESSION_CACHE_TTL)
+
+        return self._revoked_sessions.contains(hashed_session_uuid)
 
     def create(
         self,
@@ -220,6 +387,248 @@ class CRUD(Generic[_M]):
         # Ejecución de operaciones de relación
         rel_op_ctx.run_relation_operations(self)
 
+        # Invalidación de permisos y reglas de registro en caché
+        self._invalidate_caches(execution_ctx, model_name)
+
+        # Se eliminan los registros si el modelo es transitorio
+        self._destroy_if_transient(
+            execution_ctx,
+            model_name,
+            created_ids,
+        )
+
+        return created_ids
+
+    def upsert(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data: ItemOrList[RecordData],
+        conflict_fields: list[str],
+        update_fields: Optional[list[str]] = None,
+    ) -> list[int]:
+
+        # Revisión de permisos de creación y modificación
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'create',
+        )
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'update',
+        )
+
+        # Se asegura la existencia del índice único de los campos de conflicto
+        self._ddl.ensure_unique_index(execution_ctx, model_name, conflict_fields)
+
+        # Se asegura una lista de datos
+        data = self._input_processing.to_list(data)
+
+        # Si no se especificaron los campos a modificar en conflicto...
+        if update_fields is None:
+            # Se modifican todos los campos provistos excepto los de conflicto
+            update_fields = list({
+                field_name: None
+                for record_data in data
+                for field_name in record_data
+                if field_name not in conflict_fields
+            })
+
+        # Obtención de los datos que se escribirían en caso de conflicto
+        update_data = [
+            {
+                field_name: value
+                for ( field_name, value ) in record_data.items()
+                if field_name in update_fields
+            }
+            for record_data in data
+        ]
+
+        # Validación de los datos como creación y como modificación
+        execution_ctx.validations.validate(
+            'create',
+            execution_ctx,
+            model_name,
+            data,
+        )
+        execution_ctx.validations.validate(
+            'update',
+            execution_ctx,
+            model_name,
+            update_data,
+        )
+
+        # Verificación de políticas como creación y como modificación
+        execution_ctx.policies.verify_incoming_data(
+            'create',
+            execution_ctx,
+            model_name,
+            data,
+        )
+        execution_ctx.policies.verify_incoming_data(
+            'update',
+            execution_ctx,
+            model_name,
+            update_data,
+        )
+
+        # Obtención del alcance de reglas de registro a aplicar en la sentencia
+        scope = self._get_record_rules_scope(
+            execution_ctx,
+            model_name,
+        )
+
+        # Si hay reglas de registro que apliquen...
+        if scope is not None:
+            # Obtención de los registros existentes en conflicto fuera del alcance del usuario
+            out_of_scope_ids = self._dml.find_out_of_scope_conflicts(
+                execution_ctx,
+                model_name,
+                data,
+                conflict_fields,
+                scope,
+            )
+            # Verificación de que no existan registros fuera del alcance
+            self._verify_affected_ids(
+                'update',
+                model_name,
+                out_of_scope_ids,
+                [],
+            )
+
+        # Procesamiento de los datos
+        processed_data = self._add_create_and_update_uid(data, execution_ctx)
+
+        # Creación de registros Many2One en caso existir
+        processed_data = self._m2o_create.resolve(
+            execution_ctx,
+            model_name,
+            processed_data,
+        )
+
+        # Creación de contexto de operaciones de relación
+        rel_op_ctx = RelationOperationsContext(execution_ctx, model_name, self._models_bearer)
+
+        # Inserción o modificación de registros y obtención de las IDs e indicadores de inserción
+        results = self._dml.upsert(
+            rel_op_ctx,
+            execution_ctx,
+            model_name,
+            processed_data,
+            conflict_fields,
+            update_fields,
+        )
+
+        # Obtención de las IDs en el orden de entrada
+        record_ids = [ record_id for ( record_id, _ ) in results ]
+        # Separación de las IDs creadas y modificadas
+        created_ids = [ record_id for ( record_id, inserted ) in results if inserted ]
+        updated_ids = [ record_id for ( record_id, inserted ) in results if not inserted ]
+
+        # Ejecución de las automatizaciones de creación sobre los registros creados
+        if created_ids:
+            execution_ctx.automations.execute_on_create(
+                execution_ctx,
+                model_name,
+                created_ids,
+            )
+
+        # Ejecución de las automatizaciones de modificación sobre los registros modificados
+        if updated_ids:
+            execution_ctx.automations.execute_on_update(execution_ctx, model_name, updated_ids)
+
+        # Ejecución de operaciones de relación
+        rel_op_ctx.run_relation_operations(self)
+
+        # Invalidación de permisos y reglas de registro en caché
+        self._invalidate_caches(execution_ctx, model_name)
+        # Invalidación de sesiones en caché
+        self._invalidate_sessions(execution_ctx, model_name, dict.fromkeys(update_fields))
+
+        # Se eliminan los registros creados si el modelo es transitorio
+        self._destroy_if_transient(
+            execution_ctx,
+            model_name,
+            created_ids,
+        )
+
+        return record_ids
+
+    def bulk_load(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        rows: Iterable[RecordData],
+        run_automations: bool = False,
+    ) -> list[int]:
+        """
+        Carga masiva de registros por medio de `COPY ... FROM STDIN`. Los
+        registros se consumen en lotes de `LYLAC_BULK_LOAD_CHUNK_SIZE` para
+        mantener la memoria acotada; cada lote se valida, se verifica contra
+        políticas y resuelve sus campos many2one antes de copiarse. Las
+        automatizaciones de creación se ejecutan una sola vez al final para
+        todas las IDs creadas si así se indica. Sólo se admiten campos que son
+        columnas de la tabla; los comandos de relación one2many y many2many
+        deben usar `create`.
+        """
+
+        # Revisión de permisos
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'create',
+        )
+
+        # Inicialización de lista de IDs creadas
+        created_ids: list[int] = []
+        # Inicialización de iterador de filas
+        rows_iterator = iter(rows)
+
+        # Iteración por cada lote de filas
+        while chunk := list( islice(rows_iterator, CONFIG.BULK_LOAD_CHUNK_SIZE) ):
+            # Validación de los datos del lote
+            execution_ctx.validations.validate(
+                'create',
+                execution_ctx,
+                model_name,
+                chunk,
+            )
+
+            # Verificación de políticas del lote
+            execution_ctx.policies.verify_incoming_data(
+                'create',
+                execution_ctx,
+                model_name,
+                chunk,
+            )
+
+            # Procesamiento de los datos
+            processed_chunk = self._add_create_and_update_uid(chunk, execution_ctx)
+
+            # Creación de registros Many2One en caso existir
+            processed_chunk = self._m2o_create.resolve(
+                execution_ctx,
+                model_name,
+                processed_chunk,
+            )
+
+            # Carga del lote y obtención de las IDs creadas
+            created_ids.extend( self._dml.copy(execution_ctx, model_name, processed_chunk) )
+
+        # Si se indicó ejecutar las automatizaciones...
+        if run_automations:
+            # Ejecución de las automatizaciones de creación para todo el lote
+            execution_ctx.automations.execute_on_create(
+                execution_ctx,
+                model_name,
+                created_ids,
+            )
+
+        # Invalidación de permisos y reglas de registro en caché
+        self._invalidate_caches(execution_ctx, model_name)
+
         # Se eliminan los registros si el modelo es transitorio
         self._destroy_if_transient(
             execution_ctx,
@@ -236,6 +645,9 @@ class CRUD(Generic[_M]):
         search_criteria: CriteriaStructure = [],
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
     ) -> list[int]:
 
         # Revisión de permisos
@@ -253,18 +665,185 @@ class CRUD(Generic[_M]):
             search_criteria,
         )
 
-        # Obtención de los registros del usuario
-        record_ids = self._dql.search(
+        # Obtención de los registros del usuario
+        record_ids = self._dql.search(
+            execution_ctx,
+            model_name,
+            scoped_search_criteria,
+            offset,
+            limit,
+            sortby,
+            ascending,
+            after,
+        )
+
+        return record_ids
+
+    def search_page(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[int]:
+
+        # Revisión de permisos
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'read',
+        )
+
+        # Obtención de criterio de búsqueda con alcance del usuario
+        scoped_search_criteria = self._get_record_rules(
+            execution_ctx,
+            'read',
+            model_name,
+            search_criteria,
+        )
+
+        # Obtención de la página de registros del usuario
+        page = self._dql.search_page(
+            execution_ctx,
+            model_name,
+            scoped_search_criteria,
+            limit,
+            sortby,
+            ascending,
+            after,
+        )
+
+        return page
+
+    def search_read(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FieldReadDeclaration] = [],
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+        with_count: bool = False,
+        count_limit: Optional[int] = None,
+        output: OutputMode = 'records',
+    ) -> Union[ list[_Record], _Columns, tuple[Union[ list[_Record], _Columns ], int] ]:
+
+        # Revisión de permisos
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'read',
+        )
+
+        # Inicialización de contexto de expansión
+        expansion_ctx = ExpansionContext(execution_ctx, self)
+
+        # Obtención de criterio de búsqueda con alcance del usuario
+        scoped_search_criteria = self._get_record_rules(
+            execution_ctx,
+            'read',
+            model_name,
+            search_criteria,
+        )
+
+        # Normalización de campos
+        normalized_fields = expansion_ctx.intercept(fields)
+
+        # Si se solicitó la salida por columnas con campos a expandir...
+        if output == 'columns' and expansion_ctx.related_fields:
+            # Se arroja error
+            raise AssertionError('La expansión de campos relacionados no está disponible en la salida por columnas.')
+
+        result = self._dql.search_read(
+            execution_ctx,
+            model_name,
+            scoped_search_criteria,
+            normalized_fields,
+            offset,
+            limit,
+            sortby,
+            ascending,
+            after,
+            with_count,
+            count_limit,
+            output,
+        )
+
+        # Separación de los datos y el conteo total en caso de haberse solicitado
+        ( data, total ) = result if with_count else ( result, None )
+
+        # Expansión de datos en caso de haberse especificado
+        expanded_data = expansion_ctx.resolve(
+            model_name,
+            data,
+        )
+
+        # Si se solicitó el conteo total...
+        if with_count:
+            return ( expanded_data, total )
+
+        return expanded_data
+
+    def search_read_page(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        fields: list[FieldReadDeclaration] = [],
+        limit: Optional[int] = None,
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        after: Optional[str] = None,
+    ) -> Page[_Record]:
+
+        # Revisión de permisos
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'read',
+        )
+
+        # Inicialización de contexto de expansión
+        expansion_ctx = ExpansionContext(execution_ctx, self)
+
+        # Obtención de criterio de búsqueda con alcance del usuario
+        scoped_search_criteria = self._get_record_rules(
+            execution_ctx,
+            'read',
+            model_name,
+            search_criteria,
+        )
+
+        # Normalización de campos
+        normalized_fields = expansion_ctx.intercept(fields)
+
+        # Obtención de la página de registros
+        page = self._dql.search_read_page(
             execution_ctx,
             model_name,
             scoped_search_criteria,
-            offset,
+            normalized_fields,
             limit,
+            sortby,
+            ascending,
+            after,
         )
 
-        return record_ids
+        # Expansión de datos de la página en caso de haberse especificado
+        expanded_page = Page(
+            records= expansion_ctx.resolve(model_name, page.records),
+            next_cursor= page.next_cursor,
+        )
 
-    def search_read(
+        return expanded_page
+
+    def iter_search_read(
         self,
         execution_ctx: ExecutionContext[_M],
         model_name: ModelName[_M],
@@ -274,7 +853,8 @@ class CRUD(Generic[_M]):
         limit: Optional[int] = None,
         sortby: Optional[ItemOrList[str]] = None,
         ascending: Optional[ItemOrList[bool]] = None,
-    ) -> list[_Record]:
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[_Record]:
 
         # Revisión de permisos
         self._check_access(
@@ -297,7 +877,8 @@ class CRUD(Generic[_M]):
         # Normalización de campos
         normalized_fields = expansion_ctx.intercept(fields)
 
-        data = self._dql.search_read(
+        # Iteración por cada lote de registros leído del cursor del servidor
+        for data in self._dql.iter_search_read(
             execution_ctx,
             model_name,
             scoped_search_criteria,
@@ -306,15 +887,13 @@ class CRUD(Generic[_M]):
             limit,
             sortby,
             ascending,
-        )
-
-        # Expansión de datos en caso de haberse especificado
-        expanded_data = expansion_ctx.resolve(
-            model_name,
-            data,
-        )
-
-        return expanded_data
+            chunk_size,
+        ):
+            # Expansión de datos del lote en caso de haberse especificado
+            yield from expansion_ctx.resolve(
+                model_name,
+                data,
+            )
 
     def search_count(
         self,
@@ -347,6 +926,49 @@ class CRUD(Generic[_M]):
 
         return count
 
+    def read_group(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        search_criteria: CriteriaStructure = [],
+        groupby: ItemOrList[str] = [],
+        aggregates: dict[str, AggFuncName] = {},
+        having: list[tuple[str, str, Any]] = [],
+        sortby: Optional[ItemOrList[str]] = None,
+        ascending: Optional[ItemOrList[bool]] = None,
+        limit: Optional[int] = None,
+    ) -> list[_Record]:
+
+        # Revisión de permisos
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'read',
+        )
+
+        # Obtención de criterio de búsqueda con alcance del usuario
+        scoped_search_criteria = self._get_record_rules(
+            execution_ctx,
+            'read',
+            model_name,
+            search_criteria,
+        )
+
+        # Obtención de los grupos
+        groups = self._dql.read_group(
+            execution_ctx,
+            model_name,
+            scoped_search_criteria,
+            groupby,
+            aggregates,
+            having,
+            sortby,
+            ascending,
+            limit,
+        )
+
+        return groups
+
     def read(
         self,
         execution_ctx: ExecutionContext[_M],
@@ -417,12 +1039,10 @@ class CRUD(Generic[_M]):
         # Se asegura una lista de datos
         record_ids = to_list(record_ids)
 
-        # Evaluación de IDs permitidas
-        self._evalute_allowed_ids(
+        # Obtención del alcance de reglas de registro a aplicar en la sentencia
+        scope = self._get_record_rules_scope(
             execution_ctx,
-            'update',
             model_name,
-            record_ids,
         )
 
         # Validación de los datos
@@ -461,6 +1081,15 @@ class CRUD(Generic[_M]):
             model_name,
             record_ids,
             processed_data,
+            scope,
+        )
+
+        # Verificación de que todas las IDs solicitadas fueron modificadas
+        self._verify_affected_ids(
+            'update',
+            model_name,
+            record_ids,
+            updated_ids,
         )
 
         # Ejecución de automatizaciones
@@ -469,6 +1098,98 @@ class CRUD(Generic[_M]):
         # Ejecución de acciones de relación
         rel_op_ctx.run_relation_operations(self)
 
+        # Invalidación de permisos y reglas de registro en caché
+        self._invalidate_caches(execution_ctx, model_name)
+        # Invalidación de sesiones en caché
+        self._invalidate_sessions(execution_ctx, model_name, data)
+
+        return True
+
+    def update_many(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data_per_id: dict[int, RecordData],
+    ) -> Literal[True]:
+
+        # Revisión de permisos
+        self._check_access(
+            execution_ctx,
+            model_name,
+            'update',
+        )
+
+        # Obtención de las IDs a modificar
+        record_ids = list(data_per_id)
+        # Obtención de los datos de cada registro en el mismo orden
+        data = list( data_per_id.values() )
+
+        # Obtención del alcance de reglas de registro a aplicar en la sentencia
+        scope = self._get_record_rules_scope(
+            execution_ctx,
+            model_name,
+        )
+
+        # Validación de los datos de todos los registros
+        execution_ctx.validations.validate(
+            'update',
+            execution_ctx,
+            model_name,
+            data,
+        )
+
+        # Verificación de políticas de todos los registros
+        execution_ctx.policies.verify_incoming_data(
+            'update',
+            execution_ctx,
+            model_name,
+            data,
+        )
+
+        # Obtención de todos los campos modificados para la invalidación de sesiones
+        updated_fields = { field_name: True for record_data in data for field_name in record_data }
+
+        # Procesamiento de los datos
+        processed_data = [ self._add_update_uid(record_data, execution_ctx) for record_data in data ]
+
+        # Creación de registros Many2One en caso existir
+        processed_data = self._m2o_create.resolve(
+            execution_ctx,
+            model_name,
+            processed_data,
+        )
+
+        # Creación de contexto de operaciones de relación
+        rel_op_ctx = RelationOperationsContext(execution_ctx, model_name, self._models_bearer)
+
+        # Actualización de datos
+        updated_ids = self._dml.update_many(
+            rel_op_ctx,
+            execution_ctx,
+            model_name,
+            dict( zip(record_ids, processed_data) ),
+            scope,
+        )
+
+        # Verificación de que todas las IDs solicitadas fueron modificadas
+        self._verify_affected_ids(
+            'update',
+            model_name,
+            record_ids,
+            updated_ids,
+        )
+
+        # Ejecución de automatizaciones una sola vez para todo el lote
+        execution_ctx.automations.execute_on_update(execution_ctx, model_name, updated_ids)
+
+        # Ejecución de acciones de relación
+        rel_op_ctx.run_relation_operations(self)
+
+        # Invalidación de permisos y reglas de registro en caché
+        self._invalidate_caches(execution_ctx, model_name)
+        # Invalidación de sesiones en caché
+        self._invalidate_sessions(execution_ctx, model_name, updated_fields)
+
         return True
 
     def delete(
@@ -488,12 +1209,10 @@ class CRUD(Generic[_M]):
         # Se asegura una lista de datos
         record_ids = to_list(record_ids)
 
-        # Evaluación de IDs permitidas
-        self._evalute_allowed_ids(
+        # Obtención del alcance de reglas de registro a aplicar en la sentencia
+        scope = self._get_record_rules_scope(
             execution_ctx,
-            'delete',
             model_name,
-            record_ids,
         )
 
         # Verificación de políticas
@@ -511,13 +1230,34 @@ class CRUD(Generic[_M]):
             record_ids,
         )
 
+        # Registro de las sesiones a revocar en caso de eliminarse sesiones de usuario
+        self._capture_revoked_sessions(
+            execution_ctx,
+            model_name,
+            record_ids,
+        )
+
         # Eliminación de registros
-        self._dml.delete(
+        deleted_ids = self._dml.delete(
             execution_ctx,
             model_name,
             record_ids,
+            scope,
+        )
+
+        # Verificación de que todas las IDs solicitadas fueron eliminadas
+        self._verify_affected_ids(
+            'delete',
+            model_name,
+            record_ids,
+            deleted_ids,
         )
 
+        # Invalidación de permisos y reglas de registro en caché
+        self._invalidate_caches(execution_ctx, model_name)
+        # Invalidación de sesiones en caché
+        self._invalidate_sessions(execution_ctx, model_name)
+
         # Ejecución de automatizaciones
         execute_automations_on_delete()
 
@@ -554,6 +1294,49 @@ class CRUD(Generic[_M]):
             # Se arroja error
             raise RecordRulesPermissionError(f'No puedes realizar la acción [{permission}] los registros {list(forbidden_ids)} del modelo [{model_name}]')
 
+    def _get_record_rules_scope(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+    ) -> Optional[Select[tuple[int]]]:
+
+        # Obtención de las reglas de registro del usuario como criterio de búsqueda
+        record_rules_criteria = self._get_record_rules(
+            execution_ctx,
+            'read',
+            model_name,
+        )
+
+        # Si no hay reglas de registro que apliquen...
+        if not record_rules_criteria:
+            # No se restringe la sentencia
+            return None
+
+        # Construcción de la consulta de IDs dentro del alcance del usuario
+        scope = self._dql.build_search_statement(
+            execution_ctx,
+            model_name,
+            record_rules_criteria,
+        )
+
+        return scope
+
+    def _verify_affected_ids(
+        self,
+        permission: CRUDPermission,
+        model_name: ModelName[_M],
+        declared_record_ids: list[int],
+        affected_ids: list[int],
+    ) -> None:
+
+        # Obtención de IDs que no fueron afectadas por la sentencia
+        forbidden_ids = set(declared_record_ids) - set(affected_ids)
+
+        # Si se encontraron IDs restringidas dentro de las IDs provistas...
+        if len(forbidden_ids):
+            # Se arroja error
+            raise RecordRulesPermissionError(f'No puedes realizar la acción [{permission}] los registros {list(forbidden_ids)} del modelo [{model_name}]')
+
     def _get_record_rules(
         self,
         execution_ctx: ExecutionContext[_M],
@@ -567,6 +1350,60 @@ class CRUD(Generic[_M]):
             # Se termina la ejecución
             return search_criteria
 
+        # Obtención de las reglas de registro que aplican al usuario
+        record_rules = self._authorize(execution_ctx, model_name, permission).record_rules
+
+        # Obtención de la fecha y hora de la evaluación
+        now = datetime.now()
+        today = now.date()
+
+        # Evaluación de las reglas de registro compiladas
+        compiled_record_rules = [
+            self._get_compiled_record_rule(domain)(execution_ctx.uid, now, today, execution_ctx._env)
+            for ( _, domain )
+            in record_rules
+        ]
+
+        # Si hay más de una regla de registro...
+        if len(compiled_record_rules) > 1:
+            # Inicialización de lista de reglas de registro unificadas con el primer elemento destructurado
+            unified_record_rules = [*compiled_record_rules[0]]
+            # Iteración por el resto de reglas de registro
+            for comp_rec_rule in compiled_record_rules[1:]:
+                # Se unen las reglas por operador [OR]
+                unified_record_rules = ['|', *unified_record_rules, *comp_rec_rule]
+
+            # Reasignación de reglas de registro unificadas a reglas de registro compiladas
+            compiled_record_rules = unified_record_rules
+
+        # Si hay una sola regla de registro...
+        elif compiled_record_rules:
+            # Destructuración y reasignación del único elemento de reglas de registro compiladas
+            [ compiled_record_rules ] = compiled_record_rules
+
+        # Si hay un criterio de búsqueda a usar...
+        if search_criteria:
+            # Si existen reglas de registro compiladas...
+            if compiled_record_rules:
+                # Unión de criterio de búsqueda con reglas de registro compiladas
+                search_criteria = ['&', *search_criteria, *compiled_record_rules]
+
+        # SI no hay un criterio de búsqueda a usar...
+        else:
+            # Si existen reglas de registro compiladas...
+            if compiled_record_rules:
+                # Reasignación de variable
+                search_criteria = compiled_record_rules
+
+        return search_criteria
+
+    def _build_record_rules_statement(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        permission: CRUDPermission,
+        model_name: ModelName[_M],
+    ) -> Select[tuple[int, str]]:
+
         # Obtención de modelo de roles de usuario
         base_users = self._models_bearer.get_model(MODEL_NAME.BASE_USERS)
         # Obtención de modelo de roles de usuario
@@ -610,8 +1447,10 @@ class CRUD(Generic[_M]):
 
         stmt = (
             select(
-                func.array_agg(base_rules__domain),
+                base_rules__id,
+                base_rules__domain,
             )
+            .distinct()
             .select_from(base_users)
             .outerjoin(
                 m2m_base_users__base_users_role,
@@ -646,65 +1485,134 @@ class CRUD(Generic[_M]):
                 permission_instance == True,
                 base_model__model == model_name,
             )
-            .group_by(base_users__id)
         )
 
-        # Obtención de reglas de registro para el usuario en la transacción
-        found_records = (
-            execution_ctx.conn
-            .execute(stmt)
-            .fetchall()
-        )
-
-        # Si fueron encontrados registros...
-        if found_records:
-            # Destructuración del valor de lista de reglas de registro sin compilar
-            [ ( string_record_rules, ) ] = found_records
-
-            # Compilación de las reglas de registro
-            compiled_record_rules = [
-                parse_record_rule(execution_ctx, str_rec_rule)
-                for str_rec_rule
-                in string_record_rules
-            ]
-
-            # Si hay más de una regla de registro...
-            if len(compiled_record_rules) > 1:
-                # Inicialización de lista de reglas de registro unificadas con el primer elemento destructurado
-                unified_record_rules = [*compiled_record_rules[0]]
-                # Iteración por el resto de reglas de registro
-                for comp_rec_rule in compiled_record_rules[1:]:
-                    # Se unen las reglas por operador [OR]
-                    unified_record_rules = ['|', *unified_record_rules, *comp_rec_rule]
-
-                # Reasignación de reglas de registro unificadas a reglas de registro compiladas
-                compiled_record_rules = unified_record_rules
-
-            # Si no hay más de una regla de registro...
-            else:
-                # Destructuración y reasignación del único elemento de reglas de registro compiladas
-                [ compiled_record_rules ] = compiled_record_rules
-
-        # Si no fueron encontrados registros...
-        else:
-            # Asignación de una lista vacía a la variable de reglas de registro compiladas
-            compiled_record_rules = []
+        return stmt
 
-        # Si hay un criterio de búsqueda a usar...
-        if search_criteria:
-            # Si existen reglas de registro compiladas...
-            if compiled_record_rules:
-                # Unión de criterio de búsqueda con reglas de registro compiladas
-                search_criteria = ['&', *search_criteria, *compiled_record_rules]
+    def _get_compiled_record_rule(
+        self,
+        domain: str,
+    ) -> CompiledRecordRule:
 
-        # SI no hay un criterio de búsqueda a usar...
-        else:
-            # Si existen reglas de registro compiladas...
-            if compiled_record_rules:
-                # Reasignación de variable
-                search_criteria = compiled_record_rules
+        # Obtención de la regla compilada desde el caché
+        compiled_record_rule = self._compiled_rules_cache.get(domain)
 
-        return search_criteria
+        # Si la regla no ha sido compilada...
+        if compiled_record_rule is None:
+            # Compilación de la regla de registro
+            compiled_record_rule = compile_record_rule(domain)
+            # Se guarda la regla compilada en el caché
+            self._compiled_rules_cache.set(domain, compiled_record_rule)
+
+        return compiled_record_rule
+
+    def _invalidate_caches(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+    ) -> None:
+
+        # Inicialización de lista de cachés a invalidar
+        caches: list[LRUCache] = []
+
+        # Si el modelo determina permisos de acceso...
+        if model_name in ACCESS_CONTROL_MODELS:
+            # Se invalida el caché de decisiones de acceso
+            caches.append(self._access_cache)
+
+        # Si el modelo determina reglas de registro...
+        if model_name in RECORD_RULES_MODELS:
+            # Se invalida el caché de reglas de registro por usuario
+            caches.append(self._record_rules_cache)
+
+        # Si el modelo es el de reglas de registro...
+        if model_name == MODEL_NAME.BASE_RULES:
+            # Se invalida el caché de reglas compiladas
+            caches.append(self._compiled_rules_cache)
+
+        # Si no hay cachés a invalidar...
+        if not caches:
+            # Se termina la ejecución
+            return
+
+        # Inicialización de función de vaciado de los cachés
+        def clear_caches(_: ExecutionContext[_M] = None) -> None:
+            # Iteración por cada caché
+            for cache in caches:
+                # Se vacía el caché
+                cache.clear()
+
+        # Se vacían los cachés
+        clear_caches()
+        # Se descartan las autorizaciones resueltas en la ejecución
+        execution_ctx.clear_authorizations()
+        # Las decisiones siguientes leen datos sin commit, por lo que se conservan sólo en la ejecución
+        execution_ctx.shares_caches = False
+        # Se vuelven a vaciar tras el commit para descartar valores leídos antes de éste
+        execution_ctx.run_after_commit(clear_caches)
+
+    def _invalidate_sessions(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        data: Optional[RecordData] = None,
+    ) -> None:
+
+        # Evaluación de si la operación afecta la validez de las sesiones
+        affects_sessions = (
+            # Se modificaron o eliminaron sesiones de usuario
+            model_name == MODEL_NAME.BASE_USER_SESSION
+            # Se eliminaron usuarios o se modificó su estado de activación
+            or ( model_name == MODEL_NAME.BASE_USERS and ( data is None or FIELD_NAME.ACTIVE in data ) )
+        )
+
+        # Si la operación no afecta la validez de las sesiones...
+        if not affects_sessions:
+            # Se termina la ejecución
+            return
+
+        # Inicialización de función de invalidación de sesiones
+        def clear_sessions(_: ExecutionContext[_M] = None) -> None:
+            # Se vacía el caché de sesiones
+            self._sessions_cache.clear()
+            # Se fuerza la recarga de las sesiones revocadas
+            self._revoked_sessions.mark_stale()
+
+        # Se invalidan las sesiones
+        clear_sessions()
+        # Se vuelven a invalidar tras el commit para descartar sesiones leídas antes de éste
+        execution_ctx.run_after_commit(clear_sessions)
+
+    def _capture_revoked_sessions(
+        self,
+        execution_ctx: ExecutionContext[_M],
+        model_name: ModelName[_M],
+        record_ids: list[int],
+    ) -> None:
+
+        # Si no se usan tokens firmados o no se eliminan sesiones de usuario...
+        if not CONFIG.SESSION_TOKEN_SECRET or model_name != MODEL_NAME.BASE_USER_SESSION:
+            # Se termina la ejecución
+            return
+
+        # Lectura de los nombres hasheados de las sesiones a eliminar
+        sessions = self._dql.read(
+            execution_ctx,
+            model_name,
+            record_ids,
+            [FIELD_NAME.NAME],
+        )
+        # Obtención de los nombres
+        revoked_names = [ session[FIELD_NAME.NAME] for session in sessions ]
+
+        # Registro de las revocaciones para que la recarga de otros procesos las encuentre
+        self._dml.revoke_sessions(
+            execution_ctx,
+            revoked_names,
+        )
+
+        # Se revocan las sesiones tras el commit
+        execution_ctx.run_after_commit(lambda _: self._revoked_sessions.add(revoked_names))
 
     def _add_create_and_update_uid(
         self,
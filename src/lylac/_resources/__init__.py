@@ -1,5 +1,8 @@
 from ._action_properties import ActionProperties
+from ._authorization import Authorization
 from ._automation_properties import AutomationProperties
+from ._cache_stats import CacheStats
+from ._cached_session import CachedSession
 from ._data_map import DataMap
 from ._database_metadata import DatabaseMetadata
 from ._engine_slot import Slot
@@ -10,6 +13,7 @@ from ._field_target import FieldTarget
 from ._input_data import InputData
 from ._input_parser import InputParser
 from ._input_processing import InputProcessing
+from ._lru_cache import LRUCache
 from ._many2one_create import Many2OneCreate
 from ._model_column_basic_atts import ModelColumnBasicAtts
 from ._model_data_index import ModelDataIndex
@@ -17,7 +21,11 @@ from ._model_properties import ModelProperties
 from ._models_bearer import ModelsBearer
 from ._outerjoin import OuterJoin
 from ._output_parser import OutputParser
+from ._page import Page
 from ._policy_properties import PolicyProperties
+from ._pool_stats import PoolStats
+from ._pool_telemetry import PoolTelemetry
+from ._revocation_set import RevocationSet
 from ._server_task_properties import ServerTaskProperties
 from ._user_env import UserEnv
 from ._validation_properties import ValidationProperties
@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+@dataclass(slots= True, frozen= True)
+class Authorization:
+    granted: bool
+    record_rules: tuple[tuple[int, str], ...]
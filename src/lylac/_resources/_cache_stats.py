@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+@dataclass(slots= True, frozen= True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+@dataclass(slots= True, frozen= True)
+class CachedSession:
+    uid: int
+    expires_at: datetime
+    user_is_active: bool
+    cached_until: float
@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic
+from .._typing.generics import MaybeNone
+from .._typing.type_parameters import _K
+from .._typing.type_parameters import _T
+from ._cache_stats import CacheStats
+
+class LRUCache(Generic[_K, _T]):
+    """
+    ### Caché LRU
+    Caché en memoria del proceso con tamaño acotado y desalojo del elemento
+    usado menos recientemente. Lleva conteo de aciertos, fallos y desalojos.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+    ) -> None:
+
+        # Asignación del tamaño máximo
+        self._max_size = max_size
+        # Inicialización del almacén ordenado por uso
+        self._store: OrderedDict[_K, _T] = OrderedDict()
+        # Inicialización de candado para acceso concurrente
+        self._lock = Lock()
+
+        # Inicialización de contadores
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        key: _K,
+    ) -> MaybeNone[_T]:
+
+        with self._lock:
+            # Si la llave no existe en el almacén...
+            if key not in self._store:
+                # Se registra el fallo
+                self._misses += 1
+
+                return None
+
+            # Se marca la llave como usada recientemente
+            self._store.move_to_end(key)
+            # Se registra el acierto
+            self._hits += 1
+
+            return self._store[key]
+
+    def set(
+        self,
+        key: _K,
+        value: _T,
+    ) -> None:
+
+        # Si el caché está deshabilitado...
+        if self._max_size <= 0:
+            # Se termina la ejecución
+            return
+
+        with self._lock:
+            # Se guarda el valor y se marca como usado recientemente
+            self._store[key] = value
+            self._store.move_to_end(key)
+
+            # Mientras el almacén exceda el tamaño máximo...
+            while len(self._store) > self._max_size:
+                # Se desaloja el elemento usado menos recientemente
+                self._store.popitem(last= False)
+                # Se registra el desalojo
+                self._evictions += 1
+
+    def discard(
+        self,
+        key: _K,
+    ) -> None:
+
+        with self._lock:
+            # Se elimina la llave en caso de existir
+            self._store.pop(key, None)
+
+    def clear(
+        self,
+    ) -> None:
+
+        with self._lock:
+            # Se vacía el almacén
+            self._store.clear()
+
+    @property
+    def stats(
+        self,
+    ) -> CacheStats:
+
+        with self._lock:
+            # Construcción de la instantánea de contadores
+            stats = CacheStats(
+                hits= self._hits,
+                misses= self._misses,
+                evictions= self._evictions,
+                size= len(self._store),
+                max_size= self._max_size,
+            )
+
+        return stats
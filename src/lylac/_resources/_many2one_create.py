@@ -30,27 +30,30 @@ class Many2OneCreate(Generic[_M]):
         # Obtención de los nombres de los campos
         field_properties = execution_ctx.database_metadata.get_fields_properties_by_ttypes(model_name, ['many2one'])
 
-        # Iteración por cada registro a crear
-        for record in data:
-            # Iteración por cada propiedad de campo many2one
-            for field_property in field_properties:
-                # Si el nombre del campo está en el registro a crear...
-                if field_property.name in record:
-                    # Si el valor es un diccionario de registro a crear...
-                    if isinstance(record[field_property.name], dict):
-                        # Obtención del modelo relacionado a usar
-                        related_model_name = field_property.related_model_name
-                        # Obtención de los datos del registro a crear
-                        related_record_data = record[field_property.name]
-
-                        # Creación de registro y obtención de ID
-                        [ created_record_id ] = self._crud.create(
-                            execution_ctx,
-                            related_model_name,
-                            related_record_data,
-                        )
-
-                        # Se asigna la ID creada al valor del campo
-                        record[field_property.name] = created_record_id
-
-        return data
\ No newline at end of file
+        # Iteración por cada propiedad de campo many2one
+        for field_property in field_properties:
+            # Obtención de los registros cuyo valor del campo es un diccionario de registro a crear
+            records_to_resolve = [
+                record
+                for record in data
+                if isinstance(record.get(field_property.name), dict)
+            ]
+
+            # Si no hay registros relacionados a crear en el campo...
+            if not records_to_resolve:
+                # Se continúa con el siguiente campo
+                continue
+
+            # Creación de todos los registros relacionados del campo en una sola llamada y obtención de las IDs en el orden de entrada
+            created_record_ids = self._crud.create(
+                execution_ctx,
+                field_property.related_model_name,
+                [ record[field_property.name] for record in records_to_resolve ],
+            )
+
+            # Iteración por cada registro y la ID de su registro relacionado creado
+            for ( record, created_record_id ) in zip(records_to_resolve, created_record_ids):
+                # Se asigna la ID creada al valor del campo
+                record[field_property.name] = created_record_id
+
+        return data
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from operator import itemgetter
 from typing import Any
 from typing import Callable
 from typing import Sequence
@@ -7,6 +8,7 @@ from sqlalchemy.engine import Row
 from .._constants import FIELD_SUFFIX
 from .._typing.interfaces import Many2One
 from .._typing.generics import MaybeNone
+from .._typing.generics import _Columns
 from .._typing.generics import _Record
 from .._typing.literals import TTypeName
 from .._core import Duration
@@ -42,13 +44,30 @@ class OutputParser:
             'many2many': self._functions.get_array_value,
         }
 
+        # Inicialización de conversiones de valor por tipo de dato
+        self._converters: dict[TTypeName, Callable[[Any], Any]] = {
+            'datetime': self._functions.convert_datetime,
+            'duration': self._functions.convert_duration,
+            'one2many': self._functions.convert_array,
+            'many2many': self._functions.convert_array,
+        }
+
+        # Inicialización de tipos de dato de NumPy y valores de relleno para nulos
+        self._numpy_dtypes: dict[TTypeName, tuple[str, Any]] = {
+            'integer': ('int64', 0),
+            'float': ('float64', 0.0),
+            'boolean': ('bool', False),
+            'date': ('datetime64[D]', None),
+            'datetime': ('datetime64[us]', None),
+        }
+
     def ids_from_database(
         self,
-        records_data: list[tuple[int]]
+        records_data: Sequence[tuple[int, ...]]
     ) -> list[int]:
 
-        # Obtención de las IDs de registros encontrados
-        record_ids = [record_id for ( record_id, ) in records_data]
+        # Obtención de las IDs de registros encontrados descartando columnas adicionales
+        record_ids = [record_id for ( record_id, *_ ) in records_data]
 
         return record_ids
 
@@ -58,26 +77,130 @@ class OutputParser:
         field_targets: list['FieldTarget'],
     ) -> list[_Record]:
 
-        # Inicialización de lista de registros a retornar
-        records: list[_Record] = []
+        # Si no existen filas no hay nada que decodificar
+        if not records_data:
+            return []
+
+        # Compilación del decodificador de filas del query
+        decode = self._compile_decoder(records_data[0]._fields, field_targets)
+        # Decodificación de cada fila de la secuencia
+        records = [decode(row) for row in records_data]
+
+        return records
+
+    def columns_from_database(
+        self,
+        records_data: Sequence[Row],
+        field_targets: list['FieldTarget'],
+    ) -> _Columns:
+        """
+        Formateo de los datos por columna. Los campos numéricos, booleanos y
+        de fecha se retornan como arreglos enmascarados de NumPy donde la
+        máscara indica los valores nulos, y el resto como listas.
+        """
+
+        # Importación diferida de NumPy al ser una dependencia opcional
+        try:
+            import numpy as np
+        # Si NumPy no está instalado...
+        except ImportError as e:
+            # Se arroja error
+            raise ImportError('La salida por columnas requiere NumPy. Instálese con el extra `columns`.') from e
+
+        # Obtención del número de filas
+        size = len(records_data)
+        # Inicialización del mapa de columnas a retornar
+        columns: _Columns = {}
+
+        # Iteración por cada uno de los objetivos de campo
+        for field_target in field_targets:
+            # Obtención del tipo de dato del campo
+            field_ttype = field_target.ttype
+            # Obtención del título del campo
+            field_label = field_target.label
+
+            # Si el tipo de dato no tiene equivalente en NumPy...
+            if field_ttype not in self._numpy_dtypes:
+                # Obtención de la función para obtención del atributo de la instancia de fila
+                get_attribute_fn = self._adapter[field_ttype]
+                # Construcción de la columna como lista
+                columns[field_label] = [get_attribute_fn(field_label, row) for row in records_data]
+                continue
+
+            # Obtención del tipo de dato de NumPy y el valor de relleno para nulos
+            ( dtype, fill_value ) = self._numpy_dtypes[field_ttype]
+            # Obtención de los valores de la columna
+            values = [getattr(row, field_label) for row in records_data]
+            # Construcción de la máscara de nulos
+            mask = np.fromiter( ( value is None for value in values ), dtype= bool, count= size )
+
+            # Si existen valores nulos...
+            if mask.any():
+                # Se reemplazan éstos por el valor de relleno
+                values = [fill_value if value is None else value for value in values]
+
+            # Construcción de la columna como arreglo enmascarado
+            columns[field_label] = np.ma.MaskedArray( np.array(values, dtype= dtype), mask= mask )
+
+        return columns
+
+    def groups_from_database(
+        self,
+        records_data: Sequence[Row],
+        field_targets: list['FieldTarget'],
+        value_labels: dict[str, str],
+    ) -> list[_Record]:
+
+        # Si no existen filas no hay nada que decodificar
+        if not records_data:
+            return []
+
+        # Obtención de los nombres de columna del query
+        keys = records_data[0]._fields
+        # Compilación del decodificador de los campos de agrupación
+        decode = self._compile_decoder(keys, field_targets)
+        # Obtención de las posiciones de los valores adicionales por llave de salida
+        value_positions = [ ( key, keys.index(label) ) for ( label, key ) in value_labels.items() ]
+
+        # Inicialización de lista de grupos a retornar
+        groups: list[_Record] = []
 
         # Iteración por cada fila de la secuencia
         for row in records_data:
-            # Obtención del diccionario de datos del registro
-            record = self._create_record_dict(row, field_targets)
+            # Obtención del diccionario de datos de los campos de agrupación
+            group = decode(row)
+
+            # Iteración por cada llave de salida y su posición
+            for ( key, position ) in value_positions:
+                # Se añade el valor al diccionario
+                group[key] = row[position]
+
             # Se añaden los datos a la lista
-            records.append(record)
+            groups.append(group)
 
-        return records
+        return groups
 
-    def _create_record_dict(
+    def _compile_decoder(
         self,
-        record_data: Row,
+        keys: Sequence[str],
         field_targets: list['FieldTarget'],
-    ) -> _Record:
-
-        # Inicialización del diccionario a retornar
-        record = {}
+    ) -> Callable[[Row], _Record]:
+        """
+        Compilación de un decodificador de filas para un query. Las posiciones
+        de las columnas y las conversiones por tipo de dato se resuelven una
+        sola vez para aplicarse después sobre cada fila.
+        """
+
+        # Mapeo de nombres de columna a su posición en la fila
+        positions = {key: i for ( i, key ) in enumerate(keys)}
+
+        # Inicialización de títulos de campo y sus posiciones
+        labels: list[str] = []
+        indices: list[int] = []
+        # Inicialización de conversiones de valor por título
+        conversions: list[tuple[str, Callable[[Any], Any]]] = []
+        # Inicialización de pares de posiciones de ID y nombre de campos many2one
+        m2o_pairs: list[tuple[str, int, int]] = []
 
         # Iteración por cada uno de los objetivos de campo
         for field_target in field_targets:
@@ -85,14 +208,57 @@ class OutputParser:
             field_ttype = field_target.ttype
             # Obtención del título del campo
             field_label = field_target.label
-            # Obtención de la función para obtención del atributo de la instancia de fila
-            get_attribute_fn = self._adapter[field_ttype]
-            # Obtención del valor del campo
-            field_value = get_attribute_fn(field_label, record_data)
-            # Se añade el valor al diccionario
-            record[field_label] = field_value
 
-        return record
+            # Se añade el título de campo
+            labels.append(field_label)
+
+            # Si el campo es many2one...
+            if field_ttype == 'many2one':
+                # Obtención de las posiciones de ID y nombre
+                id_position = positions[f'{field_label}{FIELD_SUFFIX.ID}']
+                name_position = positions[f'{field_label}{FIELD_SUFFIX.NAME}']
+                # Se reserva la posición de ID para conservar el orden de los campos
+                indices.append(id_position)
+                # Se registra el par de posiciones
+                m2o_pairs.append( ( field_label, id_position, name_position ) )
+
+                continue
+
+            # Se añade la posición del campo
+            indices.append( positions[field_label] )
+
+            # Si el tipo de dato requiere conversión...
+            if field_ttype in self._converters:
+                # Se registra la conversión
+                conversions.append( ( field_label, self._converters[field_ttype] ) )
+
+        # Construcción de la función de obtención posicional de los valores
+        get_values = (
+            itemgetter(*indices)
+            if len(indices) > 1
+            else lambda row: tuple( row[i] for i in indices )
+        )
+
+        # Inicialización de función de decodificación
+        def decode(row: Row) -> _Record:
+
+            # Construcción del registro con los valores en crudo
+            record = dict( zip( labels, get_values(row) ) )
+
+            # Iteración por cada conversión de valor
+            for ( label, convert ) in conversions:
+                # Conversión del valor
+                record[label] = convert(record[label])
+
+            # Iteración por cada par de posiciones many2one
+            for ( label, id_position, name_position ) in m2o_pairs:
+                # Si el valor de ID no es nulo se construye el valor completo
+                if record[label] is not None:
+                    record[label] = [ record[label], row[name_position] ]
+
+            return record
+
+        return decode
 
     class Functions:
 
@@ -113,15 +279,10 @@ class OutputParser:
             row: Row,
         ) -> str | None:
 
-            # Obtención del valor de la fila de registro
-            value: str | None = getattr(row, label)
+            # Obtención y conversión del valor de la fila de registro
+            value = self.convert_datetime( getattr(row, label) )
 
-            if value is None:
-                return value
-            else:
-                value = str(value).split('.')[0]
-
-                return value
+            return value
 
         def get_timedelta_value(
             self,
@@ -143,8 +304,38 @@ class OutputParser:
             row: Row,
         ) -> str | None:
 
-            # Obtención del valor de la fila de registro
-            value: timedelta | None = getattr(row, label)
+            # Obtención y conversión del valor de la fila de registro
+            value = self.convert_duration( getattr(row, label) )
+
+            return value
+
+        def get_array_value(
+            self,
+            label: str,
+            row: Row,
+        ) -> list[int]:
+
+            # Obtención y conversión del valor de la fila de registro
+            value = self.convert_array( getattr(row, label) )
+
+            return value
+
+        def convert_datetime(
+            self,
+            value: Any,
+        ) -> str | None:
+
+            if value is None:
+                return value
+            else:
+                value = str(value).split('.')[0]
+
+                return value
+
+        def convert_duration(
+            self,
+            value: timedelta | None,
+        ) -> str | None:
 
             if value is None:
                 return value
@@ -152,15 +343,11 @@ class OutputParser:
                 value = Duration(seconds= value.total_seconds())
                 return str(value)
 
-        def get_array_value(
+        def convert_array(
             self,
-            label: str,
-            row: Row,
+            value: list[int | None] | None,
         ) -> list[int]:
 
-            # Obtención del valor
-            value: list[int | None] = getattr(row, label)
-
             if value == [None] or value is None:
                 value: list[int] = []
 
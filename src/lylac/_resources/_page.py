@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Generic
+from typing import Optional
+from .._typing.type_parameters import _T
+
+@dataclass(slots= True, frozen= True)
+class Page(Generic[_T]):
+    records: list[_T]
+    next_cursor: Optional[str]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(slots= True, frozen= True)
+class PoolStats:
+    size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    overflow_events: int
+    timeouts: int
+    total_wait_time: float
+    max_wait_time: float
+    checkout_latency: dict[str, int]
@@ -0,0 +1,97 @@
+from threading import Lock
+from ._pool_stats import PoolStats
+
+class PoolTelemetry:
+    """
+    ### Telemetría del grupo de conexiones
+    Conteo de obtenciones de conexión, eventos de desbordamiento, tiempos de
+    espera agotados e histograma de latencia de obtención de conexiones.
+    """
+    _latency_buckets: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(
+        self,
+    ) -> None:
+
+        # Inicialización de candado para acceso concurrente
+        self._lock = Lock()
+
+        # Inicialización de contadores
+        self._checkouts = 0
+        self._overflow_events = 0
+        self._timeouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        # Inicialización de conteos por cubeta de latencia más una de excedentes
+        self._latency_counts = [0] * ( len(self._latency_buckets) + 1 )
+
+    def record_checkout(
+        self,
+        wait_time: float,
+    ) -> None:
+
+        # Obtención del índice de la cubeta de latencia
+        bucket = next(
+            (
+                i
+                for ( i, upper_bound ) in enumerate(self._latency_buckets)
+                if wait_time <= upper_bound
+            ),
+            len(self._latency_buckets),
+        )
+
+        with self._lock:
+            # Registro de la obtención de conexión
+            self._checkouts += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+            self._latency_counts[bucket] += 1
+
+    def record_overflow(
+        self,
+    ) -> None:
+
+        with self._lock:
+            # Registro del evento de desbordamiento
+            self._overflow_events += 1
+
+    def record_timeout(
+        self,
+    ) -> None:
+
+        with self._lock:
+            # Registro del tiempo de espera agotado
+            self._timeouts += 1
+
+    def snapshot(
+        self,
+        size: int,
+        max_overflow: int,
+        checked_out: int,
+        overflow: int,
+    ) -> PoolStats:
+
+        with self._lock:
+            # Construcción del histograma etiquetado en milisegundos
+            checkout_latency = {
+                f'<={upper_bound * 1000:g}ms': count
+                for ( upper_bound, count )
+                in zip(self._latency_buckets, self._latency_counts)
+            }
+            checkout_latency[f'>{self._latency_buckets[-1] * 1000:g}ms'] = self._latency_counts[-1]
+
+            # Construcción de la instantánea de contadores
+            stats = PoolStats(
+                size= size,
+                max_overflow= max_overflow,
+                checked_out= checked_out,
+                overflow= overflow,
+                checkouts= self._checkouts,
+                overflow_events= self._overflow_events,
+                timeouts= self._timeouts,
+                total_wait_time= self._total_wait_time,
+                max_wait_time= self._max_wait_time,
+                checkout_latency= checkout_latency,
+            )
+
+        return stats
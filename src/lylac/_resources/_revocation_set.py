@@ -0,0 +1,67 @@
+from threading import Lock
+from time import monotonic
+from typing import Iterable
+
+class RevocationSet:
+    """
+    ### Conjunto de revocación
+    Nombres hasheados de sesiones revocadas. Se recarga periódicamente desde la
+    base de datos y se complementa localmente con las sesiones eliminadas.
+    """
+
+    def __init__(
+        self,
+    ) -> None:
+
+        # Inicialización del conjunto de nombres revocados
+        self._names: frozenset[str] = frozenset()
+        # Inicialización del momento de recarga
+        self._refresh_after = 0.0
+        # Inicialización de candado para acceso concurrente
+        self._lock = Lock()
+
+    @property
+    def is_stale(
+        self,
+    ) -> bool:
+        """
+        Indica si el conjunto debe recargarse desde la base de datos.
+        """
+
+        return monotonic() >= self._refresh_after
+
+    def contains(
+        self,
+        name: str,
+    ) -> bool:
+
+        return name in self._names
+
+    def replace(
+        self,
+        names: Iterable[str],
+        ttl: float,
+    ) -> None:
+
+        with self._lock:
+            # Reemplazo del conjunto de nombres revocados
+            self._names = frozenset(names)
+            # Cálculo del siguiente momento de recarga
+            self._refresh_after = monotonic() + ttl
+
+    def add(
+        self,
+        names: Iterable[str],
+    ) -> None:
+
+        with self._lock:
+            # Se añaden los nombres al conjunto
+            self._names = self._names | frozenset(names)
+
+    def mark_stale(
+        self,
+    ) -> None:
+
+        with self._lock:
+            # Se fuerza la recarga en la siguiente consulta
+            self._refresh_after = 0.0
@@ -0,0 +1,119 @@
+from time import perf_counter
+from typing import Any
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine
+from ..settings import CONFIG
+from .._resources import PoolTelemetry
+from .._typing.callables import TransactionCallback
+from .._typing.type_parameters import _T
+from .connection_service import ConnectionService
+
+class AsyncConnectionService(ConnectionService):
+    """
+    ### Servicio de conexión asíncrono
+    Mismo grupo de conexiones, réplicas y telemetría que `ConnectionService`
+    sobre el motor asíncrono de SQLAlchemy con `asyncpg`. Las funciones de
+    transacción se ejecutan sin cambios por medio de `AsyncConnection.run_sync`.
+    Los métodos síncronos heredados no están disponibles sobre el motor
+    asíncrono y arrojan `NotImplementedError`.
+    """
+
+    async def execute_complex(
+        self,
+        callback: TransactionCallback[_T],
+        read_only: bool = False,
+    ) -> _T:
+
+        # Obtención del motor y la telemetría a usar
+        ( engine, telemetry ) = self._select_engine(read_only)
+
+        # Inicio de la medición de espera
+        start = perf_counter()
+
+        # Se intenta obtener una conexión del grupo
+        try:
+            conn = await engine.connect()
+        # Si se agota el tiempo de espera...
+        except PoolTimeoutError:
+            # Registro del tiempo de espera agotado
+            telemetry.record_timeout()
+
+            raise
+
+        # Registro de la latencia de obtención
+        telemetry.record_checkout(perf_counter() - start)
+
+        # Conexión con la base de datos
+        async with conn, conn.begin():
+            # Ejecución de la función provista sobre la conexión síncrona equivalente
+            response = await conn.run_sync(callback)
+
+        return response
+
+    def execute_dql(
+        self,
+        *_: Any,
+        **__: Any,
+    ) -> None:
+
+        # Se arroja error por no estar disponible sobre el motor asíncrono
+        raise NotImplementedError('[execute_dql] no está disponible en el servicio de conexión asíncrono. Usa [execute_complex].')
+
+    def execute_dml(
+        self,
+        *_: Any,
+        **__: Any,
+    ) -> None:
+
+        # Se arroja error por no estar disponible sobre el motor asíncrono
+        raise NotImplementedError('[execute_dml] no está disponible en el servicio de conexión asíncrono. Usa [execute_complex].')
+
+    def stream_complex(
+        self,
+        *_: Any,
+        **__: Any,
+    ) -> None:
+
+        # Se arroja error por no estar disponible sobre el motor asíncrono
+        raise NotImplementedError('[stream_complex] no está disponible en el servicio de conexión asíncrono. Usa [execute_complex].')
+
+    def _checkout(
+        self,
+        *_: Any,
+        **__: Any,
+    ) -> None:
+
+        # Se arroja error por no estar disponible sobre el motor asíncrono
+        raise NotImplementedError('[_checkout] no está disponible en el servicio de conexión asíncrono. Usa [execute_complex].')
+
+    def _create_engine(
+        self,
+        url: str,
+    ) -> AsyncEngine:
+
+        # Conversión de la URL al controlador asíncrono
+        async_url = make_url(url).set(drivername= 'postgresql+asyncpg')
+
+        # Inicialización del motor de conexión con la configuración del grupo
+        engine = create_async_engine(
+            async_url,
+            pool_size= CONFIG.DB_POOL_SIZE,
+            max_overflow= CONFIG.DB_POOL_MAX_OVERFLOW,
+            pool_timeout= CONFIG.DB_POOL_TIMEOUT,
+            pool_recycle= CONFIG.DB_POOL_RECYCLE,
+            pool_pre_ping= CONFIG.DB_POOL_PRE_PING,
+        )
+
+        return engine
+
+    def _watch_engine(
+        self,
+        engine: AsyncEngine,
+    ) -> PoolTelemetry:
+
+        # Los eventos del grupo se registran en el motor síncrono subyacente
+        telemetry = super()._watch_engine(engine.sync_engine)
+
+        return telemetry
@@ -1,8 +1,19 @@
+from itertools import count
+from time import perf_counter
+from typing import Callable
+from typing import Iterator
 from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.cursor import CursorResult
 from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.selectable import Select
+from ..settings import CONFIG
 from ..settings import CREDENTIALS
+from .._resources import PoolStats
+from .._resources import PoolTelemetry
 from .._typing.callables import TransactionCallback
 from .._typing.type_parameters import _T
 
@@ -15,7 +26,46 @@ class ConnectionService:
         # Construcción de la URL
         url = self._build_url()
         # Inicialización del motor de conexión
-        self._engine = create_engine(url)
+        self._engine = self._create_engine(url)
+        # Inicialización de telemetría del grupo de conexiones
+        self._telemetry = self._watch_engine(self._engine)
+
+        # Inicialización de los motores de réplicas de lectura
+        self._replicas = [ self._create_engine(replica_url) for replica_url in CONFIG.DB_REPLICA_URLS ]
+        # Inicialización de telemetría de los grupos de conexiones de réplicas
+        self._replicas_telemetry = [ self._watch_engine(replica) for replica in self._replicas ]
+        # Inicialización de contador para balanceo en ronda
+        self._round_robin = count()
+
+    @property
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        """
+        Estado y contadores del grupo de conexiones.
+        """
+
+        # Construcción de la instantánea del grupo
+        stats = self._snapshot(self._engine, self._telemetry)
+
+        return stats
+
+    @property
+    def replicas_pool_stats(
+        self,
+    ) -> list[PoolStats]:
+        """
+        Estado y contadores de los grupos de conexiones de réplicas de lectura.
+        """
+
+        # Construcción de las instantáneas de los grupos
+        stats = [
+            self._snapshot(replica, telemetry)
+            for ( replica, telemetry )
+            in zip(self._replicas, self._replicas_telemetry)
+        ]
+
+        return stats
 
     def execute_dql(
         self,
@@ -48,10 +98,14 @@ class ConnectionService:
     def execute_complex(
         self,
         callback: TransactionCallback[_T],
+        read_only: bool = False,
     ) -> _T:
 
+        # Obtención de una conexión del grupo
+        conn = self._checkout(read_only)
+
         # Conexión con la base de datos
-        with self._engine.begin() as conn:
+        with conn, conn.begin():
 
             # Ejecución encapsulada para hacer rollback
             try:
@@ -66,6 +120,149 @@ class ConnectionService:
 
             return response
 
+    def stream_complex(
+        self,
+        callback: Callable[[Connection], Iterator[_T]],
+        read_only: bool = False,
+    ) -> Iterator[_T]:
+        """
+        Variante de `execute_complex` para funciones generadoras. La conexión y
+        la transacción permanecen abiertas mientras se consume el iterador y se
+        liberan al agotarse o cerrarse éste.
+        """
+
+        # Obtención de una conexión del grupo
+        conn = self._checkout(read_only)
+
+        # Conexión con la base de datos
+        with conn, conn.begin():
+
+            # Ejecución encapsulada para hacer rollback
+            try:
+                # Se entregan los elementos producidos por la función provista
+                yield from callback(conn)
+            # Si ocurre algún error...
+            except Exception as e:
+                # Se realiza rollback
+                conn.rollback()
+
+                raise
+
+    def _checkout(
+        self,
+        read_only: bool,
+    ) -> Connection:
+
+        # Obtención del motor y la telemetría a usar
+        ( engine, telemetry ) = self._select_engine(read_only)
+
+        # Inicio de la medición de espera
+        start = perf_counter()
+
+        # Se intenta obtener una conexión del grupo
+        try:
+            conn = engine.connect()
+        # Si se agota el tiempo de espera...
+        except PoolTimeoutError:
+            # Registro del tiempo de espera agotado
+            telemetry.record_timeout()
+
+            raise
+
+        # Registro de la latencia de obtención
+        telemetry.record_checkout(perf_counter() - start)
+
+        return conn
+
+    def _select_engine(
+        self,
+        read_only: bool,
+    ) -> tuple[Engine, PoolTelemetry]:
+
+        # Si la transacción es de solo lectura y hay réplicas disponibles...
+        if read_only and self._replicas:
+            # Selección de la réplica a usar
+            replica_index = self._select_replica()
+
+            return ( self._replicas[replica_index], self._replicas_telemetry[replica_index] )
+
+        # Si la transacción requiere escritura se usa el motor principal
+        return ( self._engine, self._telemetry )
+
+    def _select_replica(
+        self,
+    ) -> int:
+
+        # Si el balanceo es por menor número de conexiones...
+        if CONFIG.DB_REPLICA_BALANCING == 'least_connections':
+            # Selección de la réplica con menos conexiones en uso
+            replica_index = min(
+                range( len(self._replicas) ),
+                key= lambda i: self._replicas[i].pool.checkedout(),
+            )
+        # Si el balanceo es en ronda...
+        else:
+            # Selección de la siguiente réplica
+            replica_index = next(self._round_robin) % len(self._replicas)
+
+        return replica_index
+
+    def _create_engine(
+        self,
+        url: str,
+    ) -> Engine:
+
+        # Inicialización del motor de conexión con la configuración del grupo
+        engine = create_engine(
+            url,
+            pool_size= CONFIG.DB_POOL_SIZE,
+            max_overflow= CONFIG.DB_POOL_MAX_OVERFLOW,
+            pool_timeout= CONFIG.DB_POOL_TIMEOUT,
+            pool_recycle= CONFIG.DB_POOL_RECYCLE,
+            pool_pre_ping= CONFIG.DB_POOL_PRE_PING,
+        )
+
+        return engine
+
+    def _watch_engine(
+        self,
+        engine: Engine,
+    ) -> PoolTelemetry:
+
+        # Inicialización de telemetría del grupo de conexiones
+        telemetry = PoolTelemetry()
+
+        # Inicialización de función de registro de desbordamiento al abrir conexiones nuevas
+        def on_connect(*_) -> None:
+            # Si la conexión nueva excede el tamaño del grupo...
+            if engine.pool.overflow() > 0:
+                # Registro del evento de desbordamiento
+                telemetry.record_overflow()
+
+        # Suscripción al evento de conexión
+        event.listen(engine, 'connect', on_connect)
+
+        return telemetry
+
+    def _snapshot(
+        self,
+        engine: Engine,
+        telemetry: PoolTelemetry,
+    ) -> PoolStats:
+
+        # Obtención del grupo de conexiones
+        pool = engine.pool
+
+        # Construcción de la instantánea del grupo
+        stats = telemetry.snapshot(
+            size= pool.size(),
+            max_overflow= CONFIG.DB_POOL_MAX_OVERFLOW,
+            checked_out= pool.checkedout(),
+            overflow= max(pool.overflow(), 0),
+        )
+
+        return stats
+
     def _build_url(
         self,
     ) -> str:
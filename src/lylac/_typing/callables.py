@@ -1,3 +1,5 @@
+from datetime import date
+from datetime import datetime
 from typing import Any
 from typing import Callable
 from typing import Optional
@@ -21,6 +23,7 @@ if TYPE_CHECKING:
     from .._contexts import TransactionContext
     from .._orchestrator import CRUD
     from .._resources import ModelColumnBasicAtts
+    from .structures import CriteriaStructure
 
 ExecutionCallback = Callable[[Connection], _T]
 
@@ -64,3 +67,10 @@ ExecutableTransactionCallback = Callable[['TransactionContext[_M]'], None]
 LazyResolver = Callable[['ExecutionContext[_M]'], Any]
 
 PolicyCallback = Callable[['PoliciesContext[_M]'], None]
+
+CompiledRecordRule = Callable[[int, datetime, date, Any], 'CriteriaStructure']
+"""
+### Regla de registro compilada
+Función que evalúa el texto de una regla de registro ya compilado con las
+variables `uid`, `now`, `today` y `user` para obtener su criterio de búsqueda.
+"""
@@ -1,3 +1,4 @@
+from typing import Any
 from typing import Callable
 from typing import Union
 from typing import TYPE_CHECKING
@@ -32,3 +33,5 @@ FunctionDecorator = Callable[[_F], _F]
 _Record = Union['_BasicRecord', _A]
 
 _Records = list[_Record[_A]]
+
+_Columns = dict[str, Any]
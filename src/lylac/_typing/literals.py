@@ -65,6 +65,13 @@ Nombres de funciones de agregación para utilizar en cómputos de campo de tipo
 `one2many` y `many2many`.
 """
 
+OutputMode = Literal['records', 'columns']
+"""
+### Modo de salida
+Formato de los datos retornados por `search_read`: una lista de diccionarios
+por registro o un mapa de nombre de campo a columna.
+"""
+
 ComparisonOperator = Literal[
     '=',
     '!=',
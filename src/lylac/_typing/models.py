@@ -28,6 +28,6 @@ class _base_users__fields(RecordShape):
     password: TType.Char
 
 class _found_session(RecordShape):
-    is_active_session: TType.Boolean
+    expires_at: TType.Datetime
     user_is_active: TType.Boolean
     uid: TType.Integer
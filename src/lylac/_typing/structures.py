@@ -373,4 +373,19 @@ Los operadores de comparación disponibles son:
 - `'~*'`: Coincide con expresión regular (no sensible a mayúsculas y minúsculas)
 """
 
+CriteriaShape = tuple[ MaybeNone[LogicOperator], ... ]
+"""
+### Forma de criterio de búsqueda
+Criterio de búsqueda con cada tripleta reemplazada por `None`, usado como
+llave de los planes compilados.
+"""
+
+CriteriaPlan = Union[int, tuple[LogicOperator, tuple['CriteriaPlan', ...]]]
+"""
+### Plan de criterio de búsqueda
+Árbol compilado de un criterio de búsqueda. Las hojas son el índice de la
+tripleta en el criterio y los nodos contienen un operador lógico con todos
+sus operandos.
+"""
+
 RawFieldProperties = tuple[str, TTypeName, bool, ModelName[_M], str]
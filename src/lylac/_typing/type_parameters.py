@@ -1,5 +1,6 @@
 from typing import Any
 from typing import Callable
+from typing import Hashable
 from typing import TypeVar
 from typing import TYPE_CHECKING
 
@@ -11,6 +12,7 @@ if TYPE_CHECKING:
     from .definitions import Template
 
 _T = TypeVar('_T')
+_K = TypeVar('_K', bound= Hashable)
 _M = TypeVar('_M', bound= str)
 _F = TypeVar('_F', bound= Callable)
 _V = TypeVar('_V', bound= tuple[Any, ...])
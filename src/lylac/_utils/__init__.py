@@ -1,4 +1,7 @@
 from ._build_many2many_relation_name import build_many2many_relation_name
 from ._get_table_name import get_table_name
 from ._to_list import to_list
+from ._compile_domain_rule import compile_record_rule
 from ._compile_domain_rule import parse_record_rule
+from ._keyset_cursor import decode_cursor
+from ._keyset_cursor import encode_cursor
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from .._typing.callables import CompiledRecordRule
 from .._typing.structures import CriteriaStructure
 from .._typing.definitions import JSONLike
 from datetime import datetime
@@ -7,30 +8,51 @@ from datetime import date
 if TYPE_CHECKING:
     from .._contexts import ExecutionContext
 
-_ACCESS = ''
+def compile_record_rule(
+    json_record_rule: JSONLike,
+) -> CompiledRecordRule:
+
+    # Compilación única del texto de la regla de registro sin espacios circundantes
+    code = compile(json_record_rule.strip(), '<record_rule>', 'eval')
+
+    # Inicialización de función de evaluación de la regla compilada
+    def evaluate(
+        uid: int,
+        now: datetime,
+        today: date,
+        user: object,
+    ) -> CriteriaStructure:
+
+        # Evaluación del código compilado con las variables del usuario
+        criteria_structure_rule = eval(
+            code,
+            {
+                '__builtins__': {},
+                'uid': uid,
+                'now': now,
+                'today': today,
+                'user': user,
+            },
+        )
+
+        return criteria_structure_rule
+
+    return evaluate
 
 def parse_record_rule(
     execution_ctx: 'ExecutionContext',
     json_record_rule: JSONLike,
 ) -> CriteriaStructure:
 
-    # Inicialización de diccionario de acceso
-    _closure = {}
-
-    # Ejecución de código para compilar la regla de registro
-    exec(
-        f"_closure['{_ACCESS}'] = {json_record_rule}",
-        globals= {'__builtins__': {}},
-        locals= {
-            '_closure': _closure,
-            'uid': execution_ctx.uid,
-            'now': datetime.now(),
-            'today': date.today(),
-            'user': execution_ctx._env,
-        },
-    )
+    # Compilación de la regla de registro
+    evaluate = compile_record_rule(json_record_rule)
 
-    # Obtención de la registro compilada
-    criteria_structure_rule = _closure[_ACCESS]
+    # Obtención de la regla de registro evaluada
+    criteria_structure_rule = evaluate(
+        execution_ctx.uid,
+        datetime.now(),
+        date.today(),
+        execution_ctx._env,
+    )
 
     return criteria_structure_rule
@@ -0,0 +1,94 @@
+import json
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
+from binascii import Error as DecodingError
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from decimal import Decimal
+from decimal import InvalidOperation
+from typing import Any
+from typing import Callable
+from ..errors import InvalidCursorError
+
+_TYPE_TAG = '$t'
+_VALUE_TAG = 'v'
+
+# Codificadores de valores sin equivalente en JSON por etiqueta de tipo (datetime antes que date por ser subclase)
+_encoders: dict[str, tuple[type, Callable[[Any], Any]]] = {
+    'datetime': ( datetime, lambda value: value.isoformat() ),
+    'date': ( date, lambda value: value.isoformat() ),
+    'time': ( time, lambda value: value.isoformat() ),
+    'timedelta': ( timedelta, lambda value: value.total_seconds() ),
+    'decimal': ( Decimal, str ),
+}
+
+# Decodificadores de valores por etiqueta de tipo
+_decoders: dict[str, Callable[[Any], Any]] = {
+    'datetime': datetime.fromisoformat,
+    'date': date.fromisoformat,
+    'time': time.fromisoformat,
+    'timedelta': lambda value: timedelta(seconds= value),
+    'decimal': Decimal,
+}
+
+def encode_cursor(
+    values: list[Any],
+) -> str:
+
+    # Serialización de los valores de ordenamiento del último registro conservando su tipo
+    payload = json.dumps(values, default= _encode_value, separators= (',', ':'))
+    # Codificación del texto en base64 seguro para URL sin relleno
+    token = urlsafe_b64encode( payload.encode() ).decode().rstrip('=')
+
+    return token
+
+def decode_cursor(
+    token: str,
+) -> list[Any]:
+
+    # Se intenta decodificar el texto
+    try:
+        # Decodificación del texto restaurando el relleno
+        payload = urlsafe_b64decode(token + '=' * ( -len(token) % 4 ))
+        # Deserialización de los valores de ordenamiento restaurando su tipo
+        values = json.loads(payload, object_hook= _decode_value)
+    # Si el texto no es un cursor válido...
+    except ( DecodingError, ValueError, TypeError, KeyError, InvalidOperation ):
+        # Se arroja error
+        raise InvalidCursorError(f'El cursor [{token}] no es válido')
+
+    # Si los valores no son una lista...
+    if not isinstance(values, list):
+        # Se arroja error
+        raise InvalidCursorError(f'El cursor [{token}] no es válido')
+
+    return values
+
+def _encode_value(
+    value: Any,
+) -> Any:
+
+    # Iteración por cada codificador de tipo
+    for ( type_name, ( value_type, encode ) ) in _encoders.items():
+        # Si el valor es del tipo...
+        if isinstance(value, value_type):
+            # Se etiqueta el valor con su tipo
+            return { _TYPE_TAG: type_name, _VALUE_TAG: encode(value) }
+
+    # Cualquier otro valor se serializa como texto
+    return str(value)
+
+def _decode_value(
+    obj: dict[str, Any],
+) -> Any:
+
+    # Si el objeto no es un valor etiquetado se conserva tal cual
+    if _TYPE_TAG not in obj:
+        return obj
+
+    # Restauración del valor con su tipo
+    value = _decoders[ obj[_TYPE_TAG] ]( obj[_VALUE_TAG] )
+
+    return value
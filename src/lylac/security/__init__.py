@@ -1,3 +1,8 @@
 from .auth import default_password
 from .auth import verify_password
+from .auth import verify_password_async
+from .auth import verify_password_in_pool
 from .auth import hash_password
+from .tokens import is_session_token
+from .tokens import issue_session_token
+from .tokens import read_session_token
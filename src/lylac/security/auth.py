@@ -1,6 +1,14 @@
+from asyncio import wrap_future
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from passlib.context import CryptContext
+from ..settings import CONFIG
 
 _pwd_context = CryptContext(schemes= ['bcrypt_sha256'], deprecated= 'auto')
+_pwd_pool: Executor | None = None
+_pwd_pool_lock = Lock()
 
 def hash_password(raw_pwd: str) -> str:
     """
@@ -28,3 +36,53 @@ def verify_password(
     is_correct = _pwd_context.verify(input_password, hashed_password)
 
     return is_correct
+
+def verify_password_in_pool(
+    input_password: str,
+    hashed_password: str,
+) -> bool:
+    """
+    Verificación de contraseña en el grupo de trabajadores configurado para
+    no serializar en el hilo de la petición el cómputo del hash.
+    """
+
+    # Envío de la verificación al grupo de trabajadores
+    future = _get_password_pool().submit(verify_password, input_password, hashed_password)
+    # Obtención del resultado de la verificación
+    is_correct = future.result()
+
+    return is_correct
+
+async def verify_password_async(
+    input_password: str,
+    hashed_password: str,
+) -> bool:
+    """
+    Verificación de contraseña en el grupo de trabajadores configurado sin
+    bloquear el ciclo de eventos.
+    """
+
+    # Envío de la verificación al grupo de trabajadores
+    future = _get_password_pool().submit(verify_password, input_password, hashed_password)
+    # Espera del resultado de la verificación
+    is_correct = await wrap_future(future)
+
+    return is_correct
+
+def _get_password_pool() -> Executor:
+
+    global _pwd_pool
+
+    with _pwd_pool_lock:
+        # Si el grupo de trabajadores aún no ha sido inicializado...
+        if _pwd_pool is None:
+            # Si el grupo configurado es de procesos...
+            if CONFIG.PASSWORD_POOL_KIND == 'process':
+                # Inicialización de grupo de procesos
+                _pwd_pool = ProcessPoolExecutor(max_workers= CONFIG.PASSWORD_POOL_SIZE)
+            # Si el grupo configurado es de hilos...
+            else:
+                # Inicialización de grupo de hilos
+                _pwd_pool = ThreadPoolExecutor(max_workers= CONFIG.PASSWORD_POOL_SIZE, thread_name_prefix= 'lylac-password')
+
+    return _pwd_pool
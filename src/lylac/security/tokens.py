@@ -0,0 +1,73 @@
+from base64 import urlsafe_b64encode
+from datetime import datetime
+from hashlib import sha256
+from hmac import compare_digest
+from hmac import new as new_hmac
+
+_TOKEN_PREFIX = 'v1'
+
+def issue_session_token(
+    uid: int,
+    session_uuid: str,
+    expires_at: datetime,
+    secret: str,
+) -> str:
+    """
+    Emisión de token de sesión firmado con HMAC que contiene la ID de usuario,
+    la fecha de expiración y la UUID de la sesión.
+    """
+
+    # Construcción de la carga del token
+    payload = f'{_TOKEN_PREFIX}.{uid}.{int( expires_at.timestamp() )}.{session_uuid}'
+    # Firma de la carga
+    signature = _sign(payload, secret)
+
+    # Construcción del token
+    token = f'{payload}.{signature}'
+
+    return token
+
+def read_session_token(
+    token: str,
+    secret: str,
+) -> tuple[int, str, datetime] | None:
+    """
+    Lectura de token de sesión. Retorna la ID de usuario, la UUID de la sesión
+    y la fecha de expiración, o `None` si el token no es válido.
+    """
+
+    # Separación de la carga y la firma
+    ( payload, _, signature ) = token.rpartition('.')
+
+    # Si la firma no corresponde a la carga (se comparan bytes para admitir cualquier carácter)...
+    if not payload or not compare_digest(signature.encode(), _sign(payload, secret).encode()):
+        return None
+
+    # Se intenta obtener los valores de la carga
+    try:
+        ( _, uid, expires_at, session_uuid ) = payload.split('.')
+        claims = ( int(uid), session_uuid, datetime.fromtimestamp( int(expires_at) ) )
+    # Si la carga no tiene el formato esperado...
+    except ( ValueError, OverflowError, OSError ):
+        return None
+
+    return claims
+
+def is_session_token(
+    value: str,
+) -> bool:
+
+    # Los tokens de sesión se distinguen por su prefijo de versión
+    return value.startswith(f'{_TOKEN_PREFIX}.')
+
+def _sign(
+    payload: str,
+    secret: str,
+) -> str:
+
+    # Cálculo del código de autenticación del mensaje
+    digest = new_hmac(secret.encode(), payload.encode(), sha256).digest()
+    # Codificación sin relleno
+    signature = urlsafe_b64encode(digest).rstrip(b'=').decode()
+
+    return signature
@@ -1,3 +1,4 @@
+from os import cpu_count
 from urllib.parse import quote
 from .._core.env import env_
 
@@ -6,6 +7,27 @@ class CONFIG:
     ROOT_USER_LOGIN = env_.variable('ROOT_USER_LOGIN')
     ADMIN_USER_NAME = env_.variable('ADMIN_USER_NAME')
     ADMIN_USER_LOGIN = env_.variable('ADMIN_USER_LOGIN')
+    ACCESS_CACHE_SIZE = env_.variable('ACCESS_CACHE_SIZE', int, 4096)
+    RECORD_RULES_CACHE_SIZE = env_.variable('RECORD_RULES_CACHE_SIZE', int, 4096)
+    CRITERIA_PLAN_CACHE_SIZE = env_.variable('CRITERIA_PLAN_CACHE_SIZE', int, 1024)
+    SESSION_CACHE_SIZE = env_.variable('SESSION_CACHE_SIZE', int, 4096)
+    SESSION_CACHE_TTL = env_.variable('SESSION_CACHE_TTL', int, 300)
+    SESSION_VALIDITY_DAYS = env_.variable('SESSION_VALIDITY_DAYS', int, 30)
+    SESSION_TOKEN_SECRET = env_.variable('SESSION_TOKEN_SECRET', str, None)
+    PASSWORD_POOL_KIND = env_.variable('PASSWORD_POOL_KIND', str, 'thread')
+    PASSWORD_POOL_SIZE = env_.variable('PASSWORD_POOL_SIZE', int, cpu_count() or 1)
+    DB_POOL_SIZE = env_.variable('DB_POOL_SIZE', int, 5)
+    DB_POOL_MAX_OVERFLOW = env_.variable('DB_POOL_MAX_OVERFLOW', int, 10)
+    DB_POOL_TIMEOUT = env_.variable('DB_POOL_TIMEOUT', float, 30.0)
+    DB_POOL_RECYCLE = env_.variable('DB_POOL_RECYCLE', int, -1)
+    DB_POOL_PRE_PING = env_.variable('DB_POOL_PRE_PING', lambda v: v in {'1', 'true', 'True', 'TRUE'}, False)
+    DB_REPLICA_URLS = env_.variable('DB_REPLICA_URLS', lambda v: [ url.strip() for url in v.split(',') if url.strip() ], [])
+    DB_REPLICA_BALANCING = env_.variable('DB_REPLICA_BALANCING', str, 'round_robin')
+    READ_YOUR_WRITES_WINDOW = env_.variable('READ_YOUR_WRITES_WINDOW', float, 5.0)
+    INSERT_BATCH_SIZE = env_.variable('INSERT_BATCH_SIZE', int, 1000)
+    UPDATE_BATCH_SIZE = env_.variable('UPDATE_BATCH_SIZE', int, 1000)
+    BULK_LOAD_CHUNK_SIZE = env_.variable('BULK_LOAD_CHUNK_SIZE', int, 10000)
+    STREAM_CHUNK_SIZE = env_.variable('STREAM_CHUNK_SIZE', int, 1000)
 
 class CREDENTIALS:
     HOST = env_.variable('HOST')